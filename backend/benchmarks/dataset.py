@@ -0,0 +1,387 @@
+"""Deterministic synthetic dataset for the benchmarks.
+
+Row counts grow with the number of students: one contract and enrolment per
+student (plus a second course for every fifth student), a class per session
+of each course, an attendance row per enrolled student and class, and four
+evaluations per enrolment. ``generate_data.load`` writes the rows through
+the connection directly, bypassing the ORM session and its change-tracking
+listeners.
+"""
+import datetime
+import itertools
+import random
+
+from app.models import (
+    Account, Class, Contract, Course, CourseSchedule, Employee, Enrolment, Evaluation, Issue,
+    LeaveRequest, MakeupClass, Room, StaffCheckin, Student, StudentAttendance
+)
+from extensions import pwd_context
+
+# Course names accepted by the course routes and the id each one is stored under
+COURSE_IDS = {
+    "CEFR A1": "ENG001", "CEFR A2": "ENG002", "CEFR B1": "ENG003",
+    "CEFR B2": "ENG004", "CEFR C1": "ENG005", "CEFR C2": "ENG006",
+    "IELTS Foundation": "ENG101", "IELTS Pre-Intermediate": "ENG102", "IELTS Intermediate": "ENG103",
+    "IELTS Upper-Intermediate": "ENG104", "IELTS Advanced": "ENG105",
+    "TOEIC Foundation": "ENG201", "TOEIC Pre-Intermediate": "ENG202", "TOEIC Intermediate": "ENG203",
+    "TOEIC Upper-Intermediate": "ENG204", "TOEIC Advanced": "ENG205",
+    "6th Grade Math": "MTH001", "7th Grade Math": "MTH002", "8th Grade Math": "MTH003", "9th Grade Math": "MTH004",
+    "10th Grade Math": "MTH101", "11th Grade Math": "MTH102", "12th Grade Math": "MTH103"
+}
+COURSE_NAMES = tuple(COURSE_IDS)
+SCHEDULES = ("Mon - Wed, 18:00 - 19:30", "Tue - Thu, 18:00 - 19:30", "Sat - Sun, 09:00 - 10:30", "Mon - Fri, 19:45 - 21:15")
+ASSESSMENTS = ("Quiz 1", "Quiz 2", "Writing Project 1", "Reading Assessment 1")
+GRADES = ("A", "B", "C", "D", "F")
+BASE_DATE = datetime.date(2024, 1, 1)
+PASSWORD = "benchmark"
+
+def dataset_size(students, sessions_per_term=6):
+    """Return the number of parents each dependent table is generated from."""
+    return {
+        "students": students,
+        "teachers": max(8, students // 40),
+        "advisors": max(3, students // 400),
+        "managers": 2,
+        "rooms": max(10, students // 100),
+        "courses": max(6, students // 50),
+        "sessions_per_term": sessions_per_term
+    }
+
+class Dataset:
+    """Generate rows for every table from a size and a seed.
+
+    Each ``*_rows`` method is a generator, so even the multi-million row
+    attendance table is never held in memory. ``sample`` holds keys of rows
+    that are guaranteed to exist, for building request parameters.
+    """
+
+    def __init__(self, students, sessions_per_term=6, seed=0):
+        self.size = dataset_size(students, sessions_per_term)
+        self.seed = seed
+
+        size = self.size
+        self.teacher_ids = [f"EM{i:05}" for i in range(1, size["teachers"] + 1)]
+        self.advisor_ids = [f"EM{i:05}" for i in range(size["teachers"] + 1, size["teachers"] + size["advisors"] + 1)]
+        self.manager_ids = [
+            f"EM{i:05}"
+            for i in range(size["teachers"] + size["advisors"] + 1, size["teachers"] + size["advisors"] + size["managers"] + 1)
+        ]
+        self.room_ids = [f"ROOM{i:05}" for i in range(1, size["rooms"] + 1)]
+        self.courses = [self._course(i) for i in range(size["courses"])]
+
+        first_course = self.courses[0]
+        self.sample = {
+            "teacher_id": self._course_teacher(0, 1),
+            "advisor_id": first_course["learning_advisor_id"],
+            "manager_id": self.manager_ids[0],
+            "student_id": self.student_id(0),
+            "contract_id": self.contract_id(0),
+            "room_id": self.room_ids[0],
+            "course_id": first_course["id"],
+            "course_date": first_course["created_date"].isoformat(),
+            "class_id": self.class_id(1),
+            "term": 1,
+            "class_date": self._class_date(first_course, 1, 1).date().isoformat()
+        }
+
+    @staticmethod
+    def student_id(index):
+        return f"STU{index:07}"
+
+    @staticmethod
+    def contract_id(index):
+        return f"CON{index:07}"
+
+    @staticmethod
+    def enrolment_id(index):
+        return f"ENR{index:07}"
+
+    @staticmethod
+    def class_id(session):
+        return f"CLS{session:03}"
+
+    def _rng(self, table):
+        return random.Random(f"{self.seed}:{table}")
+
+    def _course(self, index):
+        name = COURSE_NAMES[index % len(COURSE_NAMES)]
+        # Reusing the per-name id across creation dates exercises the (id, created_date) key
+        created_date = BASE_DATE + datetime.timedelta(days=index // len(COURSE_NAMES))
+        schedule = SCHEDULES[index % len(SCHEDULES)]
+        # Rows bypass the ORM, so the parsed schedule columns are filled here
+        parsed = CourseSchedule.parse(schedule)
+
+        return {
+            "id": COURSE_IDS[name],
+            "name": name,
+            "description": f"{name} cohort {index // len(COURSE_NAMES) + 1}",
+            "duration": 3 if index % 2 else 6,
+            "start_date": created_date + datetime.timedelta(days=14),
+            "schedule": schedule,
+            "schedule_weekdays": parsed.weekday_mask,
+            "schedule_start": parsed.start,
+            "schedule_end": parsed.end,
+            "learning_advisor_id": self.advisor_ids[index % len(self.advisor_ids)],
+            "fee": 3_000_000 + (index % 6) * 500_000,
+            "prerequisites": "None",
+            "created_date": created_date
+        }
+
+    def _course_teacher(self, course_index, term):
+        return self.teacher_ids[(course_index * 2 + term - 1) % len(self.teacher_ids)]
+
+    def _course_room(self, course_index, term):
+        return self.room_ids[(course_index + term - 1) % len(self.room_ids)]
+
+    def _class_date(self, course, term, session):
+        week = (term - 1) * self.size["sessions_per_term"] + session - 1
+        return datetime.datetime.combine(
+            course["start_date"] + datetime.timedelta(weeks=week),
+            datetime.time(18, 0)
+        )
+
+    def enrolments(self):
+        """Yield (enrolment index, student index, course index) for every enrolment."""
+        courses = len(self.courses)
+        index = 0
+        for student in range(self.size["students"]):
+            yield index, student, student % courses
+            index += 1
+            if student % 5 == 0 and courses > 1:
+                yield index, student, (student + 1) % courses
+                index += 1
+
+    def course_student_ids(self, course_index):
+        """Return the ids of the students enrolled in a course."""
+        return [self.student_id(student) for _, student, course in self.enrolments() if course == course_index]
+
+    def students_outside_course(self, course_index, count):
+        """Return up to ``count`` ids of students with no contract for a course."""
+        enrolled = {student for _, student, course in self.enrolments() if course == course_index}
+        outside = (student for student in range(self.size["students"]) if student not in enrolled)
+        return [self.student_id(student) for student in itertools.islice(outside, count)]
+
+    def employee_rows(self):
+        rows = [
+            (employee_id, "Teacher", "Available" if i % 10 else "Unavailable")
+            for i, employee_id in enumerate(self.teacher_ids)
+        ]
+        rows += [(employee_id, "Learning Advisor", None) for employee_id in self.advisor_ids]
+        rows += [(employee_id, "Manager", None) for employee_id in self.manager_ids]
+
+        for i, (employee_id, role, teacher_status) in enumerate(rows):
+            yield {
+                "id": employee_id,
+                "full_name": f"{role} {i + 1}",
+                "email": f"{employee_id.lower()}@bench.example.com",
+                "phone_number": f"08{i:08}",
+                "nickname": f"{role.split()[0]}{i + 1}",
+                "philosophy": "Steady progress every lesson",
+                "achievements": "Benchmark fixture",
+                "role": role,
+                "teacher_status": teacher_status
+            }
+
+    def account_rows(self):
+        # One hash for every account; pbkdf2 per row would dominate the seed time
+        password_hash = pwd_context.hash(PASSWORD)
+        for i, employee_id in enumerate(self.teacher_ids + self.advisor_ids + self.manager_ids):
+            yield {
+                "id": f"ACC{i + 1:05}",
+                "employee_id": employee_id,
+                "username": employee_id.lower(),
+                "password_hash": password_hash,
+                "created_date": BASE_DATE
+            }
+
+    def room_rows(self):
+        for i, room_id in enumerate(self.room_ids):
+            yield {
+                "id": room_id,
+                "name": f"Room {i + 1}",
+                "status": "Maintenance" if i % 25 == 24 else "Free"
+            }
+
+    def student_rows(self):
+        rng = self._rng("student")
+        for i in range(self.size["students"]):
+            yield {
+                "id": self.student_id(i),
+                "fullname": f"Student {i}",
+                "date_of_birth": datetime.date(2004, 1, 1) + datetime.timedelta(days=rng.randrange(4000)),
+                "contact_info": f"student_phone:09{i:08}",
+                "created_date": BASE_DATE + datetime.timedelta(days=i % 365)
+            }
+
+    def course_rows(self):
+        yield from self.courses
+
+    def contract_rows(self):
+        rng = self._rng("contract")
+        for index, student, course_index in self.enrolments():
+            course = self.courses[course_index]
+            yield {
+                "id": self.contract_id(index),
+                "student_id": self.student_id(student),
+                "employee_id": course["learning_advisor_id"],
+                "course_id": course["id"],
+                "course_date": course["created_date"],
+                "tuition_fee": course["fee"],
+                "payment_status": "Paid" if rng.random() < 0.7 else "In Progress",
+                "start_date": course["start_date"],
+                "end_date": course["start_date"] + datetime.timedelta(days=30 * course["duration"])
+            }
+
+    def enrolment_rows(self):
+        for index, student, course_index in self.enrolments():
+            course = self.courses[course_index]
+            yield {
+                "id": self.enrolment_id(index),
+                "contract_id": self.contract_id(index),
+                "student_id": self.student_id(student),
+                "course_id": course["id"],
+                "course_date": course["created_date"],
+                "enrolment_date": course["created_date"] + datetime.timedelta(days=index % 14)
+            }
+
+    def class_keys(self, course_index):
+        """Yield (class id, term, session) for every class of a course."""
+        sessions = self.size["sessions_per_term"]
+        for term in (1, 2):
+            for session in range(1, sessions + 1):
+                yield self.class_id((term - 1) * sessions + session), term, session
+
+    def class_rows(self):
+        for course_index, course in enumerate(self.courses):
+            for class_id, term, session in self.class_keys(course_index):
+                yield {
+                    "id": class_id,
+                    "course_id": course["id"],
+                    "course_date": course["created_date"],
+                    "term": term,
+                    "teacher_id": self._course_teacher(course_index, term),
+                    "room_id": self._course_room(course_index, term),
+                    "class_date": self._class_date(course, term, session)
+                }
+
+    def student_attendance_rows(self):
+        rng = self._rng("student_attendance")
+        for index, student, course_index in self.enrolments():
+            course = self.courses[course_index]
+            for class_id, term, _ in self.class_keys(course_index):
+                roll = rng.random()
+                yield {
+                    "student_id": self.student_id(student),
+                    "class_id": class_id,
+                    "course_id": course["id"],
+                    "course_date": course["created_date"],
+                    "term": term,
+                    "enrolment_id": self.enrolment_id(index),
+                    "status": "Present" if roll < 0.8 else "Absent" if roll < 0.92 else "Unknown"
+                }
+
+    def evaluation_rows(self):
+        rng = self._rng("evaluation")
+        for index, student, course_index in self.enrolments():
+            course = self.courses[course_index]
+            for i, assessment_type in enumerate(ASSESSMENTS):
+                yield {
+                    "student_id": self.student_id(student),
+                    "course_id": course["id"],
+                    "course_date": course["created_date"],
+                    "assessment_type": assessment_type,
+                    "teacher_id": self._course_teacher(course_index, 1 if i < 2 else 2),
+                    "grade": rng.choice(GRADES),
+                    "comment": "Generated for benchmarking",
+                    "enrolment_id": self.enrolment_id(index),
+                    "evaluation_date": course["start_date"] + datetime.timedelta(weeks=3 * (i + 1))
+                }
+
+    def staff_checkin_rows(self, days=10):
+        rng = self._rng("staff_checkin")
+        index = 0
+        for employee_id in self.teacher_ids + self.advisor_ids:
+            for day in range(days):
+                checkin_time = datetime.datetime.combine(
+                    BASE_DATE + datetime.timedelta(days=day),
+                    datetime.time(8, rng.randrange(0, 30))
+                )
+                index += 1
+                yield {
+                    "id": f"STC{index:07}",
+                    "employee_id": employee_id,
+                    "checkin_time": checkin_time,
+                    "checkout_time": checkin_time + datetime.timedelta(hours=8),
+                    "status": "Late" if checkin_time.minute > 15 else "Checked In"
+                }
+
+    def leave_request_rows(self):
+        for i, employee_id in enumerate(self.teacher_ids):
+            start_date = BASE_DATE + datetime.timedelta(days=30 + i % 300)
+            yield {
+                "id": f"LR{i + 1:06}",
+                "employee_id": employee_id,
+                "substitute_id": self.teacher_ids[(i + 1) % len(self.teacher_ids)],
+                "start_date": start_date,
+                "end_date": start_date + datetime.timedelta(days=2),
+                "reason": "Personal leave",
+                "status": ("Pending", "Approved", "Not Approved")[i % 3],
+                "created_date": start_date - datetime.timedelta(days=7)
+            }
+
+    def issue_rows(self):
+        for i in range(max(10, self.size["students"] // 100)):
+            behaviour = i % 2 == 0
+            yield {
+                "id": f"ISS{i + 1:07}",
+                "teacher_id": self.teacher_ids[i % len(self.teacher_ids)],
+                "student_id": self.student_id(i % self.size["students"]) if behaviour else None,
+                "room_id": None if behaviour else self.room_ids[i % len(self.room_ids)],
+                "issue_type": "Student Behavior" if behaviour else "Technical",
+                "issue_description": "Generated for benchmarking",
+                "status": "Done" if i % 3 == 0 else "In Progress",
+                "reported_date": BASE_DATE + datetime.timedelta(days=i % 365)
+            }
+
+    def makeup_class_rows(self):
+        for index, student, course_index in self.enrolments():
+            if index % 50:
+                continue
+            course = self.courses[course_index]
+            class_id, term, _ = next(self.class_keys(course_index))
+            yield {
+                "id": f"MC{index // 50 + 1:06}",
+                "student_id": self.student_id(student),
+                "class_id": class_id,
+                "course_id": course["id"],
+                "course_date": course["created_date"],
+                "term": term,
+                "teacher_id": self._course_teacher(course_index, 2),
+                "room_id": self._course_room(course_index, 2),
+                "class_date": datetime.datetime.combine(course["start_date"] + datetime.timedelta(days=12), datetime.time(9, 0)),
+                "created_date": course["start_date"] + datetime.timedelta(days=10)
+            }
+
+    def tables(self):
+        """Return (model, row generator) pairs in foreign key order."""
+        return [
+            (Employee, self.employee_rows()),
+            (Account, self.account_rows()),
+            (Room, self.room_rows()),
+            (Student, self.student_rows()),
+            (Course, self.course_rows()),
+            (Contract, self.contract_rows()),
+            (Enrolment, self.enrolment_rows()),
+            (Class, self.class_rows()),
+            (StudentAttendance, self.student_attendance_rows()),
+            (Evaluation, self.evaluation_rows()),
+            (StaffCheckin, self.staff_checkin_rows()),
+            (LeaveRequest, self.leave_request_rows()),
+            (Issue, self.issue_rows()),
+            (MakeupClass, self.makeup_class_rows())
+        ]
+
+def chunked(rows, size):
+    iterator = iter(rows)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,128 @@
+"""Compare Flask's default JSON provider with ORJSONProvider.
+
+Encodes payloads shaped like the ``/student/``, ``/course/manager/`` and
+``/evaluation/by-class`` responses and reports encode time and peak memory.
+
+Run from ``backend/``:
+
+    python benchmarks/json_bench.py --rows 10000
+"""
+import argparse
+import datetime
+import decimal
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from app.json_provider import ORJSONProvider
+
+def student_payload(count):
+    return [
+        {
+            "id": f"STU{i:05}",
+            "fullname": f"Nguyễn Văn {i}",
+            "contact_info": f"09{i:08}",
+            "date_of_birth": (datetime.date(2010, 1, 1) + datetime.timedelta(days=i % 3000)).isoformat()
+        }
+        for i in range(count)
+    ]
+
+def course_payload(count):
+    return [
+        {
+            "id": f"ENG{i % 300:03}",
+            "name": "IELTS Intermediate",
+            "duration": 6,
+            "start_date": "2025-02-01",
+            "schedule": "Mon - Wed, 18:00 - 19:30",
+            "fee": 4500000,
+            "prerequisites": "IELTS Foundation",
+            "created_date": "2025-01-15",
+            "description": None
+        }
+        for i in range(count)
+    ]
+
+def evaluation_payload(count):
+    return {
+        "message": "Class students with evaluations retrieved successfully",
+        "data": [
+            {
+                "student": {
+                    "id": f"STU{i:05}",
+                    "fullname": f"Student {i}",
+                    "contact_info": f"09{i:08}",
+                    "date_of_birth": "2011-05-04"
+                },
+                "evaluations": [
+                    {
+                        "student_id": f"STU{i:05}",
+                        "course_id": "ENG101",
+                        "course_date": "2025-01-15",
+                        "assessment_type": f"Quiz {quiz}",
+                        "teacher_id": "EM001",
+                        "grade": "A",
+                        "comment": "Good progress in reading and writing",
+                        "enrolment_id": f"ENR{i:05}",
+                        "evaluation_date": "2025-03-01"
+                    }
+                    for quiz in range(1, 5)
+                ]
+            }
+            for i in range(count // 4)
+        ]
+    }
+
+def native_payload(count):
+    return [
+        {
+            "created": datetime.datetime(2025, 1, 1, 9, 30) + datetime.timedelta(minutes=i),
+            "date": datetime.date(2025, 1, 1),
+            "amount": decimal.Decimal("4500000.50")
+        }
+        for i in range(count)
+    ]
+
+def measure(encode, repeat):
+    best = min(timeit.repeat(encode, number=1, repeat=repeat))
+    
+    tracemalloc.start()
+    encode()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return best, peak
+
+def run(name, payload, providers, repeat):
+    app = providers[0][1]._app
+    with app.app_context():
+        outputs = [json.loads(provider.response(payload).get_data()) for _, provider in providers]
+        assert all(output == outputs[0] for output in outputs), f"{name}: output differs"
+        
+        for provider_name, provider in providers:
+            best, peak = measure(lambda: provider.response(payload), repeat)
+            print(f"{name:<12} {provider_name:<8} {best * 1000:9.2f} ms   peak {peak / 1024 / 1024:7.2f} MiB")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    app = Flask(__name__)
+    providers = [("default", DefaultJSONProvider(app)), ("orjson", ORJSONProvider(app))]
+    
+    print(f"{args.rows} rows, best of {args.repeat}")
+    run("student", student_payload(args.rows), providers, args.repeat)
+    run("course", course_payload(args.rows), providers, args.repeat)
+    run("evaluation", evaluation_payload(args.rows), providers, args.repeat)
+    run("native", native_payload(args.rows), providers, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare marshmallow ``dump(many=True)`` with RowSerializer on large payloads.
+
+Run from ``backend/``:
+
+    python benchmarks/serializer_bench.py --rows 10000
+"""
+import argparse
+import datetime
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.models import Evaluation, Student
+from app.schemas.evaluation_schema import evaluation_schema, evaluation_row_serializer
+from app.schemas.learning_advisor.student_schema import student_schema, student_row_serializer
+
+def build_students(count):
+    objects = [
+        Student(
+            id=f"STU{i:05}",
+            fullname=f"Student {i}",
+            contact_info=f"09{i:08}",
+            date_of_birth=datetime.date(2010, 1, 1) + datetime.timedelta(days=i % 3000)
+        )
+        for i in range(count)
+    ]
+    rows = [tuple(getattr(obj, attr) for attr in student_row_serializer.attributes) for obj in objects]
+    
+    return objects, rows
+
+def build_evaluations(count):
+    objects = [
+        Evaluation(
+            student_id=f"STU{i:05}",
+            course_id="ENG101",
+            course_date=datetime.date(2025, 1, 1),
+            assessment_type="Quiz 1",
+            teacher_id="EM001",
+            grade="A",
+            comment="Good progress in reading and writing",
+            enrolment_id=f"ENR{i:05}",
+            evaluation_date=datetime.date(2025, 3, 1)
+        )
+        for i in range(count)
+    ]
+    rows = [tuple(getattr(obj, attr) for attr in evaluation_row_serializer.attributes) for obj in objects]
+    
+    return objects, rows
+
+def run(name, schema, serializer, objects, rows, repeat):
+    assert schema.dump(objects, many=True) == serializer.dump(rows), f"{name}: output differs"
+    
+    marshmallow_time = min(timeit.repeat(lambda: schema.dump(objects, many=True), number=1, repeat=repeat))
+    row_time = min(timeit.repeat(lambda: serializer.dump(rows), number=1, repeat=repeat))
+    
+    print(f"{name:<12} marshmallow {marshmallow_time * 1000:9.2f} ms   "
+          f"row serializer {row_time * 1000:9.2f} ms   speedup {marshmallow_time / row_time:5.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    print(f"{args.rows} rows, best of {args.repeat}")
+    run("student", student_schema, student_row_serializer, *build_students(args.rows), args.repeat)
+    run("evaluation", evaluation_schema, evaluation_row_serializer, *build_evaluations(args.rows), args.repeat)
+
+if __name__ == "__main__":
+    main()
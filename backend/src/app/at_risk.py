@@ -0,0 +1,117 @@
+import datetime
+import time
+from sqlalchemy import and_, case, delete, func, insert, select
+from extensions import db
+from .grade_distribution import FAILING_GRADES, grade_points
+from .models import Course, Enrolment, EnrolmentAttendanceCount, EnrolmentRisk, Evaluation
+
+# The score is out of 100: attendance, grade average and share of failing grades
+ATTENDANCE_WEIGHT = 50
+GRADE_WEIGHT = 35
+FAILING_WEIGHT = 15
+# Absence share at which the attendance part is maxed out
+ABSENCE_CEILING = 0.3
+# Grade average below which the grade part starts to count
+GRADE_FLOOR = 3.0
+RISK_LEVELS = ((60, "High"), (30, "Medium"), (0, "Low"))
+
+INSERT_BATCH_SIZE = 5000
+
+def risk_features_query(today):
+    """Attendance and grade figures of every enrolment in a running course, in one statement.
+
+    Attendance comes from the per-enrolment counters, so student_attendance is
+    not read; evaluations are aggregated once per enrolment.
+    """
+    grades = select(
+        Evaluation.enrolment_id,
+        func.count().label("graded"),
+        func.sum(case((func.substr(Evaluation.grade, 1, 1).in_(FAILING_GRADES), 1), else_=0)).label("failing_grades"),
+        func.avg(grade_points(Evaluation.grade)).label("grade_average")
+    ).group_by(Evaluation.enrolment_id).subquery()
+
+    return select(
+        Enrolment.id.label("enrolment_id"),
+        Enrolment.student_id,
+        Enrolment.course_id,
+        Enrolment.course_date,
+        Course.learning_advisor_id,
+        func.coalesce(EnrolmentAttendanceCount.present, 0).label("present"),
+        func.coalesce(EnrolmentAttendanceCount.absent, 0).label("absent"),
+        func.coalesce(grades.c.graded, 0).label("graded"),
+        func.coalesce(grades.c.failing_grades, 0).label("failing_grades"),
+        grades.c.grade_average
+    ).join(
+        Course, and_(Course.id == Enrolment.course_id, Course.created_date == Enrolment.course_date)
+    ).outerjoin(
+        EnrolmentAttendanceCount, EnrolmentAttendanceCount.enrolment_id == Enrolment.id
+    ).outerjoin(grades, grades.c.enrolment_id == Enrolment.id).where(
+        Course.start_date <= today,
+        Course.end_date >= today
+    )
+
+def risk_score(present, absent, graded, failing_grades, grade_average):
+    """Return (score, level, absence rate in percent); figures with no data add nothing."""
+    marked = present + absent
+    absence_rate = absent / marked if marked else None
+
+    score = 0
+    if absence_rate is not None:
+        score += min(absence_rate / ABSENCE_CEILING, 1) * ATTENDANCE_WEIGHT
+    if grade_average is not None:
+        score += max(GRADE_FLOOR - float(grade_average), 0) / GRADE_FLOOR * GRADE_WEIGHT
+    if graded:
+        score += failing_grades / graded * FAILING_WEIGHT
+
+    score = round(score)
+    level = next(level for threshold, level in RISK_LEVELS if score >= threshold)
+    return score, level, round(absence_rate * 100, 2) if absence_rate is not None else None
+
+def score_at_risk_enrolments(today=None):
+    """Score every active enrolment and replace the enrolment_risk table; return the run statistics.
+
+    The old scores are deleted in the same transaction as the new ones are
+    written, so readers see either the previous run or this one.
+    """
+    today = today or datetime.date.today()
+    scored_at = datetime.datetime.now()
+    stats = {"day": today.isoformat(), "enrolments": 0, **{level.lower(): 0 for _, level in RISK_LEVELS}}
+
+    started_at = time.perf_counter()
+    features = db.session.execute(risk_features_query(today)).all()
+    stats["query_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+
+    started_at = time.perf_counter()
+    rows = []
+    for row in features:
+        # MySQL returns SUM() as a decimal
+        failing_grades = int(row.failing_grades)
+        score, level, absence_rate = risk_score(row.present, row.absent, row.graded, failing_grades, row.grade_average)
+        stats[level.lower()] += 1
+        rows.append({
+            "enrolment_id": row.enrolment_id,
+            "student_id": row.student_id,
+            "course_id": row.course_id,
+            "course_date": row.course_date,
+            "learning_advisor_id": row.learning_advisor_id,
+            "present": row.present,
+            "absent": row.absent,
+            "absence_rate": absence_rate,
+            "graded": row.graded,
+            "failing_grades": failing_grades,
+            "grade_average": round(float(row.grade_average), 2) if row.grade_average is not None else None,
+            "risk_score": score,
+            "risk_level": level,
+            "scored_at": scored_at
+        })
+    stats["enrolments"] = len(rows)
+    stats["score_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+
+    started_at = time.perf_counter()
+    db.session.execute(delete(EnrolmentRisk))
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.session.execute(insert(EnrolmentRisk), rows[start:start + INSERT_BATCH_SIZE])
+    db.session.commit()
+    stats["write_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+
+    return stats
@@ -0,0 +1,216 @@
+from collections import Counter, defaultdict
+from sqlalchemy import and_, case, delete, event, func, inspect, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import Session
+from extensions import db
+from .models import Class, ClassAttendanceCount, Course, Enrolment, EnrolmentAttendanceCount, StudentAttendance
+
+STATUS_COLUMNS = {"Present": "present", "Absent": "absent", "Unknown": "unknown"}
+COUNT_COLUMNS = tuple(STATUS_COLUMNS.values())
+CLASS_KEY = ("class_id", "course_id", "course_date", "term")
+ATTENDANCE_FIELDS = ("enrolment_id", *CLASS_KEY, "status")
+
+def _attendance_values(obj, before_flush=False):
+    attrs = inspect(obj).attrs
+    values = {}
+    for name in ATTENDANCE_FIELDS:
+        history = attrs[name].history
+        values[name] = history.deleted[0] if before_flush and history.deleted else getattr(obj, name)
+    # New rows take the 'Unknown' server default, which is not loaded yet
+    values["status"] = values["status"] or "Unknown"
+    return values
+
+def _count(deltas, values, sign):
+    enrolment_deltas, class_deltas = deltas
+    column = STATUS_COLUMNS[values["status"]]
+    enrolment_deltas[values["enrolment_id"]][column] += sign
+    class_deltas[tuple(values[name] for name in CLASS_KEY)][column] += sign
+
+def _apply_counts(connection, deltas):
+    enrolment_deltas, class_deltas = deltas
+    for model, key_columns, model_deltas in (
+        (EnrolmentAttendanceCount, ("enrolment_id",), {(key,): delta for key, delta in enrolment_deltas.items()}),
+        (ClassAttendanceCount, CLASS_KEY, class_deltas)
+    ):
+        rows = [
+            {**dict(zip(key_columns, key)), **{column: delta[column] for column in COUNT_COLUMNS}}
+            for key, delta in model_deltas.items()
+            if any(delta.values())
+        ]
+        if not rows:
+            continue
+
+        statement = mysql_insert(model)
+        statement = statement.on_duplicate_key_update({
+            column: getattr(model, column) + getattr(statement.inserted, column) for column in COUNT_COLUMNS
+        })
+        connection.execute(statement, rows)
+
+def _new_deltas():
+    return defaultdict(Counter), defaultdict(Counter)
+
+def _count_flushed_attendance(session, flush_context):
+    # new, dirty and deleted still hold the pre-flush state and attribute history here
+    deltas = _new_deltas()
+    for obj in session.new:
+        if isinstance(obj, StudentAttendance):
+            _count(deltas, _attendance_values(obj), 1)
+    for obj in session.deleted:
+        if isinstance(obj, StudentAttendance):
+            _count(deltas, _attendance_values(obj, before_flush=True), -1)
+    for obj in session.dirty:
+        if isinstance(obj, StudentAttendance) and session.is_modified(obj):
+            before, after = _attendance_values(obj, before_flush=True), _attendance_values(obj)
+            if before != after:
+                _count(deltas, before, -1)
+                _count(deltas, after, 1)
+
+    _apply_counts(session.connection(), deltas)
+
+def register_attendance_count_listeners():
+    if event.contains(Session, "after_flush", _count_flushed_attendance):
+        return
+
+    event.listen(Session, "after_flush", _count_flushed_attendance)
+
+def discount_class_attendance(class_):
+    """Take a class's attendance out of the counters; call before deleting it in bulk."""
+    rows = db.session.execute(
+        select(StudentAttendance.enrolment_id, StudentAttendance.status, func.count()).where(
+            StudentAttendance.class_id == class_.id,
+            StudentAttendance.course_id == class_.course_id,
+            StudentAttendance.course_date == class_.course_date,
+            StudentAttendance.term == class_.term
+        ).group_by(StudentAttendance.enrolment_id, StudentAttendance.status)
+    ).all()
+
+    deltas = _new_deltas()
+    for enrolment_id, status, count in rows:
+        values = {"enrolment_id": enrolment_id, "class_id": class_.id, "course_id": class_.course_id,
+                  "course_date": class_.course_date, "term": class_.term, "status": status}
+        _count(deltas, values, -count)
+
+    _apply_counts(db.session.connection(), deltas)
+
+def count_new_attendance(rows):
+    """Add attendance rows inserted in bulk, given as dicts, to the counters; the flush listener never sees them."""
+    deltas = _new_deltas()
+    for values in rows:
+        _count(deltas, {**values, "status": values.get("status") or "Unknown"}, 1)
+
+    _apply_counts(db.session.connection(), deltas)
+
+def rebuild_attendance_counts():
+    """Recount every counter from student_attendance; return the number of rows written per table."""
+    counts = [func.sum(case((StudentAttendance.status == status, 1), else_=0)) for status in STATUS_COLUMNS]
+    key_columns = {
+        EnrolmentAttendanceCount: (StudentAttendance.enrolment_id,),
+        ClassAttendanceCount: tuple(getattr(StudentAttendance, name) for name in CLASS_KEY)
+    }
+
+    written = {}
+    with db.engine.begin() as connection:
+        for model, columns in key_columns.items():
+            connection.execute(delete(model))
+            result = connection.execute(insert(model).from_select(
+                [*(column.key for column in columns), *COUNT_COLUMNS],
+                select(*columns, *counts).group_by(*columns)
+            ))
+            written[model.__tablename__] = result.rowcount
+
+    return written
+
+def attendance_summary(present, absent, unknown):
+    present, absent, unknown = int(present or 0), int(absent or 0), int(unknown or 0)
+    marked = present + absent
+    return {
+        "present": present,
+        "absent": absent,
+        "unknown": unknown,
+        # Sessions not marked yet are left out of the rate
+        "absence_rate": round(absent / marked * 100, 2) if marked else None
+    }
+
+def _total(rows):
+    return attendance_summary(*(sum(row[column] for row in rows) for column in COUNT_COLUMNS))
+
+def class_absence(class_id, course_id, course_date, term):
+    counts = db.session.get(ClassAttendanceCount, (class_id, course_id, course_date, term))
+    if not counts:
+        return attendance_summary(0, 0, 0)
+    return attendance_summary(counts.present, counts.absent, counts.unknown)
+
+def course_absence(course_id, course_date):
+    totals = db.session.execute(
+        select(*(func.sum(getattr(EnrolmentAttendanceCount, column)) for column in COUNT_COLUMNS))
+        .select_from(Enrolment)
+        .join(EnrolmentAttendanceCount, EnrolmentAttendanceCount.enrolment_id == Enrolment.id)
+        .where(Enrolment.course_id == course_id, Enrolment.course_date == course_date)
+    ).one()
+    return attendance_summary(*totals)
+
+def student_absence(student_id):
+    """Absence of a student overall and per enrolment, from one row per enrolment."""
+    rows = db.session.execute(
+        select(
+            Enrolment.id.label("enrolment_id"),
+            Enrolment.course_id,
+            Enrolment.course_date,
+            Course.name.label("course_name"),
+            *(getattr(EnrolmentAttendanceCount, column) for column in COUNT_COLUMNS)
+        )
+        .join(Course, and_(Course.id == Enrolment.course_id, Course.created_date == Enrolment.course_date))
+        .join(EnrolmentAttendanceCount, EnrolmentAttendanceCount.enrolment_id == Enrolment.id)
+        .where(Enrolment.student_id == student_id)
+        .order_by(Enrolment.course_date, Enrolment.course_id)
+    ).mappings().all()
+
+    return {
+        **_total(rows),
+        "courses": [
+            {
+                "enrolment_id": row["enrolment_id"],
+                "course_id": row["course_id"],
+                "course_date": row["course_date"].isoformat(),
+                "course_name": row["course_name"],
+                **attendance_summary(*(row[column] for column in COUNT_COLUMNS))
+            }
+            for row in rows
+        ]
+    }
+
+def teacher_absence(teacher_id):
+    """Absence in a teacher's classes overall and per class, from one row per class."""
+    rows = db.session.execute(
+        select(
+            Class.id.label("class_id"),
+            Class.course_id,
+            Class.course_date,
+            Class.term,
+            Class.class_date,
+            *(getattr(ClassAttendanceCount, column) for column in COUNT_COLUMNS)
+        )
+        .join(ClassAttendanceCount, and_(
+            ClassAttendanceCount.class_id == Class.id,
+            ClassAttendanceCount.course_id == Class.course_id,
+            ClassAttendanceCount.course_date == Class.course_date,
+            ClassAttendanceCount.term == Class.term
+        ))
+        .where(Class.teacher_id == teacher_id)
+        .order_by(Class.class_date)
+    ).mappings().all()
+
+    return {
+        **_total(rows),
+        "classes": [
+            {
+                "class_id": row["class_id"],
+                "course_id": row["course_id"],
+                "course_date": row["course_date"].isoformat(),
+                "term": row["term"],
+                "class_date": row["class_date"].isoformat(),
+                **attendance_summary(*(row[column] for column in COUNT_COLUMNS))
+            }
+            for row in rows
+        ]
+    }
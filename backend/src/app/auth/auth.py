@@ -1,17 +1,22 @@
+import datetime
 from flask import Blueprint, request, jsonify
 from flask_mail import Message
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt
 from itsdangerous import URLSafeTimedSerializer
 from marshmallow import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from extensions import db, pwd_context, jwt, mail
+from extensions import db, pwd_context, jwt
 from ..models import Account, TokenBlocklist, Employee
 from ..schemas.login_schema import login_schema
 from ..http_status import HTTPStatus
+from ..mail_outbox import mail_outbox
 from config import Config
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
+# Lifetime in seconds of the link sent by /auth/request_reset
+RESET_TOKEN_MAX_AGE = 300
+
 @auth_bp.post("/login")
 def login():
     try:
@@ -156,7 +161,9 @@ Click the link below to reset your password:
 This link will expire in 5 minutes.
 
 If you didn't request this password reset, please ignore this email."""
-        mail.send(msg)
+        # Delivered by the outbox sender (flask send-mail), not inside the request
+        mail_outbox.enqueue(msg, expires_at=datetime.datetime.now() + datetime.timedelta(seconds=RESET_TOKEN_MAX_AGE))
+        db.session.commit()
         
         return jsonify({
             "message": "Code has been sent"
@@ -182,7 +189,7 @@ def reset_password():
                 "message": "Missing token"
             }), HTTPStatus.BAD_REQUEST
         
-        email = serializer.loads(token, salt=salt, max_age=300)
+        email = serializer.loads(token, salt=salt, max_age=RESET_TOKEN_MAX_AGE)
         employee = db.session.query(Employee).filter_by(email=email).first()
         if not employee:
             return jsonify({
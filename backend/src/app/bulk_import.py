@@ -0,0 +1,266 @@
+import codecs
+import csv
+import datetime
+import tempfile
+from collections import Counter
+from itertools import islice
+from flask import current_app, request, jsonify
+from marshmallow import ValidationError
+from sqlalchemy import insert, inspect, select, tuple_
+from extensions import db
+from .http_status import HTTPStatus
+from .ids import allocate_ids
+from .search import INDEXED_FIELDS, index_new_rows
+
+CSV_MIMETYPES = ("text/csv", "application/csv")
+NDJSON_MIMETYPES = ("application/x-ndjson", "application/jsonl", "application/x-jsonlines")
+# Rows validated and written per round trip
+IMPORT_CHUNK_SIZE = 1000
+# Reports larger than this spill from memory to a temporary file
+REPORT_MEMORY_LIMIT = 1024 * 1024
+
+def get_upload():
+    """Return the uploaded file as a binary stream and its format, "csv" or "ndjson".
+
+    The file is either the raw request body, typed by Content-Type, or the
+    ``file`` field of a multipart form, typed by its extension. Neither is
+    read into memory here.
+    """
+    if request.mimetype == "multipart/form-data":
+        upload = request.files.get("file")
+        if not upload:
+            return None, None, jsonify({
+                "message": "Missing file in form data"
+            }), HTTPStatus.BAD_REQUEST
+
+        filename = (upload.filename or "").lower()
+        if filename.endswith(".csv") or upload.mimetype in CSV_MIMETYPES:
+            return upload.stream, "csv", None, None
+        if filename.endswith((".ndjson", ".jsonl")) or upload.mimetype in NDJSON_MIMETYPES:
+            return upload.stream, "ndjson", None, None
+    elif request.mimetype in CSV_MIMETYPES:
+        return request.stream, "csv", None, None
+    elif request.mimetype in NDJSON_MIMETYPES:
+        return request.stream, "ndjson", None, None
+
+    return None, None, jsonify({
+        "message": "Upload a CSV or NDJSON file"
+    }), HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+def read_records(stream, file_format):
+    """Yield (line, record, error) for each row of ``stream``, reading it lazily.
+
+    ``record`` is a dict of the row's fields, or None when the row could not
+    be parsed, in which case ``error`` says why.
+    """
+    text = codecs.getreader("utf-8-sig")(stream, errors="replace")
+
+    if file_format == "csv":
+        reader = csv.DictReader(text)
+        try:
+            for row in reader:
+                if None in row:
+                    yield reader.line_num, None, "Row has more fields than the header"
+                    continue
+                # Values are stripped; missing trailing fields are left out
+                yield reader.line_num, {key.strip(): value.strip() for key, value in row.items() if key and value is not None}, None
+        except csv.Error as e:
+            yield reader.line_num, None, f"Unreadable CSV: {e}"
+        return
+
+    for line_number, line in enumerate(text, 1):
+        if not line.strip():
+            continue
+        try:
+            record = current_app.json.loads(line)
+        except ValueError:
+            yield line_number, None, "Line is not valid JSON"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Line is not a JSON object"
+            continue
+        yield line_number, record, None
+
+def chunked(iterable, size=IMPORT_CHUNK_SIZE):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+class ImportReport:
+    """Per-row outcome of an import, kept as NDJSON in a spooled temporary file.
+
+    ``response`` sends a summary line first, then one line per row in file
+    order, so memory use stays flat however many rows were imported.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self._rows = tempfile.SpooledTemporaryFile(max_size=REPORT_MEMORY_LIMIT, mode="w+b")
+
+    def add(self, line, status, **fields):
+        self.counts[status] += 1
+        self._rows.write(current_app.json.dumps({"line": line, "status": status, **fields}).encode() + b"\n")
+
+    def summary(self, **fields):
+        return {"rows": sum(self.counts.values()), **dict(self.counts), **fields}
+
+    def lines(self, **fields):
+        """Return an iterator over the summary line, then the row lines; the report is closed once they are read."""
+        # Encoded now: a streamed response is read after the app context has been popped
+        summary = current_app.json.dumps({"summary": self.summary(**fields)}).encode() + b"\n"
+        return self._lines(summary)
+
+    def _lines(self, summary):
+        self._rows.seek(0)
+        with self._rows as rows:
+            yield summary
+            yield from rows
+
+    def response(self, **fields):
+        return current_app.response_class(self.lines(**fields), mimetype="application/x-ndjson")
+
+    def close(self):
+        self._rows.close()
+
+def _report_fields(row, columns):
+    # Dates as the schemas dump them, so a reported course key can be passed back as course_date
+    return {column: row[column].isoformat() if isinstance(row[column], datetime.date) else row[column] for column in columns}
+
+def _unique_value(value):
+    # Unique columns compare case-insensitively in MySQL
+    return value.casefold() if isinstance(value, str) else value
+
+class BulkImporter:
+    """Create ``model`` rows from uploaded records, a chunk at a time.
+
+    Each chunk is validated with one ``schema.load(many=True)``, then record
+    by record with ``check``, which returns an error message or None. Rows
+    from ``build_row`` are checked against every column group of ``unique``
+    with one query per group, given IDs from one ``allocate_ids`` block when
+    ``id_prefix`` is set and written with one multi-row INSERT.
+    """
+
+    def __init__(self, model, schema, build_row, check=None, id_prefix=None, unique=()):
+        self.model = model
+        self.schema = schema
+        self.build_row = build_row
+        self.check = check
+        self.id_prefix = id_prefix
+        self.unique = unique
+        self.key_columns = [column.key for column in inspect(model).primary_key]
+        # NOT NULL columns the database has no value for; a None there would fail the whole INSERT
+        self.required_columns = [
+            column.key for column in model.__table__.columns
+            if not column.nullable and column.default is None and column.server_default is None
+            and column.computed is None and column.key not in self.key_columns
+        ]
+        # Unique values already taken by earlier lines of the file, with their line
+        self.seen = {columns: {} for columns in unique}
+
+    def run(self, records, report, progress=None):
+        for chunk in chunked(records):
+            self.import_chunk(chunk, report)
+            if progress:
+                progress(report)
+
+    def _load(self, records):
+        try:
+            return self.schema.load(records, many=True), {}
+        except ValidationError as ve:
+            return ve.valid_data, ve.messages
+
+    def _taken(self, columns, values):
+        model_columns = [getattr(self.model, column) for column in columns]
+        if len(model_columns) == 1:
+            query = select(*model_columns).where(model_columns[0].in_([value for value, in values]))
+        else:
+            query = select(*model_columns).where(tuple_(*model_columns).in_(values))
+        return {tuple(map(_unique_value, row)) for row in db.session.execute(query)}
+
+    def import_chunk(self, chunk, report):
+        outcomes = []
+        parsed = []
+        for line, record, error in chunk:
+            if error:
+                outcomes.append((line, "invalid", {"error": error}))
+            else:
+                # CSV has no null, so an empty cell counts as a missing value
+                parsed.append((line, {key: value for key, value in record.items() if value != ""}))
+
+        data, errors = self._load([record for _, record in parsed])
+        pending = []
+        for index, (line, _) in enumerate(parsed):
+            if index in errors:
+                outcomes.append((line, "invalid", {"error": errors[index]}))
+                continue
+
+            error = self.check(data[index]) if self.check else None
+            if error:
+                outcomes.append((line, "invalid", {"error": error}))
+                continue
+
+            row = self.build_row(data[index])
+            missing = [column for column in self.required_columns if row.get(column) is None]
+            if missing:
+                outcomes.append((line, "invalid", {"error": {column: ["Field may not be null."] for column in missing}}))
+            else:
+                pending.append((line, row))
+
+        for columns in self.unique:
+            keyed = [(line, row, tuple(row[column] for column in columns)) for line, row in pending]
+            values = [value for _, _, value in keyed if None not in value]
+            taken = self._taken(columns, values) if values else set()
+
+            pending = []
+            seen = self.seen[columns]
+            for line, row, value in keyed:
+                unique_value = tuple(map(_unique_value, value))
+                if None in value:
+                    pending.append((line, row))
+                elif unique_value in taken:
+                    outcomes.append((line, "duplicate", {**_report_fields(row, columns), "error": f"{', '.join(columns)} already exists"}))
+                elif unique_value in seen:
+                    outcomes.append((line, "duplicate", {**_report_fields(row, columns), "error": f"{', '.join(columns)} already listed on line {seen[unique_value]}"}))
+                else:
+                    seen[unique_value] = line
+                    pending.append((line, row))
+
+        if pending:
+            rows = [row for _, row in pending]
+            if self.id_prefix:
+                for row, new_id in zip(rows, allocate_ids(self.model.id, self.id_prefix, len(rows))):
+                    row["id"] = new_id
+
+            db.session.execute(insert(self.model).values(rows))
+            # The search index listener only sees rows added through the session
+            if self.model in INDEXED_FIELDS:
+                index_new_rows(self.model, rows)
+
+            for line, row in pending:
+                outcomes.append((line, "created", _report_fields(row, self.key_columns)))
+
+        for line, status, fields in sorted(outcomes, key=lambda outcome: outcome[0]):
+            report.add(line, status, **fields)
+
+def import_upload(importer):
+    """Run ``importer`` over the uploaded file in one transaction and respond with its report.
+
+    With ``?dry_run=1`` every row is validated and written, then rolled back.
+    """
+    stream, file_format, error_response, status_code = get_upload()
+    if not stream:
+        return error_response, status_code
+
+    dry_run = request.args.get("dry_run", "").lower() in ("1", "true")
+    report = ImportReport()
+    try:
+        importer.run(read_records(stream, file_format), report)
+        if dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+    except Exception:
+        report.close()
+        raise
+
+    return report.response(dry_run=dry_run), HTTPStatus.OK
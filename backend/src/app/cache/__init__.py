@@ -0,0 +1,8 @@
+from .decorators import conditional_get, cached_response
+from .response_cache import response_cache
+from .table_versions import any_scope, mark_changed, register_table_version_listeners, scoped_table_name
+
+__all__ = [
+    'conditional_get', 'cached_response', 'response_cache', 'register_table_version_listeners',
+    'scoped_table_name', 'any_scope', 'mark_changed'
+]
\ No newline at end of file
@@ -0,0 +1,95 @@
+from functools import wraps
+from hashlib import sha1
+from flask import current_app, g, request, make_response
+from flask_jwt_extended import get_jwt
+from ..http_status import HTTPStatus
+from .response_cache import response_cache
+from .table_versions import get_table_versions
+
+def _request_key():
+    claims = get_jwt()
+
+    return "|".join([
+        request.path,
+        "&".join(f"{k}={v}" for k, v in sorted(request.args.items(multi=True))),
+        str(claims.get("role")),
+        str(claims.get("employee_id"))
+    ])
+
+def _request_tables(table_spec):
+    # Callables name the counters of one request, e.g. the scope of a single course
+    names = []
+    for table_name in table_spec:
+        if callable(table_name):
+            names.extend(table_name() or ())
+        else:
+            names.append(table_name)
+
+    return tuple(names)
+
+def _request_versions(table_names):
+    # Stacked decorators on one view share a single counter lookup
+    versions_by_tables = g.setdefault("table_versions", {})
+    if table_names not in versions_by_tables:
+        versions_by_tables[table_names] = tuple(get_table_versions(table_names))
+
+    return versions_by_tables[table_names]
+
+def conditional_get(*table_spec):
+    """Answer GET requests with a strong ETag built from the listed tables' change counters.
+
+    Must be applied below ``role_required`` so the JWT has been verified. When
+    the client's ``If-None-Match`` matches, the view is skipped and an empty
+    304 is returned.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorators(*args, **kwargs):
+            table_names = _request_tables(table_spec)
+            versions = _request_versions(table_names)
+            key = "|".join([
+                _request_key(),
+                ",".join(f"{name}:{version}" for name, version in zip(table_names, versions))
+            ])
+            etag = sha1(key.encode()).hexdigest()
+
+            if request.if_none_match.contains(etag):
+                response = make_response("", HTTPStatus.NOT_MODIFIED)
+            else:
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code != HTTPStatus.OK:
+                    return response
+
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response
+        return decorators
+    return wrapper
+
+def cached_response(*table_spec):
+    """Serve successful responses from the shared response cache.
+
+    Entries are keyed by route, query string, role and employee, and are
+    dropped when any of the listed tables is committed. A callable in the
+    list returns the scoped counters of the current request instead. Must
+    be applied below ``role_required``.
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorators(*args, **kwargs):
+            key = _request_key()
+            table_names = _request_tables(table_spec)
+            versions = _request_versions(table_names)
+
+            cached = response_cache.get(key, versions)
+            if cached is not None:
+                body, mimetype = cached
+                return current_app.response_class(body, status=HTTPStatus.OK, mimetype=mimetype)
+
+            response = make_response(fn(*args, **kwargs))
+            if response.status_code == HTTPStatus.OK and not response.is_streamed:
+                response_cache.set(key, table_names, versions, (response.get_data(), response.mimetype))
+
+            return response
+        return decorators
+    return wrapper
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+
+class ResponseCache:
+    """Bounded LRU cache of rendered responses, grouped by the tables they read.
+
+    Each entry remembers the change counters of its tables when it was
+    stored. Local commits evict entries eagerly through ``invalidate_tables``;
+    the stored counters catch writes committed by other workers.
+    """
+
+    def __init__(self, max_entries=512, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._keys_by_table = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def init_app(self, app):
+        self.max_entries = app.config.get("RESPONSE_CACHE_MAX_ENTRIES", self.max_entries)
+        self.ttl = app.config.get("RESPONSE_CACHE_TTL", self.ttl)
+
+    def get(self, key, versions):
+        with self._lock:
+            entry = self._entries.get(key)
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            if entry["versions"] != versions or time.monotonic() - entry["stored_at"] > self.ttl:
+                self._remove(key)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry["response"]
+
+    def set(self, key, table_names, versions, response):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            self._entries[key] = {
+                "tables": table_names,
+                "versions": versions,
+                "stored_at": time.monotonic(),
+                "response": response
+            }
+            for table_name in table_names:
+                self._keys_by_table.setdefault(table_name, set()).add(key)
+            
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_tables(self, table_names):
+        with self._lock:
+            for table_name in table_names:
+                for key in list(self._keys_by_table.get(table_name, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_table.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        
+        for table_name in entry["tables"]:
+            keys = self._keys_by_table.get(table_name)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table_name]
+
+response_cache = ResponseCache()
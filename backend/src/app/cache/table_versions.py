@@ -0,0 +1,97 @@
+from sqlalchemy import event, inspect, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+from extensions import db
+from ..models import TableVersion
+from .response_cache import response_cache
+
+CHANGED_TABLES_KEY = "changed_tables"
+COMMITTED_TABLES_KEY = "committed_tables"
+
+def scoped_table_name(table_name, scope, *values):
+    """Name of the counter for the rows of ``table_name`` sharing ``values`` in ``scope``."""
+    return ":".join([table_name, scope, *(str(value) for value in values)])
+
+def any_scope(table_name):
+    # Bumped by bulk statements, which do not say which scopes they touched
+    return f"{table_name}:*"
+
+def mark_changed(session, table_name):
+    if table_name != TableVersion.__tablename__:
+        session.info.setdefault(CHANGED_TABLES_KEY, set()).add(table_name)
+
+def _mark_scopes_changed(session, obj):
+    # Models list the column groups to count separately in __version_scopes__
+    scopes = getattr(type(obj), "__version_scopes__", None)
+    if not scopes:
+        return
+
+    attrs = inspect(obj).attrs
+    for scope, columns in scopes.items():
+        current = [getattr(obj, column) for column in columns]
+        mark_changed(session, scoped_table_name(obj.__table__.name, scope, *current))
+
+        previous = [attrs[column].history.deleted[0] if attrs[column].history.deleted else value
+                    for column, value in zip(columns, current)]
+        if previous != current:
+            mark_changed(session, scoped_table_name(obj.__table__.name, scope, *previous))
+
+def _collect_flushed_tables(session, flush_context, instances):
+    changed_objects = [*session.new, *session.deleted]
+    changed_objects.extend(obj for obj in session.dirty if session.is_modified(obj))
+    
+    for obj in changed_objects:
+        mark_changed(session, obj.__table__.name)
+        _mark_scopes_changed(session, obj)
+
+def _collect_bulk_tables(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = orm_execute_state.statement.table
+        mark_changed(orm_execute_state.session, table.name)
+        if orm_execute_state.bind_mapper and getattr(orm_execute_state.bind_mapper.class_, "__version_scopes__", None):
+            mark_changed(orm_execute_state.session, any_scope(table.name))
+
+def _bump_versions(session):
+    # Flush first so pending changes are recorded before the versions are written
+    session.flush()
+    
+    changed_tables = session.info.pop(CHANGED_TABLES_KEY, None)
+    if not changed_tables:
+        return
+    
+    statement = insert(TableVersion).values([
+        {"table_name": table_name, "version": 1} for table_name in sorted(changed_tables)
+    ])
+    statement = statement.on_duplicate_key_update(version=TableVersion.version + 1)
+    session.connection().execute(statement)
+    session.info[COMMITTED_TABLES_KEY] = changed_tables
+
+def _invalidate_committed_tables(session):
+    committed_tables = session.info.pop(COMMITTED_TABLES_KEY, None)
+    if committed_tables:
+        response_cache.invalidate_tables(committed_tables)
+
+def _discard_changes(session):
+    session.info.pop(CHANGED_TABLES_KEY, None)
+    session.info.pop(COMMITTED_TABLES_KEY, None)
+
+def get_table_versions(table_names):
+    """Return the change counter of each table; tables never written count as 0."""
+    rows = db.session.execute(
+        select(TableVersion.table_name, TableVersion.version).where(
+            TableVersion.table_name.in_(table_names)
+        )
+    ).all()
+    versions = dict(rows)
+    
+    return [versions.get(table_name, 0) for table_name in table_names]
+
+def register_table_version_listeners():
+    if event.contains(Session, "before_commit", _bump_versions):
+        return
+    
+    event.listen(Session, "before_flush", _collect_flushed_tables)
+    event.listen(Session, "do_orm_execute", _collect_bulk_tables)
+    event.listen(Session, "before_commit", _bump_versions)
+    event.listen(Session, "after_commit", _invalidate_committed_tables)
+    event.listen(Session, "after_rollback", _discard_changes)
@@ -0,0 +1,175 @@
+import re
+import signal
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+import click
+from extensions import db
+from .at_risk import score_at_risk_enrolments
+from .attendance_counts import rebuild_attendance_counts
+from .bulk_import import ImportReport, read_records
+from .mail_outbox import mail_outbox
+from .schedule_digest import send_schedule_digests
+from .routes.course_route import course_importer
+from .routes.employee_route import employee_importer
+from .routes.student_route import student_importer
+from .search import rebuild_search_index
+
+_IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Runs in a fresh interpreter so nothing is cached from the current process
+_COLD_START = (
+    "import time; started_at = time.perf_counter(); "
+    "from application import create_app; create_app(); "
+    "print(f'create_app_ms={(time.perf_counter() - started_at) * 1000:.1f}')"
+)
+
+def _cold_start(src_dir):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _COLD_START],
+        cwd=src_dir, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr.strip().splitlines()[-1])
+
+    create_app_ms = float(result.stdout.strip().rsplit("=", 1)[-1])
+    modules = []
+    for line in result.stderr.splitlines():
+        matched = _IMPORT_TIME.match(line)
+        if matched:
+            self_us, cumulative_us, indent, name = matched.groups()
+            modules.append((name, len(indent) // 2, int(self_us), int(cumulative_us)))
+
+    return create_app_ms, modules
+
+def register_commands(app):
+    @app.cli.command("profile-startup")
+    @click.option("--repeat", default=3, show_default=True, help="Cold starts to take the median of.")
+    @click.option("--limit", default=20, show_default=True, help="Rows to print per table.")
+    def profile_startup(repeat, limit):
+        """Report the cold start time of create_app and the import cost per module."""
+        # create_app builds Flask from application.py, so root_path is the source directory
+        runs = [_cold_start(app.root_path) for _ in range(repeat)]
+        create_app_ms = statistics.median(run[0] for run in runs)
+        _, modules = min(runs, key=lambda run: run[0])
+
+        # Self times add up to the whole import cost, so group them by top-level package
+        packages = defaultdict(lambda: [0, 0])
+        for name, _, self_us, _ in modules:
+            package = packages[name.split(".")[0]]
+            package[0] += self_us
+            package[1] += 1
+        total_us = sum(self_us for _, _, self_us, _ in modules)
+
+        click.echo(f"create_app cold start: {create_app_ms:.1f} ms (median of {repeat})")
+        click.echo(f"imports: {total_us / 1000:.1f} ms across {len(modules)} modules\n")
+
+        click.echo(f"{'package':<32} {'ms':>9} {'share':>7} {'modules':>8}")
+        for name, (self_us, count) in sorted(packages.items(), key=lambda item: -item[1][0])[:limit]:
+            click.echo(f"{name:<32} {self_us / 1000:>9.1f} {self_us / total_us:>7.1%} {count:>8}")
+
+        click.echo(f"\n{'module':<48} {'self ms':>9} {'cumulative ms':>14}")
+        nested = [module for module in modules if module[0] != "application"]
+        for name, _, self_us, cumulative_us in sorted(nested, key=lambda module: -module[3])[:limit]:
+            click.echo(f"{name:<48} {self_us / 1000:>9.1f} {cumulative_us / 1000:>14.1f}")
+
+    @app.cli.command("send-mail")
+    @click.option("--once", is_flag=True, help="Send what is due and exit instead of polling.")
+    def send_mail(once):
+        """Deliver queued mail from the outbox over a reused SMTP connection."""
+        if once:
+            stats = mail_outbox.drain()
+            click.echo(" ".join(f"{key}={value}" for key, value in stats.items()))
+            return
+
+        # SIGTERM finishes the batch in flight before exiting
+        signal.signal(signal.SIGTERM, lambda *_: mail_outbox.stop())
+        try:
+            mail_outbox.run(app)
+        except KeyboardInterrupt:
+            pass
+
+    @app.cli.command("send-schedule-digest")
+    @click.option("--date", "day", type=click.DateTime(["%Y-%m-%d"]), help="Day to send the schedule of. [default: tomorrow]")
+    @click.option("--no-deliver", is_flag=True, help="Only queue the digests; leave delivery to send-mail.")
+    def send_schedule_digest(day, no_deliver):
+        """Mail every teacher their schedule for the next day; meant to run nightly from cron."""
+        stats = send_schedule_digests(day.date() if day else None, deliver=not no_deliver, logger=app.logger)
+        app.logger.info("Schedule digest run: %s", stats)
+        click.echo(" ".join(f"{key}={value}" for key, value in stats.items()))
+        if stats["render_failed"] or stats.get("failed"):
+            raise SystemExit(1)
+
+    @app.cli.command("score-at-risk")
+    @click.option("--date", "day", type=click.DateTime(["%Y-%m-%d"]), help="Day to score the running courses of. [default: today]")
+    def score_at_risk(day):
+        """Score every active enrolment for dropout risk from attendance and grades; meant to run nightly from cron."""
+        stats = score_at_risk_enrolments(day.date() if day else None)
+        app.logger.info("At-risk scoring run: %s", stats)
+        click.echo(" ".join(f"{key}={value}" for key, value in stats.items()))
+
+    @app.cli.command("rebuild-search-index")
+    @click.option("--chunk-size", default=5000, show_default=True, help="Rows read and indexed per batch.")
+    def rebuild_search(chunk_size):
+        """Re-index students, employees, courses and rooms for /search.
+
+        Writes through the ORM keep the index current; run this once after
+        the migration and after bulk loads that bypass it.
+        """
+        counts = rebuild_search_index(chunk_size, log=click.echo)
+        click.echo(f"indexed {sum(counts.values())} tokens")
+
+    @app.cli.command("rebuild-attendance-counts")
+    def rebuild_attendance():
+        """Recount the per-enrolment and per-class attendance counters from student_attendance.
+
+        Attendance writes keep the counters current; run this after bulk
+        changes to student_attendance that bypass the ORM.
+        """
+        written = rebuild_attendance_counts()
+        for table_name, rows in written.items():
+            click.echo(f"{table_name:<28} {rows:>8} rows")
+
+    @app.cli.command("bulk-import")
+    @click.argument("kind", type=click.Choice(["students", "employees", "courses"]))
+    @click.argument("path", type=click.File("rb"))
+    @click.option("--advisor", help="Learning advisor ID the imported courses belong to.")
+    @click.option("--dry-run", is_flag=True, help="Validate and write every row, then roll back.")
+    @click.option("--report", "report_file", type=click.File("wb"), help="Write the per-row NDJSON report here.")
+    def bulk_import(kind, path, advisor, dry_run, report_file):
+        """Create students, employees or courses from a CSV or NDJSON file in one transaction.
+
+        Takes the fields of the matching /add route; unlike /employee/manager/import,
+        managers may be imported.
+        """
+        if kind == "courses" and not advisor:
+            raise click.UsageError("--advisor is required for courses")
+        importer = {
+            "students": student_importer,
+            "employees": lambda: employee_importer(allow_manager=True),
+            "courses": lambda: course_importer(advisor)
+        }[kind]()
+
+        file_format = "ndjson" if path.name.lower().endswith((".ndjson", ".jsonl")) else "csv"
+        report = ImportReport()
+        try:
+            importer.run(
+                read_records(path, file_format), report,
+                progress=lambda report: click.echo(" ".join(f"{key}={value}" for key, value in report.summary().items()))
+            )
+            if dry_run:
+                db.session.rollback()
+            else:
+                db.session.commit()
+        except Exception:
+            db.session.rollback()
+            report.close()
+            raise
+
+        summary = report.summary(dry_run=dry_run)
+        if report_file:
+            report_file.writelines(report.lines(dry_run=dry_run))
+        else:
+            report.close()
+        click.echo(" ".join(f"{key}={value}" for key, value in summary.items()))
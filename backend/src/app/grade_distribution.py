@@ -0,0 +1,81 @@
+from collections import defaultdict
+from sqlalchemy import case, func, select
+from extensions import db
+from .models import Evaluation, StudentAttendance
+
+ASSESSMENT_TYPES = (
+    "Quiz 1", "Quiz 2", "Quiz 3", "Quiz 4",
+    "Writing Project 1", "Writing Project 2",
+    "Reading Assessment 1", "Reading Assessment 2"
+)
+GRADE_POINTS = {"A": 4, "B": 3, "C": 2, "D": 1, "F": 0}
+GRADE_MODIFIERS = {"+": 0.3, "-": -0.3}
+FAILING_GRADES = ("D", "F")
+
+def grade_value(grade):
+    """Points of a letter grade such as "B+" on the 4-point scale; None for grades off the scale."""
+    points = GRADE_POINTS.get(grade[:1])
+    if points is None:
+        return None
+    return points + GRADE_MODIFIERS.get(grade[1:2], 0)
+
+def is_valid_grade(grade):
+    """Whether ``grade`` is a letter of the scale with an optional + or - modifier."""
+    return grade[:1] in GRADE_POINTS and grade[1:] in ("", *GRADE_MODIFIERS)
+
+def grade_points(grade):
+    """SQL counterpart of ``grade_value`` for the ``grade`` column expression."""
+    letter = func.substr(grade, 1, 1)
+    modifier = func.substr(grade, 2, 1)
+    return case(*((letter == letter_grade, value) for letter_grade, value in GRADE_POINTS.items())) + case(
+        *((modifier == sign, value) for sign, value in GRADE_MODIFIERS.items()), else_=0
+    )
+
+def course_filter(course_id, course_date):
+    return (Evaluation.course_id == course_id, Evaluation.course_date == course_date)
+
+def class_filter(class_id, course_id, course_date, term):
+    roster = select(StudentAttendance.student_id).where(
+        StudentAttendance.class_id == class_id,
+        StudentAttendance.course_id == course_id,
+        StudentAttendance.course_date == course_date,
+        StudentAttendance.term == term
+    )
+    return (*course_filter(course_id, course_date), Evaluation.student_id.in_(roster))
+
+def teacher_filter(teacher_id):
+    return (Evaluation.teacher_id == teacher_id,)
+
+def _summary(histogram):
+    evaluations = sum(histogram.values())
+    graded = [(grade_value(grade), count) for grade, count in histogram.items() if grade_value(grade) is not None]
+    graded_count = sum(count for _, count in graded)
+    return {
+        "evaluations": evaluations,
+        "average": round(sum(value * count for value, count in graded) / graded_count, 2) if graded_count else None,
+        "failing": sum(count for grade, count in histogram.items() if grade[:1] in FAILING_GRADES),
+        "histogram": dict(sorted(histogram.items()))
+    }
+
+def grade_distribution(*conditions, assessment_type=None):
+    """Grade histogram and average overall and per assessment type, from one GROUP BY."""
+    query = select(Evaluation.assessment_type, Evaluation.grade, func.count()).where(*conditions)
+    if assessment_type:
+        query = query.where(Evaluation.assessment_type == assessment_type)
+
+    by_assessment = defaultdict(lambda: defaultdict(int))
+    overall = defaultdict(int)
+    for row_assessment_type, grade, count in db.session.execute(
+        query.group_by(Evaluation.assessment_type, Evaluation.grade)
+    ):
+        by_assessment[row_assessment_type][grade] += count
+        overall[grade] += count
+
+    order = {name: index for index, name in enumerate(ASSESSMENT_TYPES)}
+    return {
+        **_summary(overall),
+        "assessments": [
+            {"assessment_type": name, **_summary(histogram)}
+            for name, histogram in sorted(by_assessment.items(), key=lambda item: (order.get(item[0], len(order)), item[0]))
+        ]
+    }
@@ -5,10 +5,13 @@ class HTTPStatus(IntEnum):
     CREATED = 201
     NO_CONTENT = 204
     
+    NOT_MODIFIED = 304
+    
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
     NOT_FOUND = 404
     CONFLICT = 409
+    UNSUPPORTED_MEDIA_TYPE = 415
 
     INTERNAL_SERVER_ERROR = 500
\ No newline at end of file
@@ -0,0 +1,44 @@
+from sqlalchemy import Integer, cast, func, select, update
+from sqlalchemy.dialects.mysql import insert
+from extensions import db
+from .models import IdSequence
+
+def by_number(id_column, prefix):
+    """ORDER BY terms putting the highest numbered ID first.
+
+    IDs are ``prefix`` and a number that outgrows its padding, so as text
+    "STU999" sorts after "STU1000"; the number after the prefix is compared instead.
+    """
+    return cast(func.substr(id_column, len(prefix) + 1), Integer).desc(), id_column.desc()
+
+def allocate_ids(id_column, prefix, count):
+    """Reserve ``count`` IDs for ``id_column`` from the ``prefix`` counter in id_sequence.
+
+    The counter row is locked and advanced in a short transaction of its
+    own, so concurrent callers queue on that one row only for as long as
+    the increment takes, never on the rows of ``id_column``'s table, and
+    never for the caller's whole transaction. Like AUTO_INCREMENT, numbers
+    reserved by a transaction that rolls back are not handed out again.
+    """
+    with db.engine.begin() as connection:
+        last_number = connection.scalar(
+            select(IdSequence.last_number).where(IdSequence.prefix == prefix).with_for_update()
+        )
+        if last_number is None:
+            # A prefix the migration did not seed continues from the highest ID in the table
+            highest = select(func.coalesce(func.max(cast(func.substr(id_column, len(prefix) + 1), Integer)), 0)).where(
+                id_column.like(f"{prefix}%")
+            ).scalar_subquery()
+            connection.execute(
+                insert(IdSequence).values(prefix=prefix, last_number=highest)
+                .on_duplicate_key_update(last_number=IdSequence.last_number)
+            )
+            last_number = connection.scalar(
+                select(IdSequence.last_number).where(IdSequence.prefix == prefix).with_for_update()
+            )
+
+        connection.execute(
+            update(IdSequence).where(IdSequence.prefix == prefix).values(last_number=IdSequence.last_number + count)
+        )
+
+    return [f"{prefix}{number:03}" for number in range(last_number + 1, last_number + count + 1)]
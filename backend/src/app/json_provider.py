@@ -0,0 +1,41 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson.
+
+    Produces the same documents as Flask's default provider: keys are sorted,
+    ``date``/``datetime`` go through the same HTTP date formatting and
+    ``Decimal``/``UUID`` become strings. orjson always writes UTF-8, so
+    non-ASCII text is emitted as-is instead of as ``\\u`` escapes.
+    Calls that pass ``json.dumps`` keyword arguments fall back to the
+    standard library encoder.
+    """
+
+    def _options(self, indent=False):
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        
+        return options
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent))
+        
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
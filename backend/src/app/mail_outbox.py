@@ -0,0 +1,174 @@
+import datetime
+import smtplib
+import threading
+from flask_mail import BadHeaderError, Message
+from sqlalchemy import select
+from extensions import db, mail
+from .models import MailOutbox
+
+class MailOutboxSender:
+    """Persisted outbox for mail, delivered in batches over one SMTP connection.
+
+    Routes call ``enqueue`` and commit with their own transaction, so a message
+    is only sent if the request that wrote it succeeded. ``send_pending`` claims
+    due rows with ``FOR UPDATE SKIP LOCKED``, which lets several senders run at
+    once without sending a message twice. Delivery failures are retried with
+    exponential backoff until ``max_attempts``; permanent (5xx) refusals fail
+    straight away. Messages enqueued with ``expires_at`` are retried no later
+    than that and fail once it has passed.
+
+    Delivery runs in its own process, ``flask send-mail``, next to the web
+    server rather than inside its workers.
+    """
+
+    def __init__(self, batch_size=50, max_attempts=6, backoff_base=30, backoff_max=3600, poll_interval=5):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+
+    def init_app(self, app):
+        self.batch_size = app.config.get("MAIL_OUTBOX_BATCH_SIZE", self.batch_size)
+        self.max_attempts = app.config.get("MAIL_OUTBOX_MAX_ATTEMPTS", self.max_attempts)
+        self.backoff_base = app.config.get("MAIL_OUTBOX_BACKOFF_BASE", self.backoff_base)
+        self.backoff_max = app.config.get("MAIL_OUTBOX_BACKOFF_MAX", self.backoff_max)
+        self.poll_interval = app.config.get("MAIL_OUTBOX_POLL_INTERVAL", self.poll_interval)
+
+    def enqueue(self, message, expires_at=None):
+        """Add ``message`` to the current session; it is sent once the caller commits.
+
+        Pass ``expires_at`` for mail that is useless after a deadline, e.g. a
+        link to a token that expires.
+        """
+        now = datetime.datetime.now()
+        row = MailOutbox(
+            subject=message.subject,
+            sender=_address(message.sender) if message.sender else None,
+            # One address per line: display names may contain commas
+            recipients="\n".join(_address(recipient) for recipient in message.send_to),
+            body=message.body,
+            html=message.html,
+            status="Pending",
+            attempts=0,
+            next_attempt_at=now,
+            expires_at=expires_at,
+            created_at=now
+        )
+        db.session.add(row)
+        return row
+
+    def send_pending(self):
+        """Send one batch of due messages; return the count of sent, retried and failed ones."""
+        now = datetime.datetime.now()
+        rows = db.session.scalars(
+            select(MailOutbox).where(
+                MailOutbox.status == "Pending",
+                MailOutbox.next_attempt_at <= now
+            ).order_by(MailOutbox.next_attempt_at, MailOutbox.id).limit(self.batch_size).with_for_update(skip_locked=True)
+        ).all()
+
+        stats = {"claimed": len(rows), "sent": 0, "retried": 0, "failed": 0}
+        if not rows:
+            db.session.rollback()
+            return stats
+
+        handled = 0
+        try:
+            with mail.connect() as connection:
+                for row in rows:
+                    if row.expires_at is not None and row.expires_at <= datetime.datetime.now():
+                        self._record_failure(row, "Expired before it could be delivered", permanent=True, stats=stats)
+                        handled += 1
+                        continue
+                    try:
+                        connection.send(self._message(row))
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as error:
+                        # The server refused this message only; the connection stays usable
+                        self._record_failure(row, error, permanent=_smtp_code(error) >= 500, stats=stats)
+                    except (BadHeaderError, AssertionError) as error:
+                        self._record_failure(row, str(error) or "Message has no sender or recipients", permanent=True, stats=stats)
+                    else:
+                        row.status = "Sent"
+                        row.attempts += 1
+                        row.sent_at = datetime.datetime.now()
+                        row.last_error = None
+                        stats["sent"] += 1
+                    handled += 1
+        except (smtplib.SMTPException, OSError) as error:
+            # Connecting failed or the connection dropped: retry what was not handled yet
+            for row in rows[handled:]:
+                self._record_failure(row, error, permanent=False, stats=stats)
+
+        db.session.commit()
+        return stats
+
+    def drain(self):
+        """Send batches until nothing is due; return the summed statistics."""
+        totals = {"claimed": 0, "sent": 0, "retried": 0, "failed": 0}
+        while True:
+            stats = self.send_pending()
+            for key, value in stats.items():
+                totals[key] += value
+            if stats["claimed"] < self.batch_size:
+                return totals
+
+    def run(self, app):
+        """Deliver due messages every ``poll_interval`` seconds until ``stop`` is called."""
+        while not self._stop.is_set():
+            with app.app_context():
+                try:
+                    self.drain()
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception("Mail outbox delivery failed")
+            self._stop.wait(self.poll_interval)
+
+    def stop(self):
+        """Make ``run`` return once the batch in flight is done."""
+        self._stop.set()
+
+    def _message(self, row):
+        return Message(
+            row.subject,
+            recipients=row.recipients.splitlines(),
+            body=row.body,
+            html=row.html,
+            sender=row.sender or None
+        )
+
+    def _record_failure(self, row, error, permanent, stats):
+        row.attempts += 1
+        row.last_error = str(error)[:500]
+
+        if permanent or row.attempts >= self.max_attempts:
+            row.status = "Failed"
+            stats["failed"] += 1
+            return
+
+        now = datetime.datetime.now()
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (row.attempts - 1))
+        row.next_attempt_at = now + datetime.timedelta(seconds=delay)
+        if row.expires_at is not None:
+            if row.expires_at <= now:
+                row.status = "Failed"
+                stats["failed"] += 1
+                return
+            # Keep retrying until the deadline instead of backing off past it
+            row.next_attempt_at = min(row.next_attempt_at, now + (row.expires_at - now) / 2)
+        stats["retried"] += 1
+
+def _address(address):
+    # Flask-Mail accepts (name, address) pairs as well as plain strings
+    if isinstance(address, tuple):
+        name, email = address
+        return f"{name} <{email}>"
+    return address
+
+def _smtp_code(error):
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return min(code for code, _ in error.recipients.values())
+    return error.smtp_code
+
+mail_outbox = MailOutboxSender()
@@ -2,7 +2,7 @@ from .employee import Employee
 from .room import Room
 from .student import Student
 from .account import Account
-from .course import Course
+from .course import Course, CourseSchedule
 from .issue import Issue
 from .leave_request import LeaveRequest
 from .staff_checkin import StaffCheckin
@@ -13,10 +13,25 @@ from .evaluation import Evaluation
 from .student_attendace import StudentAttendance
 from .makeup_class import MakeupClass
 from .token_blocklist import TokenBlocklist
-from .pdf import PDF
+from .table_version import TableVersion
+from .mail_outbox import MailOutbox
+from .search_token import SearchToken
+from .enrolment_attendance_count import EnrolmentAttendanceCount
+from .class_attendance_count import ClassAttendanceCount
+from .enrolment_risk import EnrolmentRisk
+from .id_sequence import IdSequence
 
 __all__ = [
-    "Employee", "Room", "Student", "Account", "Course", "Issue",
+    "Employee", "Room", "Student", "Account", "Course", "CourseSchedule", "Issue",
     "LeaveRequest", "StaffCheckin", "Class", "Contract",
-    "Enrolment", "Evaluation", "StudentAttendance", "MakeupClass", "TokenBlocklist", "PDF"
+    "Enrolment", "Evaluation", "StudentAttendance", "MakeupClass", "TokenBlocklist", "TableVersion", "MailOutbox", "SearchToken",
+    "EnrolmentAttendanceCount", "ClassAttendanceCount", "EnrolmentRisk", "IdSequence", "PDF"
 ]
+
+def __getattr__(name):
+    # fpdf is only needed to export reports, so it is imported on first use
+    if name == "PDF":
+        from .pdf import PDF
+        return PDF
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,7 +16,9 @@ class Class(db.Model):
         ForeignKeyConstraint(['teacher_id'], ['employee.id'], name='FK_class_employee'),
         Index('FK_class_course', 'course_id', 'course_date'),
         Index('FK_class_employee', 'teacher_id'),
-        Index('FK_class_room', 'room_id')
+        Index('FK_class_room', 'room_id'),
+        Index('IX_class_teacher_class_date', 'teacher_id', 'class_date'),
+        Index('IX_class_room_class_date', 'room_id', 'class_date')
     )
 
     id: Mapped[str] = mapped_column(String(10), primary_key=True)
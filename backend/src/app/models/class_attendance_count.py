@@ -0,0 +1,16 @@
+from extensions import db
+from sqlalchemy import Date, Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+import datetime
+
+class ClassAttendanceCount(db.Model):
+    __tablename__ = 'class_attendance_count'
+
+    # Maintained from student_attendance writes; no foreign key so the counters never block deletes
+    class_id: Mapped[str] = mapped_column(String(10), primary_key=True)
+    course_id: Mapped[str] = mapped_column(String(10), primary_key=True)
+    course_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    term: Mapped[int] = mapped_column(Integer, primary_key=True)
+    present: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    absent: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    unknown: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
@@ -17,7 +17,8 @@ class Contract(db.Model):
         ForeignKeyConstraint(['student_id'], ['student.id'], name='FK_contract_student'),
         Index('FK_contract_course', 'course_id', 'course_date'),
         Index('FK_contract_employee', 'employee_id'),
-        Index('FK_contract_student', 'student_id')
+        Index('FK_contract_student', 'student_id'),
+        Index('IX_contract_payment_status_start_date', 'payment_status', 'start_date')
     )
 
     id: Mapped[str] = mapped_column(String(10), primary_key=True)
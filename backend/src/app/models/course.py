@@ -1,12 +1,68 @@
+from dataclasses import dataclass
 from typing import List, Optional, TYPE_CHECKING
 from extensions import db
-from sqlalchemy import Computed, Date, ForeignKeyConstraint, Index, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Computed, Date, ForeignKeyConstraint, Index, Integer, SmallInteger, String, Time
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 import datetime
+import re
 
 if TYPE_CHECKING:
     from app.models import Class, Contract, Employee, Enrolment, Evaluation
-    
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+SCHEDULE_PATTERN = re.compile(r"(\w{3}) - (\w{3}), (\d{2}:\d{2}) - (\d{2}:\d{2})")
+
+@dataclass(frozen=True)
+class CourseSchedule:
+    """Parsed ``Course.schedule`` such as "Mon - Wed, 18:00 - 19:30": two weekdays sharing one time slot.
+
+    Weekdays are numbered like ``datetime.weekday()``, Monday being 0.
+    """
+    weekdays: tuple
+    start: datetime.time
+    end: datetime.time
+
+    @classmethod
+    def parse(cls, schedule):
+        """Raise ``ValueError`` with the message the course routes return for a bad schedule."""
+        matched = SCHEDULE_PATTERN.search(schedule)
+        if not matched:
+            raise ValueError("Invalid schedule format")
+
+        first_day, second_day, start, end = matched.groups()
+        if first_day not in WEEKDAYS or second_day not in WEEKDAYS:
+            raise ValueError("Invalid weekdays")
+
+        start_hour, start_minute = map(int, start.split(":"))
+        end_hour, end_minute = map(int, end.split(":"))
+        if not (0 <= start_hour < 24 and 0 <= end_hour < 24):
+            raise ValueError("Invalid hour")
+        if not (0 <= start_minute < 60 and 0 <= end_minute < 60):
+            raise ValueError("Invalid minute")
+
+        start, end = datetime.time(start_hour, start_minute), datetime.time(end_hour, end_minute)
+        if end <= start:
+            raise ValueError("Schedule must end after it starts")
+
+        weekdays = tuple(sorted({WEEKDAYS.index(first_day), WEEKDAYS.index(second_day)}))
+        return cls(weekdays, start, end)
+
+    @classmethod
+    def from_columns(cls, weekday_mask, start, end):
+        return cls(tuple(day for day in range(7) if weekday_mask & (1 << day)), start, end)
+
+    @property
+    def weekday_mask(self):
+        return sum(1 << day for day in self.weekdays)
+
+    @property
+    def minutes(self):
+        return (self.end.hour * 60 + self.end.minute) - (self.start.hour * 60 + self.start.minute)
+
+    def starts_at(self, moment):
+        """Whether a session starting at ``moment`` falls on this schedule."""
+        return moment.weekday() in self.weekdays and moment.time() == self.start
+
 class Course(db.Model):
     __tablename__ = 'course'
     __table_args__ = (
@@ -28,9 +84,31 @@ class Course(db.Model):
         Date, 
         Computed('start_date + INTERVAL duration MONTH', persisted=True)
     )
+    # Parsed from schedule by _sync_schedule; bit n of schedule_weekdays is datetime.weekday() == n
+    schedule_weekdays: Mapped[Optional[int]] = mapped_column(SmallInteger)
+    schedule_start: Mapped[Optional[datetime.time]] = mapped_column(Time)
+    schedule_end: Mapped[Optional[datetime.time]] = mapped_column(Time)
+    session_minutes: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        Computed('(TIME_TO_SEC(schedule_end) - TIME_TO_SEC(schedule_start)) DIV 60', persisted=True)
+    )
 
     learning_advisor: Mapped['Employee'] = relationship('Employee', back_populates='course', uselist=False)
     class_: Mapped[List['Class']] = relationship('Class', back_populates='course')
     contract: Mapped[List['Contract']] = relationship('Contract', back_populates='course')
     enrolment: Mapped[List['Enrolment']] = relationship('Enrolment', back_populates='course')
-    evaluation: Mapped[List['Evaluation']] = relationship('Evaluation', back_populates='course')
\ No newline at end of file
+    evaluation: Mapped[List['Evaluation']] = relationship('Evaluation', back_populates='course')
+
+    @validates('schedule')
+    def _sync_schedule(self, key, schedule):
+        parsed = CourseSchedule.parse(schedule)
+        self.schedule_weekdays = parsed.weekday_mask
+        self.schedule_start = parsed.start
+        self.schedule_end = parsed.end
+        return schedule
+
+    @property
+    def parsed_schedule(self):
+        if self.schedule_weekdays is None:
+            return None
+        return CourseSchedule.from_columns(self.schedule_weekdays, self.schedule_start, self.schedule_end)
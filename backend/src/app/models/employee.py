@@ -1,6 +1,6 @@
 from typing import List, Optional, TYPE_CHECKING
 from extensions import db
-from sqlalchemy import CheckConstraint, String
+from sqlalchemy import CheckConstraint, Index, String
 from sqlalchemy.dialects.mysql import VARCHAR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,9 +12,10 @@ class Employee(db.Model):
     __table_args__ = (
         CheckConstraint(
             "((role = 'Teacher') AND (teacher_status IN ('Available', 'Unavailable'))) OR \
-            ((role <> 'Teacher') AND (teacher_status IS NULL)))", name='CHK_employee_status'
+            ((role <> 'Teacher') AND (teacher_status IS NULL))", name='CHK_employee_status'
         ),
         CheckConstraint("role IN ('Teacher', 'Learning Advisor', 'Manager')", name='CHK_employee_role'),
+        Index('IX_employee_role', 'role')
     )
 
     id: Mapped[str] = mapped_column(String(10), primary_key=True)
@@ -0,0 +1,12 @@
+from extensions import db
+from sqlalchemy import Integer, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+class EnrolmentAttendanceCount(db.Model):
+    __tablename__ = 'enrolment_attendance_count'
+
+    # Maintained from student_attendance writes; no foreign key so the counters never block deletes
+    enrolment_id: Mapped[str] = mapped_column(String(10), primary_key=True)
+    present: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    absent: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    unknown: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
@@ -0,0 +1,29 @@
+from typing import Optional
+from extensions import db
+from sqlalchemy import CheckConstraint, Date, DateTime, Double, Index, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+import datetime
+
+class EnrolmentRisk(db.Model):
+    __tablename__ = 'enrolment_risk'
+    __table_args__ = (
+        CheckConstraint("risk_level IN ('Low', 'Medium', 'High')", name='CHK_enrolment_risk_level'),
+        Index('IX_enrolment_risk_advisor_score', 'learning_advisor_id', 'risk_score'),
+        Index('IX_enrolment_risk_score', 'risk_score')
+    )
+
+    # Rewritten as a whole by the nightly scoring job; no foreign keys so it never blocks deletes
+    enrolment_id: Mapped[str] = mapped_column(String(10), primary_key=True)
+    student_id: Mapped[str] = mapped_column(String(10), nullable=False)
+    course_id: Mapped[str] = mapped_column(String(10), nullable=False)
+    course_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    learning_advisor_id: Mapped[str] = mapped_column(String(10), nullable=False)
+    present: Mapped[int] = mapped_column(Integer, nullable=False)
+    absent: Mapped[int] = mapped_column(Integer, nullable=False)
+    absence_rate: Mapped[Optional[float]] = mapped_column(Double)
+    graded: Mapped[int] = mapped_column(Integer, nullable=False)
+    failing_grades: Mapped[int] = mapped_column(Integer, nullable=False)
+    grade_average: Mapped[Optional[float]] = mapped_column(Double)
+    risk_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    risk_level: Mapped[str] = mapped_column(String(10), nullable=False)
+    scored_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False)
@@ -28,6 +28,8 @@ class Evaluation(db.Model):
         Index('FK_evaluation_employee', 'teacher_id'),
         Index('enrolment', 'enrolment_id')
     )
+    # Cached grade distributions are versioned per course and per teacher
+    __version_scopes__ = {"course": ("course_id", "course_date"), "teacher": ("teacher_id",)}
 
     student_id: Mapped[str] = mapped_column(String(10), primary_key=True)
     course_id: Mapped[str] = mapped_column(String(10), primary_key=True)
@@ -0,0 +1,9 @@
+from extensions import db
+from sqlalchemy import BigInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+class IdSequence(db.Model):
+    __tablename__ = "id_sequence"
+
+    prefix: Mapped[str] = mapped_column(String(10), primary_key=True)
+    last_number: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text('0'))
@@ -0,0 +1,25 @@
+from extensions import db
+from sqlalchemy import CheckConstraint, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+import datetime
+
+class MailOutbox(db.Model):
+    __tablename__ = 'mail_outbox'
+    __table_args__ = (
+        CheckConstraint("status IN ('Pending', 'Sent', 'Failed')", name='CHK_mail_outbox_status'),
+        Index('IX_mail_outbox_status_next_attempt', 'status', 'next_attempt_at')
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    sender: Mapped[str] = mapped_column(String(320), nullable=True)
+    recipients: Mapped[str] = mapped_column(Text, nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=True)
+    html: Mapped[str] = mapped_column(Text, nullable=True)
+    status: Mapped[str] = mapped_column(String(10), nullable=False, server_default=text("'Pending'"))
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text('0'))
+    last_error: Mapped[str] = mapped_column(String(500), nullable=True)
+    next_attempt_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'))
+    expires_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=False, server_default=text('CURRENT_TIMESTAMP'))
+    sent_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=True)
@@ -1,6 +1,6 @@
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 from extensions import db
-from sqlalchemy import ForeignKeyConstraint, Index, String, Date, Integer, text
+from sqlalchemy import ForeignKeyConstraint, Index, String, Date, DateTime, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import datetime
 
@@ -29,6 +29,7 @@ class MakeupClass(db.Model):
     term: Mapped[int] = mapped_column(Integer, primary_key=True)
     teacher_id: Mapped[str] = mapped_column(String(10), nullable=False)
     room_id: Mapped[str] = mapped_column(String(10), nullable=False)
+    class_date: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime)
     created_date: Mapped[datetime.date] = mapped_column(Date, nullable=False, server_default=text('curdate()'))
 
     room: Mapped['Room'] = relationship('Room', back_populates='makeup_class', uselist=False)
@@ -1,6 +1,7 @@
+import base64
+from functools import lru_cache
 from pathlib import Path
 from flask import render_template
-from weasyprint import HTML, CSS
 
 
 def render_report_html_to_pdf(data: dict, output_path: str, base_url: str, css_path: str | None = None) -> None:
@@ -13,14 +14,26 @@ def render_report_html_to_pdf(data: dict, output_path: str, base_url: str, css_p
         css_path: Optional filesystem path to a CSS file; if not provided, an
             inline minimal @page rule will be applied for A4 + margins.
     """
-    html = render_template("evaluation/report_card.html", data=data)
+    # WeasyPrint loads Pango and friends on import; defer it to the first export
+    from weasyprint import HTML
 
-    stylesheets = []
-    if css_path and Path(css_path).is_file():
-        stylesheets.append(CSS(filename=str(css_path)))
-    else:
-        stylesheets.append(CSS(string="""@page { size: A4; margin: 14mm }"""))
+    html = render_template("evaluation/report_card.html", data=data)
+    stylesheets = [load_stylesheet(str(css_path) if css_path else None)]
 
     HTML(string=html, base_url=base_url).write_pdf(target=str(output_path), stylesheets=stylesheets)
 
 
+@lru_cache(maxsize=8)
+def load_stylesheet(css_path: str | None = None):
+    """Parse the report stylesheet once per process; falls back to a minimal A4 page rule."""
+    from weasyprint import CSS
+
+    if css_path and Path(css_path).is_file():
+        return CSS(filename=css_path)
+    return CSS(string="""@page { size: A4; margin: 14mm }""")
+
+
+@lru_cache(maxsize=8)
+def logo_data_uri(logo_path: str) -> str:
+    """Inline the logo as a data URI so WeasyPrint does not fetch it for every report."""
+    return "data:image/png;base64," + base64.b64encode(Path(logo_path).read_bytes()).decode("ascii")
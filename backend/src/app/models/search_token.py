@@ -0,0 +1,16 @@
+from extensions import db
+from sqlalchemy import Index, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+class SearchToken(db.Model):
+    __tablename__ = 'search_token'
+    __table_args__ = (
+        Index('IX_search_token_entity', 'entity_type', 'entity_key'),
+    )
+
+    # token leads the primary key so prefix lookups are range scans of the clustered index
+    token: Mapped[str] = mapped_column(String(64), primary_key=True)
+    entity_type: Mapped[str] = mapped_column(String(10), primary_key=True)
+    entity_key: Mapped[str] = mapped_column(String(30), primary_key=True)
+    field: Mapped[str] = mapped_column(String(20), primary_key=True)
+    weight: Mapped[int] = mapped_column(SmallInteger, nullable=False)
@@ -13,7 +13,9 @@ class StaffCheckin(db.Model):
         CheckConstraint('TO_DAYS(checkout_time) - TO_DAYS(checkin_time) >= 0', name='CHK_staff_checkin_datetime'),
         CheckConstraint("status IN ('Not Checked In', 'Checked In', 'Late')", name='CHK_staff_checkin_status'),
         ForeignKeyConstraint(['employee_id'], ['employee.id'], name='FK_staff_checkin_employee'),
-        Index('FK_staff_checkin_employee', 'employee_id')
+        Index('FK_staff_checkin_employee', 'employee_id'),
+        Index('IX_staff_checkin_employee_status', 'employee_id', 'status'),
+        Index('IX_staff_checkin_checkin_time', 'checkin_time')
     )
 
     id: Mapped[str] = mapped_column(String(10), primary_key=True)
@@ -1,11 +1,12 @@
 from typing import List, TYPE_CHECKING
 from extensions import db
-from sqlalchemy import CheckConstraint, ForeignKeyConstraint, Index, String, Date, Integer, text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import CheckConstraint, ForeignKeyConstraint, Index, String, Date, Integer, func, select, text
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from .class_ import Class
 import datetime
 
 if TYPE_CHECKING:
-    from app.models import Class, Enrolment, MakeupClass, Student
+    from app.models import Enrolment, MakeupClass, Student
 
 class StudentAttendance(db.Model):
     __tablename__ = 'student_attendance'
@@ -20,6 +21,8 @@ class StudentAttendance(db.Model):
         Index('FK_student_attendance_class', 'class_id', 'course_id', 'course_date', 'term'),
         Index('FK_student_attendance_enrolment', 'enrolment_id')
     )
+    # Cached class grade distributions are versioned per class roster
+    __version_scopes__ = {"class": ("class_id", "course_id", "course_date", "term")}
 
     student_id: Mapped[str] = mapped_column(String(10), primary_key=True)
     class_id: Mapped[str] = mapped_column(String(10), primary_key=True)
@@ -32,4 +35,17 @@ class StudentAttendance(db.Model):
     class_: Mapped['Class'] = relationship('Class', back_populates='student_attendance', uselist=False)
     enrolment: Mapped['Enrolment'] = relationship('Enrolment', back_populates='student_attendance', uselist=False)
     student: Mapped['Student'] = relationship('Student', back_populates='student_attendance', uselist=False)
-    makeup_class: Mapped[List['MakeupClass']] = relationship('MakeupClass', back_populates='student_attendance')
\ No newline at end of file
+    makeup_class: Mapped[List['MakeupClass']] = relationship('MakeupClass', back_populates='student_attendance')
+
+# Roster size computed in SQL so class listings never load student_attendance
+Class.student_count = column_property(
+    select(func.count())
+    .where(
+        StudentAttendance.class_id == Class.id,
+        StudentAttendance.course_id == Class.course_id,
+        StudentAttendance.course_date == Class.course_date,
+        StudentAttendance.term == Class.term
+    )
+    .correlate_except(StudentAttendance)
+    .scalar_subquery()
+)
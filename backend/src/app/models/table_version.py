@@ -0,0 +1,9 @@
+from extensions import db
+from sqlalchemy import BigInteger, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+class TableVersion(db.Model):
+    __tablename__ = "table_version"
+    
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text('0'))
@@ -6,6 +6,7 @@ from .course_route import course_bp
 from .student_route import student_bp
 from .student_attendance_route import student_attendance_bp
 from .class_route import class_bp
+from .makeup_class_route import makeup_class_bp
 from .room_route import room_bp
 from .manager.dashboard_route import dashboard_bp
 from .checkin_route import checkin_bp
@@ -13,8 +14,9 @@ from ..auth.auth import auth_bp
 from .account_route import account_bp
 from .employee_route import employee_bp
 from .teacher.issue_route import issue_bp
-from .teacher.leave_request_route import leave_request_bp
-from .manager.dashboard_route import dashboard_bp
+from .search_route import search_bp
+from .timetable_route import timetable_bp
+from .at_risk_route import at_risk_bp
 
 def register_blueprints(app):
     all_blueprints = [
@@ -24,6 +26,7 @@ def register_blueprints(app):
         contract_bp, 
         course_bp,
         class_bp,
+        makeup_class_bp,
         student_attendance_bp,
         checkin_bp, 
         dashboard_bp, 
@@ -32,7 +35,10 @@ def register_blueprints(app):
         student_bp,
         issue_bp,
         room_bp,
-        leave_request_bp
+        leave_request_bp,
+        search_bp,
+        timetable_bp,
+        at_risk_bp
     ]
     
     for bp in all_blueprints:
@@ -5,22 +5,14 @@ from extensions import db, pwd_context
 from ..models import Account
 from ..schemas.account_schema import account_schema
 from ..http_status import HTTPStatus
+from ..ids import allocate_ids
 
 account_bp = Blueprint("account_bp", __name__, url_prefix="/account")
 
 # Helper Functions
 def generate_account_id():
-    last_account = db.session.query(Account).order_by(Account.id.desc()).first()
-    
-    if not last_account:
-        return "ACC001"
-    else:
-        print(last_account.id)
-        prefix = last_account.id[:3]
-        account_number = int(last_account.id[3:]) + 1
-        
-        return f"{prefix}{account_number:03}"
-    
+    return allocate_ids(Account.id, "ACC", 1)[0]
+
 @account_bp.post("/add")
 def create_account():
     try:
@@ -0,0 +1,95 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import get_jwt
+from sqlalchemy import and_, select
+from extensions import db
+from ..auth import role_required
+from ..cache import conditional_get
+from ..models import Course, EnrolmentRisk, Student
+from ..http_status import HTTPStatus
+
+at_risk_bp = Blueprint("at_risk_bp", __name__, url_prefix="/at_risk")
+
+RISK_LEVELS = ("Low", "Medium", "High")
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# Helper Functions
+def get_risk_filters():
+    level = request.args.get("level")
+    if level and level not in RISK_LEVELS:
+        return None, jsonify({
+            "message": f"level must be one of {', '.join(RISK_LEVELS)}"
+        }), HTTPStatus.BAD_REQUEST
+
+    try:
+        limit = int(request.args.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= MAX_LIMIT:
+        return None, jsonify({
+            "message": f"limit must be between 1 and {MAX_LIMIT}"
+        }), HTTPStatus.BAD_REQUEST
+
+    # Advisors see the students of their own courses; managers may pick an advisor
+    claims = get_jwt()
+    if claims.get("role") == "Learning Advisor":
+        learning_advisor_id = claims.get("employee_id")
+    else:
+        learning_advisor_id = request.args.get("learning_advisor_id")
+
+    return {"level": level, "limit": limit, "learning_advisor_id": learning_advisor_id}, None, None
+
+@at_risk_bp.get("/")
+@role_required("Learning Advisor", "Manager")
+@conditional_get("enrolment_risk", "student", "course")
+def get_at_risk_enrolments():
+    try:
+        filters, error_response, status_code = get_risk_filters()
+        if not filters:
+            return error_response, status_code
+
+        # Highest scores first, read off (learning_advisor_id, risk_score) or (risk_score)
+        query = select(
+            EnrolmentRisk,
+            Student.fullname.label("student_name"),
+            Course.name.label("course_name")
+        ).join(Student, Student.id == EnrolmentRisk.student_id).join(
+            Course, and_(Course.id == EnrolmentRisk.course_id, Course.created_date == EnrolmentRisk.course_date)
+        ).order_by(EnrolmentRisk.risk_score.desc(), EnrolmentRisk.enrolment_id).limit(filters["limit"])
+
+        if filters["learning_advisor_id"]:
+            query = query.where(EnrolmentRisk.learning_advisor_id == filters["learning_advisor_id"])
+        if filters["level"]:
+            query = query.where(EnrolmentRisk.risk_level == filters["level"])
+
+        enrolments = [
+            {
+                "enrolment_id": risk.enrolment_id,
+                "student_id": risk.student_id,
+                "student_name": student_name,
+                "course_id": risk.course_id,
+                "course_date": risk.course_date.isoformat(),
+                "course_name": course_name,
+                "present": risk.present,
+                "absent": risk.absent,
+                "absence_rate": risk.absence_rate,
+                "graded": risk.graded,
+                "failing_grades": risk.failing_grades,
+                "grade_average": risk.grade_average,
+                "risk_score": risk.risk_score,
+                "risk_level": risk.risk_level
+            }
+            for risk, student_name, course_name in db.session.execute(query)
+        ]
+
+        scored_at = db.session.scalar(select(EnrolmentRisk.scored_at).limit(1))
+        return jsonify({
+            "scored_at": scored_at.isoformat() if scored_at else None,
+            "enrolments": enrolments
+        }), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
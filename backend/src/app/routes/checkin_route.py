@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from ..models import StaffCheckin, Class, Employee
 from ..http_status import HTTPStatus
 from ..schemas.checkin_schema import checkin_schema
+from ..ids import allocate_ids
 from extensions import db
 import datetime
 import re
@@ -11,15 +12,7 @@ from sqlalchemy.exc import IntegrityError
 checkin_bp = Blueprint("checkin_bp", __name__, url_prefix="/checkin")
 
 def generate_id():
-    last_id = db.session.query(StaffCheckin).order_by(StaffCheckin.id.desc()).first()
-
-    if not last_id:
-        return "CK001"
-    
-    else:
-        prefix = last_id.id[:2]
-        last_number = int(last_id.id[2:]) + 1
-        return f"{prefix}{last_number:03}"
+    return allocate_ids(StaffCheckin.id, "CK", 1)[0]
 
 def validate_id(id):
     employee = db.session.query(Employee).filter_by(id=id).first()
@@ -60,10 +53,10 @@ def checkin():
                 status = "Late"
         
         elif employee.role == "Teacher":
-            from sqlalchemy import func
             today_classes = db.session.query(Class).filter(
                 Class.teacher_id == employee.id,
-                func.date(Class.class_date) == today
+                Class.class_date >= datetime.datetime.combine(today, datetime.time.min),
+                Class.class_date < datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time.min)
             ).order_by(Class.class_date).all()
             
             if not today_classes:
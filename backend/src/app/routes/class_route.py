@@ -1,11 +1,13 @@
-from datetime import datetime
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import get_jwt
 from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from extensions import db
+from ..attendance_counts import discount_class_attendance
 from ..auth import role_required
+from ..cache import conditional_get
 from ..http_status import HTTPStatus
+from ..ids import by_number
 from ..models import Class, Course, Employee, Room, Enrolment, StudentAttendance
 from ..schemas.learning_advisor.class_schema import class_schema
 
@@ -17,7 +19,7 @@ def generate_class_id(course_id, course_date, term):
         course_id=course_id,
         course_date=course_date,
         term=term
-    ).order_by(Class.id.desc()).first()
+    ).order_by(*by_number(Class.id, "CLS")).first()
     
     if not last_class:
         return "CLS001"
@@ -72,22 +74,20 @@ def validate_room_availability(room_id):
 
 def validate_class_schedule_date(course_id, course_date, class_date):
     course = db.session.get(Course, (course_id, course_date))
-    schedule_list = course.schedule.split(",")
-    class_days = [weekday.strip() for weekday in schedule_list[0].strip().split("-")]
-    class_hours = [hour.strip() for hour in schedule_list[1].strip().split("-")]
-    
-    datetime_parts = str(class_date).split(" ")
-    date_str = datetime_parts[0]
-    time_str = datetime_parts[1]
-    scheduled_weekday = datetime.strptime(date_str, "%Y-%m-%d").strftime("%a")
+    schedule = course.parsed_schedule
+    if not schedule:
+        return None, jsonify({
+            "message": "Course schedule is not in a recognised format",
+            "schedule": f"{course.schedule}"
+        }), HTTPStatus.CONFLICT
 
-    if scheduled_weekday not in class_days:
+    if class_date.weekday() not in schedule.weekdays:
         return None, jsonify({
             "message": "Weekday not in course's schedule",
             "schedule": f"{course.schedule}"
         }), HTTPStatus.BAD_REQUEST
         
-    if time_str != (class_hours[0] + ":00"):
+    if class_date.time() != schedule.start:
         return None, jsonify({
             "message": "Start hour not in course's schedule"
         }), HTTPStatus.BAD_REQUEST
@@ -162,6 +162,8 @@ def create_student_attendance(class_):
         db.session.add(student_attendance)
 
 def delete_student_attendance(class_):
+    # A bulk delete skips the flush listener that keeps the attendance counters
+    discount_class_attendance(class_)
     db.session.query(StudentAttendance).filter_by(
         class_id=class_.id,
         course_id=class_.course_id,
@@ -172,6 +174,7 @@ def delete_student_attendance(class_):
 # General Features
 @class_bp.get("/search")
 @role_required("Learning Advisor", "Manager")
+@conditional_get("class", "course", "employee", "student_attendance")
 def get_class_by_id():
     try:
         id, course_id, course_date, term, error_response, status_code = get_class_composite_key()
@@ -192,6 +195,7 @@ def get_class_by_id():
 # Learning Advisor Features
 @class_bp.get("/learningadvisor/")
 @role_required("Learning Advisor")
+@conditional_get("class", "course", "employee", "student_attendance")
 def advisor_get_classes_by_course():
     try:
         course_id = request.args.get("course_id")
@@ -439,15 +443,12 @@ def advisor_delete_class():
 # Teacher Features
 @class_bp.get("/teacher/")
 @role_required("Teacher")
+@conditional_get("class", "course", "employee", "student_attendance")
 def teacher_get_assigned_classes():
     try:
         teacher_id = get_jwt().get("employee_id")
         class_list = db.session.query(Class).filter_by(teacher_id=teacher_id).all()
         
-        # Ensure student_attendance is loaded for each class to calculate student_count
-        for class_obj in class_list:
-            _ = class_obj.student_attendance  # Trigger lazy loading
-        
         return jsonify(class_schema.dump(class_list, many=True)), HTTPStatus.OK
     
     except Exception as e:
@@ -459,6 +460,7 @@ def teacher_get_assigned_classes():
 # Manager Features
 @class_bp.get("/manager/")
 @role_required("Manager")
+@conditional_get("class", "course", "employee", "student_attendance")
 def manager_get_classes_by_course():
     try:
         course_id = request.args.get("course_id")
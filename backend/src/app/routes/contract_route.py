@@ -1,38 +1,26 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import get_jwt
 from marshmallow import ValidationError
+from sqlalchemy import insert, select, update
 from sqlalchemy.exc import IntegrityError, OperationalError
 from extensions import db
 from ..auth import role_required
-from ..models import Contract, Student, Course, Enrolment
+from ..attendance_counts import count_new_attendance
+from ..bulk_import import ImportReport, chunked, get_upload, read_records
+from ..ids import allocate_ids
+from ..models import Class, Contract, Student, Course, Enrolment, StudentAttendance
 from ..http_status import HTTPStatus
-from ..schemas.learning_advisor.contract_schema import contract_schema
+from ..schemas.learning_advisor.contract_schema import bulk_enrolment_schema, contract_schema
 
 contract_bp = Blueprint("contract_bp", __name__, url_prefix="/contract")
 
 # Helper Function
 def generate_contract_id():
-    last_contract = db.session.query(Contract).order_by(Contract.id.desc()).first()
-    
-    if not last_contract:
-        return "CON001"
-    else:
-        prefix = last_contract.id[:3]
-        contract_number = int(last_contract.id[3:]) + 1
-        
-        return f"{prefix}{contract_number:03}"
+    return allocate_ids(Contract.id, "CON", 1)[0]
 
 def generate_enrolment_id():
-    last_enrolment = db.session.query(Enrolment).order_by(Enrolment.id.desc()).first()
-    
-    if not last_enrolment:
-        return "ENR001"
-    else:
-        prefix = last_enrolment.id[:3]
-        enrolment_number = int(last_enrolment.id[3:]) + 1
-        
-        return f"{prefix}{enrolment_number:03}"
-    
+    return allocate_ids(Enrolment.id, "ENR", 1)[0]
+
 def get_contract_id():
     id = request.args.get("id")
     if not id:
@@ -91,6 +79,142 @@ def check_duplicate_contract(student_id, course_id, course_date):
     
     return True, None, None
 
+PAYMENT_STATUSES = ("In Progress", "Paid")
+
+def reconcile_payment_statuses(chunk, employee_id, seen, report):
+    """Validate one chunk of uploaded rows and apply its changes with one UPDATE per status."""
+    outcomes = []
+    pending = []
+    for line, record, error in chunk:
+        if error:
+            outcomes.append((line, "invalid", {"error": error}))
+            continue
+
+        contract_id = str(record.get("contract_id") or "").strip()
+        payment_status = str(record.get("payment_status") or "").strip()
+        if not contract_id or not payment_status:
+            outcomes.append((line, "invalid", {"contract_id": contract_id or None, "error": "contract_id and payment_status are required"}))
+        elif payment_status not in PAYMENT_STATUSES:
+            outcomes.append((line, "invalid", {"contract_id": contract_id, "error": f"payment_status must be one of {', '.join(PAYMENT_STATUSES)}"}))
+        elif contract_id in seen:
+            outcomes.append((line, "duplicate", {"contract_id": contract_id, "error": f"Contract already listed on line {seen[contract_id]}"}))
+        else:
+            seen[contract_id] = line
+            pending.append((line, contract_id, payment_status))
+
+    query = select(Contract.id, Contract.payment_status).where(Contract.id.in_([contract_id for _, contract_id, _ in pending]))
+    if employee_id:
+        query = query.where(Contract.employee_id == employee_id)
+    current = dict(db.session.execute(query.with_for_update()).all()) if pending else {}
+
+    changes = {payment_status: [] for payment_status in PAYMENT_STATUSES}
+    for line, contract_id, payment_status in pending:
+        if contract_id not in current:
+            outcomes.append((line, "not_found", {"contract_id": contract_id, "error": "Contract not found"}))
+        elif current[contract_id] == payment_status:
+            outcomes.append((line, "unchanged", {"contract_id": contract_id, "payment_status": payment_status}))
+        else:
+            changes[payment_status].append(contract_id)
+            outcomes.append((line, "updated", {"contract_id": contract_id, "payment_status": payment_status, "previous": current[contract_id]}))
+
+    for payment_status, contract_ids in changes.items():
+        if contract_ids:
+            db.session.execute(
+                update(Contract).where(Contract.id.in_(contract_ids)).values(payment_status=payment_status),
+                execution_options={"synchronize_session": False}
+            )
+
+    for line, status, fields in sorted(outcomes, key=lambda outcome: outcome[0]):
+        report.add(line, status, **fields)
+
+def scheduled_classes(course):
+    # Classes created before an enrolment already have their rosters, so new students are added to them
+    return db.session.execute(
+        select(Class.id, Class.term).where(Class.course_id == course.id, Class.course_date == course.created_date)
+    ).all()
+
+def enrol_students(course, student_ids, employee_id):
+    """Create contracts, enrolments and attendance for the course's scheduled classes; return per-student outcomes.
+
+    Each step is one query or one multi-row INSERT, whatever the number of students.
+    """
+    outcomes = {}
+    requested = []
+    for student_id in student_ids:
+        if student_id in outcomes:
+            continue
+        outcomes[student_id] = None
+        requested.append(student_id)
+
+    found = set(db.session.scalars(select(Student.id).where(Student.id.in_(requested))))
+    contracted = dict(db.session.execute(
+        select(Contract.student_id, Contract.id).where(
+            Contract.course_id == course.id,
+            Contract.course_date == course.created_date,
+            Contract.student_id.in_(requested)
+        )
+    ).all())
+
+    new_students = []
+    for student_id in requested:
+        if student_id not in found:
+            outcomes[student_id] = {"status": "not_found", "error": "Student not found"}
+        elif student_id in contracted:
+            outcomes[student_id] = {"status": "exists", "contract_id": contracted[student_id], "error": "Contract existed"}
+        else:
+            new_students.append(student_id)
+
+    if new_students:
+        contract_ids = allocate_ids(Contract.id, "CON", len(new_students))
+        enrolment_ids = allocate_ids(Enrolment.id, "ENR", len(new_students))
+        db.session.execute(insert(Contract).values([
+            {
+                "id": contract_id,
+                "student_id": student_id,
+                "employee_id": employee_id,
+                "course_id": course.id,
+                "course_date": course.created_date,
+                "tuition_fee": course.fee,
+                "start_date": course.start_date,
+                "end_date": course.end_date
+            }
+            for student_id, contract_id in zip(new_students, contract_ids)
+        ]))
+        db.session.execute(insert(Enrolment).values([
+            {
+                "id": enrolment_id,
+                "contract_id": contract_id,
+                "student_id": student_id,
+                "course_id": course.id,
+                "course_date": course.created_date,
+                "enrolment_date": course.start_date
+            }
+            for student_id, contract_id, enrolment_id in zip(new_students, contract_ids, enrolment_ids)
+        ]))
+
+        classes = scheduled_classes(course)
+        attendance = [
+            {
+                "student_id": student_id,
+                "class_id": class_id,
+                "course_id": course.id,
+                "course_date": course.created_date,
+                "term": term,
+                "enrolment_id": enrolment_id
+            }
+            for student_id, enrolment_id in zip(new_students, enrolment_ids)
+            for class_id, term in classes
+        ]
+        for rows in chunked(attendance):
+            db.session.execute(insert(StudentAttendance).values(rows))
+        # Bulk inserts skip the flush listener that keeps the attendance counters
+        count_new_attendance(attendance)
+
+        for student_id, contract_id, enrolment_id in zip(new_students, contract_ids, enrolment_ids):
+            outcomes[student_id] = {"status": "created", "contract_id": contract_id, "enrolment_id": enrolment_id, "classes": len(classes)}
+
+    return [{"student_id": student_id, **outcome} for student_id, outcome in outcomes.items()]
+
 # Learning Advisor Features
 @contract_bp.post("/learningadvisor/add")
 @role_required("Learning Advisor")
@@ -139,6 +263,16 @@ def advisor_create_contract():
             enrolment_date=contract.start_date
         )
         db.session.add(enrolment)
+
+        for class_id, term in scheduled_classes(course):
+            db.session.add(StudentAttendance(
+                student_id=enrolment.student_id,
+                class_id=class_id,
+                course_id=enrolment.course_id,
+                course_date=enrolment.course_date,
+                term=term,
+                enrolment_id=enrolment.id
+            ))
         
         db.session.commit()
         return jsonify(contract_schema.dump(contract)), HTTPStatus.CREATED
@@ -170,6 +304,60 @@ def advisor_create_contract():
             "error": str(e)
         }), HTTPStatus.INTERNAL_SERVER_ERROR
 
+@contract_bp.post("/learningadvisor/bulk_add")
+@role_required("Learning Advisor")
+def advisor_bulk_create_contracts():
+    """Enrol many students into one of the caller's courses in one transaction."""
+    try:
+        if not request.is_json:
+            return jsonify({
+                "message": "Missing or invalid JSON"
+            }), HTTPStatus.BAD_REQUEST
+
+        validated_data = bulk_enrolment_schema.load(request.get_json())
+
+        course, error_response, status_code = validate_course_for_advisor(validated_data["course_id"], validated_data["course_date"])
+        if not course:
+            return error_response, status_code
+
+        results = enrol_students(course, validated_data["student_ids"], get_jwt().get("employee_id"))
+        db.session.commit()
+
+        created = sum(result["status"] == "created" for result in results)
+        return jsonify({
+            "course_id": course.id,
+            "course_date": course.created_date.isoformat(),
+            "created": created,
+            "results": results
+        }), HTTPStatus.CREATED if created else HTTPStatus.OK
+
+    except ValidationError as ve:
+        return jsonify({
+            "message": "Invalid input",
+            "error": ve.messages
+        }), HTTPStatus.BAD_REQUEST
+
+    except IntegrityError as ie:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(ie.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except OperationalError as oe:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(oe.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
 @contract_bp.get("/learningadvisor/")
 @role_required("Learning Advisor")
 def advisor_get_contracts_by_course():
@@ -349,6 +537,52 @@ def advisor_delete_contract():
             "error": str(e)
         }), HTTPStatus.INTERNAL_SERVER_ERROR
             
+# Finance Features
+@contract_bp.post("/payment_status/import")
+@role_required("Learning Advisor", "Manager")
+def import_payment_statuses():
+    """Apply a CSV or NDJSON file of contract_id, payment_status rows; learning advisors only reach their own contracts."""
+    report = None
+    try:
+        stream, file_format, error_response, status_code = get_upload()
+        if not stream:
+            return error_response, status_code
+
+        claims = get_jwt()
+        employee_id = claims.get("employee_id") if claims.get("role") == "Learning Advisor" else None
+        dry_run = request.args.get("dry_run", "").lower() in ("1", "true")
+
+        # The file is read and applied a chunk at a time, all in one transaction
+        report = ImportReport()
+        seen = {}
+        for chunk in chunked(read_records(stream, file_format)):
+            reconcile_payment_statuses(chunk, employee_id, seen, report)
+
+        if dry_run:
+            db.session.rollback()
+        else:
+            db.session.commit()
+
+        return report.response(dry_run=dry_run), HTTPStatus.OK
+
+    except OperationalError as oe:
+        db.session.rollback()
+        if report:
+            report.close()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(oe.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        db.session.rollback()
+        if report:
+            report.close()
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
 # Manager Features
 @contract_bp.get("/manager/")
 @role_required("Manager")
@@ -6,8 +6,10 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from extensions import db
 from ..auth import role_required
-from ..models import Course
-from ..schemas.learning_advisor.course_schema import course_schema
+from ..bulk_import import BulkImporter, import_upload
+from ..cache import conditional_get, cached_response
+from ..models import Course, CourseSchedule
+from ..schemas.learning_advisor.course_schema import course_schema, course_row_serializer
 from ..http_status import HTTPStatus
 
 course_bp = Blueprint("course_bp", __name__, url_prefix="/course")
@@ -96,36 +98,11 @@ def validate_course_start_date(date, created_date):
     return date, None, None
 
 def validate_course_schedule_format(schedule):
-    matched = re.search(r"(\w{3}) - (\w{3}), (\d{2}:\d{2}) - (\d{2}:\d{2})", schedule)
-    
-    if not matched:
-        return None, jsonify({
-            "message": "Invalid schedule format"
-        }), HTTPStatus.BAD_REQUEST
-    
-    valid_weekdays = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-    first_day = matched.group(1)
-    second_day = matched.group(2)
-    
-    if first_day not in valid_weekdays or \
-       second_day not in valid_weekdays:
-        return None, jsonify({
-            "message": "Invalid weekdays"
-        }), HTTPStatus.BAD_REQUEST
-    
-    start_hour, start_minute = map(int, matched.group(3).split(":"))
-    end_hour, end_minute = map(int, matched.group(4).split(":"))
-    
-    if 0 > start_hour or start_hour >= 24 or \
-       0 > end_hour or end_hour >= 24:
-        return None, jsonify({
-            "message": "Invalid hour"
-        }), HTTPStatus.BAD_REQUEST
-    
-    if 0 > start_minute or start_minute >= 60 or \
-       0 > end_minute or end_minute >= 60:
+    try:
+        CourseSchedule.parse(schedule)
+    except ValueError as ve:
         return None, jsonify({
-            "message": "Invalid minute"
+            "message": str(ve)
         }), HTTPStatus.BAD_REQUEST
         
     return schedule, None, None
@@ -148,6 +125,49 @@ def validate_course_created_date(date):
     
     return date, None, None
 
+def course_row_error(validated_data):
+    """Message of the first rule of advisor_create_course that ``validated_data`` breaks, or None."""
+    checks = (
+        lambda: validate_course_name(validated_data["name"]),
+        lambda: validate_course_duration(validated_data["duration"]),
+        lambda: validate_course_schedule_format(validated_data["schedule"]),
+        lambda: validate_course_fee(validated_data["fee"]),
+        lambda: validate_course_created_date(validated_data["created_date"]),
+        lambda: validate_course_start_date(validated_data["start_date"], validated_data["created_date"])
+    )
+    for check in checks:
+        _, error_response, _ = check()
+        if error_response:
+            return error_response.get_json()["message"]
+    return None
+
+def course_row(validated_data, learning_advisor_id):
+    # Bulk inserts skip Course._sync_schedule, so the parsed schedule columns are set here
+    schedule = CourseSchedule.parse(validated_data["schedule"])
+    return {
+        "id": generate_course_id(validated_data["name"]),
+        "name": validated_data["name"],
+        "duration": validated_data["duration"],
+        "start_date": validated_data["start_date"],
+        "schedule": validated_data["schedule"],
+        "schedule_weekdays": schedule.weekday_mask,
+        "schedule_start": schedule.start,
+        "schedule_end": schedule.end,
+        "learning_advisor_id": learning_advisor_id,
+        "fee": validated_data["fee"],
+        "prerequisites": validated_data["prerequisites"],
+        "created_date": validated_data["created_date"],
+        "description": validated_data.get("description")
+    }
+
+def course_importer(learning_advisor_id):
+    return BulkImporter(
+        Course, course_schema,
+        lambda validated_data: course_row(validated_data, learning_advisor_id),
+        check=course_row_error,
+        unique=(("id", "created_date"),)
+    )
+
 # Learning Advisor Features
 @course_bp.post("/learningadvisor/add")
 @role_required("Learning Advisor")
@@ -231,13 +251,45 @@ def advisor_create_course():
             "error": str(e)
         }), HTTPStatus.INTERNAL_SERVER_ERROR
         
+@course_bp.post("/learningadvisor/import")
+@role_required("Learning Advisor")
+def advisor_import_courses():
+    """Create courses run by the caller from a CSV or NDJSON file with the fields of /learningadvisor/add."""
+    try:
+        return import_upload(course_importer(get_jwt().get("employee_id")))
+
+    except IntegrityError as ie:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(ie.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except OperationalError as oe:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(oe.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
 @course_bp.get("/learningadvisor/")
 @role_required("Learning Advisor")
+@conditional_get("course")
+@cached_response("course")
 def advisor_get_courses():
     try:
         employee_id = get_jwt().get("employee_id")
-        course_list = db.session.query(Course).filter_by(learning_advisor_id=employee_id).all()
-        return jsonify(course_schema.dump(course_list, many=True)), HTTPStatus.OK
+        course_rows = db.session.execute(
+            course_row_serializer.select(Course).where(Course.learning_advisor_id == employee_id)
+        ).all()
+        return jsonify(course_row_serializer.dump(course_rows)), HTTPStatus.OK
 
     except Exception as e:
         return jsonify({
@@ -246,6 +298,7 @@ def advisor_get_courses():
 
 @course_bp.get("/learningadvisor/search")
 @role_required("Learning Advisor")
+@conditional_get("course")
 def advisor_get_course():
     try:
         course_id, course_date, error_response, status_code = get_course_composite_key()
@@ -413,10 +466,12 @@ def advisor_delete_course():
 # Manager Features
 @course_bp.get("/manager/")
 @role_required("Manager")
+@conditional_get("course")
+@cached_response("course")
 def manager_get_courses():
     try:
-        course_list = db.session.query(Course).all()
-        return jsonify(course_schema.dump(course_list, many=True)), HTTPStatus.OK
+        course_rows = db.session.execute(course_row_serializer.select(Course)).all()
+        return jsonify(course_row_serializer.dump(course_rows)), HTTPStatus.OK
 
     except Exception as e:
         return jsonify({
@@ -425,6 +480,7 @@ def manager_get_courses():
 
 @course_bp.get("/manager/search")
 @role_required("Manager")
+@conditional_get("course")
 def manager_get_course():
     try:
         course_id, course_date, error_response, status_code = get_course_composite_key()
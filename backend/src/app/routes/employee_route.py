@@ -4,27 +4,62 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from extensions import db
 from ..auth import role_required
+from ..bulk_import import BulkImporter, import_upload
+from ..cache import conditional_get
 from ..http_status import HTTPStatus
+from ..ids import allocate_ids
 from ..models import Employee
-from ..schemas.employee_schema import employee_schema, employee_schema
+from ..schemas.employee_schema import employee_schema, employee_row_serializer
 
 employee_bp = Blueprint("employee_bp", __name__,  url_prefix="/employee")
 
 # Helper Functions
 def generate_employee_id():
-    last_employee = db.session.query(Employee).order_by(Employee.id.desc()).first()
-    
-    if not last_employee:
-        return "EM001"
-    else:
-        prefix = last_employee.id[:2]
-        employee_number = int(last_employee.id[2:]) + 1
-        
-        return f"{prefix}{employee_number:03}"
-    
+    return allocate_ids(Employee.id, "EM", 1)[0]
+
+EMPLOYEE_ROLES = ("Teacher", "Learning Advisor", "Manager")
+TEACHER_STATUSES = ("Available", "Unavailable")
+
+def employee_row(validated_data):
+    return {
+        "full_name": validated_data["full_name"],
+        "email": validated_data["email"],
+        "nickname": validated_data.get("nickname"),
+        "philosophy": validated_data.get("philosophy"),
+        "achievements": validated_data.get("achievements"),
+        "role": validated_data["role"],
+        "phone_number": validated_data.get("phone_number"),
+        "teacher_status": validated_data.get("teacher_status")
+    }
+
+def employee_row_error(validated_data, allow_manager):
+    """Message for an employee record the CHECK constraints would reject, or None.
+
+    One bad row would otherwise fail the multi-row INSERT of its whole chunk.
+    """
+    role = validated_data["role"]
+    if role not in EMPLOYEE_ROLES:
+        return f"role must be one of {', '.join(EMPLOYEE_ROLES)}"
+    if role == "Manager" and not allow_manager:
+        return "Permission denied for adding Manager"
+    if role == "Teacher" and validated_data.get("teacher_status") not in TEACHER_STATUSES:
+        return f"teacher_status must be one of {', '.join(TEACHER_STATUSES)} for teachers"
+    if role != "Teacher" and validated_data.get("teacher_status") is not None:
+        return "teacher_status is only set for teachers"
+    return None
+
+def employee_importer(allow_manager=False):
+    return BulkImporter(
+        Employee, employee_schema, employee_row,
+        check=lambda validated_data: employee_row_error(validated_data, allow_manager),
+        id_prefix="EM",
+        unique=(("email",), ("phone_number",))
+    )
+
 # General features
 @employee_bp.get("/profile")
 @role_required("Teacher", "Learning Advisor", "Manager")
+@conditional_get("employee")
 def get_employee():
     try:
         employee_id = get_jwt().get("employee_id")
@@ -158,12 +193,41 @@ def manager_create_employee():
             "error": str(e)
         }), HTTPStatus.INTERNAL_SERVER_ERROR
 
+@employee_bp.post("/manager/import")
+@role_required("Manager")
+def manager_import_employees():
+    """Create teachers and learning advisors from a CSV or NDJSON file with the fields of /manager/add."""
+    try:
+        return import_upload(employee_importer())
+
+    except IntegrityError as ie:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(ie.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except OperationalError as oe:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(oe.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
 @employee_bp.get("/manager/")
 @role_required("Manager")
+@conditional_get("employee")
 def manager_get_employees():
     try:
-        employee_list = db.session.query(Employee).all()
-        return jsonify(employee_schema.dump(employee_list, many=True)), HTTPStatus.OK
+        employee_rows = db.session.execute(employee_row_serializer.select(Employee)).all()
+        return jsonify(employee_row_serializer.dump(employee_rows)), HTTPStatus.OK
 
     except Exception as e:
         return jsonify({
@@ -173,6 +237,7 @@ def manager_get_employees():
 
 @employee_bp.get("/manager/search")
 @role_required("Manager")
+@conditional_get("employee")
 def manager_get_employee():
     try:
         id = request.args.get("id")
@@ -247,10 +312,13 @@ def manager_delete_employee():
 # Teacher features
 @employee_bp.get("/teacher/")
 @role_required("Teacher", "Learning Advisor", "Manager")
+@conditional_get("employee")
 def get_available_teacher():
     try:            
-        available_teacher_list = db.session.query(Employee).filter_by(teacher_status="Available")
-        return jsonify(employee_schema.dump(available_teacher_list, many=True)), HTTPStatus.OK
+        available_teacher_rows = db.session.execute(
+            employee_row_serializer.select(Employee).where(Employee.teacher_status == "Available")
+        ).all()
+        return jsonify(employee_row_serializer.dump(available_teacher_rows)), HTTPStatus.OK
     
     except Exception as e:
         return jsonify({
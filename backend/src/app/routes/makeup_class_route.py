@@ -1,7 +1,10 @@
+from datetime import date, timedelta
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import get_jwt
 from marshmallow import ValidationError
+from sqlalchemy import and_, func
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import joinedload
 from extensions import db
 from ..auth import role_required
 from ..models import Course, Class, MakeupClass, Room, Employee
@@ -221,7 +224,8 @@ def advisor_create_makeup_class():
                 course_date=absent_student.course_date,
                 term=absent_student.term,
                 teacher_id=teacher.id,
-                room_id=room.id
+                room_id=room.id,
+                class_date=validated_data["class_date"]
             )
             
             db.session.add(makeup_class)
@@ -266,15 +270,47 @@ def advisor_create_makeup_class():
 def advisor_get_makeup_classes():
     try:
         employee_id = get_jwt().get("employee_id")
-        course_list = db.session.query(Course).filter_by(learning_advisor_id=employee_id)
-        makeup_class_list = []
+        query = db.session.query(MakeupClass).join(
+            Course,
+            and_(
+                Course.id == MakeupClass.course_id,
+                Course.created_date == MakeupClass.course_date
+            )
+        ).filter(
+            Course.learning_advisor_id == employee_id
+        ).options(
+            joinedload(MakeupClass.teacher),
+            joinedload(MakeupClass.room)
+        )
+        
+        # Makeup classes booked before class_date existed only have created_date
+        scheduled_date = func.coalesce(MakeupClass.class_date, MakeupClass.created_date)
+        try:
+            from_date = request.args.get("from_date")
+            if from_date:
+                query = query.filter(scheduled_date >= date.fromisoformat(from_date))
+            
+            to_date = request.args.get("to_date")
+            if to_date:
+                query = query.filter(scheduled_date < date.fromisoformat(to_date) + timedelta(days=1))
+        except ValueError:
+            return jsonify({
+                "message": "Invalid date format; expected YYYY-MM-DD"
+            }), HTTPStatus.BAD_REQUEST
+        
+        query = query.order_by(scheduled_date.desc(), MakeupClass.id)
+        
+        page = request.args.get("page", type=int)
+        if page is not None:
+            per_page = request.args.get("per_page", 20, type=int)
+            if page < 1 or per_page < 1:
+                return jsonify({
+                    "message": "Page and per_page must be positive integers"
+                }), HTTPStatus.BAD_REQUEST
+            
+            query = query.limit(per_page).offset((page - 1) * per_page)
         
-        for course in course_list:
-            makeup_class = db.session.query(MakeupClass).filter_by(
-                course_id=course.id,
-                course_date=course.created_date
-            ).all()
-            makeup_class_list.extend(makeup_class)
+        makeup_class_list = query.all()
         
         return jsonify(makeup_class_schema.dump(makeup_class_list, many=True)), HTTPStatus.OK
     
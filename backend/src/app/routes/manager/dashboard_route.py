@@ -1,10 +1,13 @@
 from flask import Blueprint, request, jsonify
 from app.auth import role_required
+from app.cache import cached_response, response_cache
+from app.sql_profiler import sql_profiler
+from app.attendance_counts import class_absence, course_absence, student_absence, teacher_absence
 from ...http_status import HTTPStatus
 from sqlalchemy.exc import IntegrityError, OperationalError
 from ...models import Employee, Contract, Student, LeaveRequest, StaffCheckin, Class, Course
 from extensions import db
-from sqlalchemy import func, literal, distinct, cast, Integer
+from sqlalchemy import func, literal, distinct, cast, or_, Integer
 from flask_jwt_extended import get_jwt
 import datetime
 
@@ -28,6 +31,16 @@ def get_teacher_id():
     
     return teacher_id, None, None
 
+def get_required_args(*names):
+    values = {name: request.args.get(name) for name in names}
+    missing = [name for name, value in values.items() if not value]
+    if missing:
+        return None, jsonify({
+            "message": f"Missing {', '.join(missing)} in query params"
+        }), HTTPStatus.BAD_REQUEST
+
+    return values, None, None
+
 def validate_teacher(teacher_id):
     teacher = db.session.query(Employee).filter_by(id=teacher_id, role='Teacher').first()
     if not teacher:
@@ -39,6 +52,7 @@ def validate_teacher(teacher_id):
 
 @dashboard_bp.get("/statistics")
 @role_required("Manager")
+@cached_response("employee", "student", "contract")
 def overview_statistics():
     try:
         id = get_jwt().get("employee_id")
@@ -50,10 +64,10 @@ def overview_statistics():
         total_teachers = db.session.query(Employee).filter_by(role='Teacher').count()
         total_learning_advisors = db.session.query(Employee).filter_by(role='Learning Advisor').count()
         total_students = db.session.query(Student).count()
-        paid_contracts = db.session.query(Contract).filter_by(
-            payment_status = 'Paid'
-        ).all()
-        total_revenue = sum([contract.tuition_fee for contract in paid_contracts]) if paid_contracts else 0
+        total_revenue = db.session.query(func.sum(Contract.tuition_fee)).filter(
+            Contract.payment_status == 'Paid'
+        ).scalar()
+        total_revenue = int(total_revenue) if total_revenue else 0
 
         return jsonify({
             "total_employees": total_employees,
@@ -83,6 +97,7 @@ def overview_statistics():
 
 @dashboard_bp.get("/statistics/students")
 @role_required("Manager")
+@cached_response("student", "contract")
 def student_statistics():
     # Total students, students group by age (Elementary, Middle School, High School), students group by class type (Math/English)
     try:
@@ -145,6 +160,7 @@ def student_statistics():
 
 @dashboard_bp.get("/statistics/teachers")
 @role_required("Manager")
+@cached_response("employee")
 def teacher_statistics():
     try:
         id = get_jwt().get("employee_id")
@@ -177,6 +193,7 @@ def teacher_statistics():
 
 @dashboard_bp.get("/statistics/teachers/details")
 @role_required("Manager")
+@cached_response("employee", "leave_request", "staff_checkin", "class", "course")
 def teacher_detail_statistics():
     try:
         id = get_jwt().get("employee_id")
@@ -197,8 +214,6 @@ def teacher_detail_statistics():
             status = 'Approved'
         ).count()
 
-        teaching_hours = 1.5
-
         late_counts = db.session.query(StaffCheckin).filter_by(
                 employee_id = teacher_id,
                 status = 'Late'
@@ -214,21 +229,15 @@ def teacher_detail_statistics():
         late_percentage = (late_counts / total_counts * 100) if total_counts > 0 else 0
         on_time_percentage = (on_time_counts / total_counts * 100) if total_counts > 0 else 0
         
-        total_math_courses = db.session.query(Class).join(Course).filter(
-            Course.id == Class.course_id,
-            Course.id.like("MTH%"),
+        # Every class is one session of its course's scheduled slot
+        subject = func.substr(Course.id, 1, 3)
+        minutes_by_subject = dict(db.session.query(subject, func.sum(Course.session_minutes)).select_from(Course).join(Class).filter(
+            or_(Course.id.like("MTH%"), Course.id.like("ENG%")),
             Class.teacher_id == teacher_id
-        ).count()
+        ).group_by(subject).all())
 
-        total_math_hours = total_math_courses * teaching_hours
-
-        total_english_courses = db.session.query(Class).join(Course).filter(
-            Course.id == Class.course_id,
-            Course.id.like("ENG%"),
-            Class.teacher_id == teacher_id
-        ).count()
-
-        total_english_hours = total_english_courses * teaching_hours
+        total_math_hours = float(minutes_by_subject.get("MTH") or 0) / 60
+        total_english_hours = float(minutes_by_subject.get("ENG") or 0) / 60
 
         return jsonify({
             "leave_counts": leave_counts,
@@ -260,6 +269,7 @@ def teacher_detail_statistics():
 
 @dashboard_bp.get("/statistics/revenue")
 @role_required("Manager")
+@cached_response("contract")
 def revenue_statistics():
     # Total revenue in each month, each term and each school year
     try:
@@ -273,11 +283,16 @@ def revenue_statistics():
         current_year = datetime.datetime.now().year
         revenue_by_year = [0 for _ in range(current_year - start_year + 1)]
 
-        for year in range(start_year, current_year + 1):
-            revenue_by_year[year % start_year] = db.session.query(cast(func.sum(Contract.tuition_fee), Integer)).filter(
-                Contract.payment_status == 'Paid',
-                func.extract('year', Contract.start_date) == year
-            ).scalar() or 0
+        # A range on start_date lets (payment_status, start_date) serve every year in one scan
+        contract_year = func.extract('year', Contract.start_date)
+        yearly_revenue = db.session.query(contract_year, cast(func.sum(Contract.tuition_fee), Integer)).filter(
+            Contract.payment_status == 'Paid',
+            Contract.start_date >= datetime.date(start_year, 1, 1),
+            Contract.start_date < datetime.date(current_year + 1, 1, 1)
+        ).group_by(contract_year).all()
+
+        for year, revenue in yearly_revenue:
+            revenue_by_year[int(year) - start_year] = revenue or 0
 
         return jsonify({
             "revenue_by_year": revenue_by_year
@@ -298,4 +313,102 @@ def revenue_statistics():
     except Exception as e:
         return jsonify({
             "message": str(e)
-        }), HTTPStatus.INTERNAL_SERVER_ERROR
\ No newline at end of file
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+# Absence rates are read from the attendance counters, never from student_attendance itself
+@dashboard_bp.get("/statistics/absence/students")
+@role_required("Manager")
+@cached_response("student_attendance", "enrolment", "course")
+def student_absence_statistics():
+    try:
+        args, error_response, status = get_required_args("student_id")
+        if not args:
+            return error_response, status
+
+        student = db.session.get(Student, args["student_id"])
+        if not student:
+            return jsonify({
+                "message": "Student not found"
+            }), HTTPStatus.NOT_FOUND
+
+        return jsonify(student_absence(student.id)), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+@dashboard_bp.get("/statistics/absence/classes")
+@role_required("Manager")
+@cached_response("student_attendance")
+def class_absence_statistics():
+    try:
+        args, error_response, status = get_required_args("class_id", "course_id", "course_date", "term")
+        if not args:
+            return error_response, status
+
+        class_ = db.session.get(Class, (args["class_id"], args["course_id"], args["course_date"], args["term"]))
+        if not class_:
+            return jsonify({
+                "message": "Class not found"
+            }), HTTPStatus.NOT_FOUND
+
+        return jsonify(class_absence(class_.id, class_.course_id, class_.course_date, class_.term)), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+@dashboard_bp.get("/statistics/absence/courses")
+@role_required("Manager")
+@cached_response("student_attendance", "enrolment")
+def course_absence_statistics():
+    try:
+        args, error_response, status = get_required_args("course_id", "course_date")
+        if not args:
+            return error_response, status
+
+        course = db.session.get(Course, (args["course_id"], args["course_date"]))
+        if not course:
+            return jsonify({
+                "message": "Course not found"
+            }), HTTPStatus.NOT_FOUND
+
+        return jsonify(course_absence(course.id, course.created_date)), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+@dashboard_bp.get("/statistics/absence/teachers")
+@role_required("Manager")
+@cached_response("student_attendance", "class", "employee")
+def teacher_absence_statistics():
+    try:
+        teacher_id, error_response, status = get_teacher_id()
+        if not teacher_id:
+            return error_response, status
+
+        teacher, error_response, status = validate_teacher(teacher_id)
+        if not teacher:
+            return error_response, status
+
+        return jsonify(teacher_absence(teacher.id)), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+@dashboard_bp.get("/cache")
+@role_required("Manager")
+def response_cache_statistics():
+    return jsonify(response_cache.stats()), HTTPStatus.OK
+
+
+@dashboard_bp.get("/sql_profile")
+@role_required("Manager")
+def sql_profile_report():
+    return jsonify(sql_profiler.report()), HTTPStatus.OK
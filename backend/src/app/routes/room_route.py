@@ -3,23 +3,17 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from extensions import db
 from ..auth import role_required
+from ..cache import conditional_get, cached_response
 from ..models import Room
-from ..schemas.room_schema import room_schema
+from ..schemas.room_schema import room_schema, room_row_serializer
 from ..http_status import HTTPStatus
+from ..ids import allocate_ids
 
 room_bp = Blueprint("room_bp", __name__, url_prefix="/room")
 
 # Helper Functions
 def generate_room_id():
-    last_room = db.session.query(Room).order_by(Room.id.desc()).first()
-    
-    if not last_room:
-        return "ROOM001"
-    else:
-        prefix = last_room.id[:4]
-        room_number = int(last_room.id[4:]) + 1
-        
-        return f"{prefix}{room_number:03}"
+    return allocate_ids(Room.id, "ROOM", 1)[0]
 
 def get_room_id():
     room_id = request.args.get("id")
@@ -92,10 +86,12 @@ def manager_create_room():
         
 @room_bp.get("/manager/")
 @role_required("Manager")
+@conditional_get("room")
+@cached_response("room")
 def manager_get_rooms():
     try:
-        room_list = db.session.query(Room).all()
-        return jsonify(room_schema.dump(room_list, many=True)), HTTPStatus.OK
+        room_rows = db.session.execute(room_row_serializer.select(Room)).all()
+        return jsonify(room_row_serializer.dump(room_rows)), HTTPStatus.OK
     
     except Exception as e:
         return jsonify({
@@ -105,6 +101,7 @@ def manager_get_rooms():
 
 @room_bp.get("/manager/search")
 @role_required("Manager")
+@conditional_get("room")
 def manager_get_room():
     try:
         room_id, error_response, status_code = get_room_id()
@@ -0,0 +1,61 @@
+from flask import Blueprint, request, jsonify
+from ..auth import role_required
+from ..cache import conditional_get
+from ..search import ENTITY_TYPES, load_results, search
+from ..http_status import HTTPStatus
+
+search_bp = Blueprint("search_bp", __name__, url_prefix="/search")
+
+MAX_LIMIT = 100
+
+# Helper Functions
+def get_search_query():
+    query = (request.args.get("q") or "").strip()
+    if len(query) < 2:
+        return None, jsonify({
+            "message": "Search query needs at least 2 characters"
+        }), HTTPStatus.BAD_REQUEST
+
+    return query, None, None
+
+def get_entity_types():
+    types = request.args.get("type")
+    if not types:
+        return ENTITY_TYPES, None, None
+
+    entity_types = tuple(entity_type.strip() for entity_type in types.split(","))
+    unknown = [entity_type for entity_type in entity_types if entity_type not in ENTITY_TYPES]
+    if unknown:
+        return None, jsonify({
+            "message": f"Unknown search type: {', '.join(unknown)}; expected {', '.join(ENTITY_TYPES)}"
+        }), HTTPStatus.BAD_REQUEST
+
+    return entity_types, None, None
+
+@search_bp.get("/")
+@role_required("Learning Advisor", "Manager")
+@conditional_get("student", "employee", "course", "room")
+def global_search():
+    try:
+        query, error_response, status_code = get_search_query()
+        if not query:
+            return error_response, status_code
+
+        entity_types, error_response, status_code = get_entity_types()
+        if not entity_types:
+            return error_response, status_code
+
+        limit = min(max(request.args.get("limit", default=20, type=int), 1), MAX_LIMIT)
+        results = load_results(search(query, entity_types, limit))
+
+        return jsonify({
+            "query": query,
+            "count": len(results),
+            "results": results
+        }), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
@@ -3,25 +3,30 @@ from marshmallow import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError
 from extensions import db
 from ..auth import role_required
+from ..bulk_import import BulkImporter, import_upload
+from ..cache import conditional_get
 from ..models import Student, Class
-from ..schemas.learning_advisor.student_schema import student_schema
+from ..schemas.learning_advisor.student_schema import student_schema, student_row_serializer
 from ..http_status import HTTPStatus
 from ..models import Enrolment
+from ..ids import allocate_ids
 
 
 student_bp = Blueprint("student_bp", __name__, url_prefix="/student")
 
 # Helper Functions
 def generate_student_id():
-    last_student = db.session.query(Student).order_by(Student.id.desc()).first()
-    
-    if not last_student:
-        return "STU001"
-    else:
-        prefix = last_student.id[:3]
-        student_number = int(last_student.id[3:]) + 1
-        
-        return f"{prefix}{student_number:03}"
+    return allocate_ids(Student.id, "STU", 1)[0]
+
+def student_row(validated_data):
+    return {
+        "fullname": validated_data["fullname"],
+        "contact_info": validated_data["contact_info"],
+        "date_of_birth": validated_data["date_of_birth"]
+    }
+
+def student_importer():
+    return BulkImporter(Student, student_schema, student_row, id_prefix="STU")
 
 def get_student_id():
     id = request.args.get("id")
@@ -44,10 +49,11 @@ def validate_student(student_id):
 # General Features
 @student_bp.get("/")
 @role_required("Learning Advisor", "Manager")
+@conditional_get("student")
 def get_students():
     try:
-        student_list = db.session.query(Student).all()
-        return jsonify(student_schema.dump(student_list, many=True)), HTTPStatus.OK
+        student_rows = db.session.execute(student_row_serializer.select(Student)).all()
+        return jsonify(student_row_serializer.dump(student_rows)), HTTPStatus.OK
     
     except Exception as e:
         db.session.rollback()
@@ -58,6 +64,7 @@ def get_students():
 
 @student_bp.get("/search")
 @role_required("Learning Advisor", "Manager")
+@conditional_get("student")
 def get_student():
     try:
         id, error_response, status_code = get_student_id()
@@ -127,6 +134,34 @@ def advisor_create_student():
             "error": str(e)
         }), HTTPStatus.INTERNAL_SERVER_ERROR
 
+@student_bp.post("/learningadvisor/import")
+@role_required("Learning Advisor")
+def advisor_import_students():
+    """Create students from a CSV or NDJSON file with the fields of /learningadvisor/add."""
+    try:
+        return import_upload(student_importer())
+
+    except IntegrityError as ie:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(ie.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except OperationalError as oe:
+        db.session.rollback()
+        return jsonify({
+            "message": "Violate database constraint",
+            "error": str(oe.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
 @student_bp.put("/learningadvisor/update")
 @role_required("Learning Advisor")
 def advisor_update_student():
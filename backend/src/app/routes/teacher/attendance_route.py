@@ -209,19 +209,23 @@ def mark_attendance():
         validated = list_attendance_schema.load(data)
         records = validated["marks"]
 
-        updated_records = 0
-        for record in records:
-            student_id = record["student_id"]
-            status = record["status"]
-
-            attendance_record = db.session.query(StudentAttendance).filter_by(
-                student_id=student_id,
+        # Load the roster once, so the changes are flushed (and counted) together on commit
+        attendance_records = {
+            attendance_record.student_id: attendance_record
+            for attendance_record in db.session.query(StudentAttendance).filter_by(
                 class_id=class_id,
                 course_id=course_id,
                 course_date=course_date,
                 term=term
-            ).first()
+            )
+        }
+
+        updated_records = 0
+        for record in records:
+            student_id = record["student_id"]
+            status = record["status"]
 
+            attendance_record = attendance_records.get(student_id)
             if attendance_record:
                 if attendance_record.status != status:
                     attendance_record.status = status
@@ -1,16 +1,20 @@
 from flask import Blueprint, request, jsonify, send_from_directory, current_app, url_for
 from flask_jwt_extended import get_jwt
 from app.auth import role_required
+from app.cache import any_scope, cached_response, mark_changed, scoped_table_name
+from app.grade_distribution import ASSESSMENT_TYPES, class_filter, course_filter, grade_distribution, is_valid_grade, teacher_filter
 from marshmallow import ValidationError
 from ...http_status import HTTPStatus
+from sqlalchemy import and_, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.exc import IntegrityError, OperationalError
-from ...schemas.evaluation_schema import evaluation_schema
+from ...schemas.evaluation_schema import class_grading_schema, evaluation_schema, evaluation_row_serializer
+from ...schemas.learning_advisor.student_schema import student_row_serializer
 from ...models import Evaluation, Student, Employee, Enrolment, StudentAttendance, Course, Class
-from ...models.pdf import generate_report
-from ...models.pdf_weasy import render_report_html_to_pdf
+from ...models.pdf_weasy import logo_data_uri, render_report_html_to_pdf
 from extensions import db
-import base64
 import datetime, os
+from collections import Counter
 from pathlib import Path
 
 evaluation_bp = Blueprint("evaluation_bp", __name__, url_prefix="/evaluation")
@@ -104,6 +108,73 @@ def validate_course(course_id):
     
     return course, None, None
 
+def parse_course_date(course_date_str):
+    try:
+        return datetime.date.fromisoformat(course_date_str)
+    except (TypeError, ValueError):
+        return None
+
+def distribution_teacher_id():
+    # Teachers only see the distribution of their own evaluations
+    claims = get_jwt()
+    if claims.get("role") == "Teacher":
+        return claims.get("employee_id")
+    return request.args.get("teacher_id")
+
+def course_distribution_tables():
+    course_date = parse_course_date(request.args.get("course_date"))
+    if not request.args.get("course_id") or not course_date:
+        return ()
+    return (scoped_table_name("evaluation", "course", request.args["course_id"], course_date), any_scope("evaluation"))
+
+def class_distribution_tables():
+    course_tables = course_distribution_tables()
+    if not course_tables or not request.args.get("class_id") or not request.args.get("term", "").isdigit():
+        return course_tables
+    roster_scope = scoped_table_name(
+        "student_attendance", "class", request.args["class_id"], request.args["course_id"],
+        parse_course_date(request.args["course_date"]), int(request.args["term"])
+    )
+    return (*course_tables, roster_scope, any_scope("student_attendance"))
+
+def teacher_distribution_tables():
+    teacher_id = distribution_teacher_id()
+    if not teacher_id:
+        return ()
+    return (scoped_table_name("evaluation", "teacher", teacher_id), any_scope("evaluation"))
+
+def get_distribution_assessment_type():
+    assessment_type = request.args.get("assessment_type")
+    if assessment_type and assessment_type not in ASSESSMENT_TYPES:
+        return None, jsonify({
+            "message": "Invalid assessment type"
+        }), HTTPStatus.BAD_REQUEST
+
+    return assessment_type or "", None, None
+
+def get_distribution_course():
+    course_id, response, status = get_course_id()
+    if not course_id:
+        return None, response, status
+
+    course_date_str, response, status = get_course_date()
+    if not course_date_str:
+        return None, response, status
+
+    course_date = parse_course_date(course_date_str)
+    if not course_date:
+        return None, jsonify({
+            "message": "Invalid course_date format; expected YYYY-MM-DD"
+        }), HTTPStatus.BAD_REQUEST
+
+    course = db.session.get(Course, (course_id, course_date))
+    if not course:
+        return None, jsonify({
+            "message": "Course not found"
+        }), HTTPStatus.NOT_FOUND
+
+    return course, None, None
+
 @evaluation_bp.get("/by-class")
 @role_required("Teacher", "Learning Advisor", "Manager")
 def get_class_students_with_evaluations():
@@ -145,47 +216,43 @@ def get_class_students_with_evaluations():
             }), HTTPStatus.NOT_FOUND
 
         # Collect students in this class
-        students = [sa.student for sa in class_.student_attendance]
+        student_rows = db.session.execute(
+            student_row_serializer.select(Student).join(
+                StudentAttendance, StudentAttendance.student_id == Student.id
+            ).where(
+                StudentAttendance.class_id == class_.id,
+                StudentAttendance.course_id == class_.course_id,
+                StudentAttendance.course_date == class_.course_date,
+                StudentAttendance.term == class_.term
+            )
+        ).all()
+        students = student_row_serializer.dump(student_rows)
 
         # If the caller is a Teacher, restrict to their evaluations; otherwise include all
         jwt_employee_id = get_jwt().get("employee_id")
         teacher_obj, _, _ = validate_teacher(jwt_employee_id)
         teacher_filter_id = teacher_obj.id if teacher_obj else None
 
-        result = []
-        for s in students:
-            query = (
-                db.session.query(Evaluation)
-                .filter_by(student_id=s.id, course_id=course_id, course_date=course_date)
+        evaluations_by_student = {s["id"]: [] for s in students}
+        if students:
+            query = evaluation_row_serializer.select(Evaluation).where(
+                Evaluation.student_id.in_(list(evaluations_by_student)),
+                Evaluation.course_id == course_id,
+                Evaluation.course_date == course_date
             )
             if teacher_filter_id:
-                query = query.filter_by(teacher_id=teacher_filter_id)
-            evals = query.all()
-
-            eval_payload = [
-                {
-                    "student_id": e.student_id,
-                    "course_id": e.course_id,
-                    "course_date": e.course_date.isoformat() if e.course_date else None,
-                    "assessment_type": e.assessment_type,
-                    "teacher_id": e.teacher_id,
-                    "grade": e.grade,
-                    "comment": e.comment,
-                    "enrolment_id": e.enrolment_id,
-                    "evaluation_date": e.evaluation_date.isoformat() if e.evaluation_date else None,
-                }
-                for e in evals
-            ]
-
-            result.append({
-                "student": {
-                    "id": s.id,
-                    "fullname": s.fullname,
-                    "contact_info": s.contact_info,
-                    "date_of_birth": s.date_of_birth.isoformat() if s.date_of_birth else None,
-                },
-                "evaluations": eval_payload,
-            })
+                query = query.where(Evaluation.teacher_id == teacher_filter_id)
+
+            for e in evaluation_row_serializer.dump(db.session.execute(query).all()):
+                evaluations_by_student[e["student_id"]].append(e)
+
+        result = [
+            {
+                "student": s,
+                "evaluations": evaluations_by_student[s["id"]],
+            }
+            for s in students
+        ]
 
         return jsonify({
             "message": "Class students with evaluations retrieved successfully",
@@ -198,6 +265,93 @@ def get_class_students_with_evaluations():
             "error": str(e)
         }), HTTPStatus.INTERNAL_SERVER_ERROR
     
+def grade_class(class_, assessment_type, grades, teacher_id):
+    """Write one assessment's grades for a class's roster with a single upsert; return per-student outcomes.
+
+    The roster, its enrolments and any earlier grades come from one query.
+    """
+    listed = Counter(mark["student_id"] for mark in grades)
+    # Filled in request order; None until the student's grade is resolved
+    outcomes = {}
+    marks = {}
+    for mark in grades:
+        student_id = mark["student_id"]
+        if listed[student_id] > 1:
+            outcomes[student_id] = {"status": "duplicate", "error": "Student listed more than once"}
+        elif not is_valid_grade(mark["grade"]):
+            outcomes[student_id] = {"status": "invalid", "error": "Invalid grade"}
+        else:
+            outcomes[student_id] = None
+            marks[student_id] = mark
+
+    roster = db.session.execute(
+        select(
+            StudentAttendance.student_id,
+            StudentAttendance.enrolment_id,
+            Evaluation.teacher_id,
+            Evaluation.grade,
+            Evaluation.comment
+        ).outerjoin(Evaluation, and_(
+            Evaluation.student_id == StudentAttendance.student_id,
+            Evaluation.course_id == StudentAttendance.course_id,
+            Evaluation.course_date == StudentAttendance.course_date,
+            Evaluation.assessment_type == assessment_type
+        )).where(
+            StudentAttendance.class_id == class_.id,
+            StudentAttendance.course_id == class_.course_id,
+            StudentAttendance.course_date == class_.course_date,
+            StudentAttendance.term == class_.term,
+            StudentAttendance.student_id.in_(marks)
+        )
+    ).all() if marks else []
+    enrolled = {row.student_id: row for row in roster}
+
+    rows = []
+    previous_teachers = set()
+    today = datetime.date.today()
+    for student_id, mark in marks.items():
+        row = enrolled.get(student_id)
+        if not row:
+            outcomes[student_id] = {"status": "not_enrolled", "error": "Student is not in this class"}
+            continue
+
+        if row.grade is None:
+            status = "created"
+        elif (row.grade, row.comment, row.teacher_id) == (mark["grade"], mark["comment"], teacher_id):
+            outcomes[student_id] = {"status": "unchanged", "grade": row.grade}
+            continue
+        else:
+            status = "updated"
+            previous_teachers.add(row.teacher_id)
+
+        outcomes[student_id] = {"status": status, "grade": mark["grade"], **({"previous": row.grade} if row.grade is not None else {})}
+        rows.append({
+            "student_id": student_id,
+            "course_id": class_.course_id,
+            "course_date": class_.course_date,
+            "assessment_type": assessment_type,
+            "teacher_id": teacher_id,
+            "grade": mark["grade"],
+            "comment": mark["comment"],
+            "enrolment_id": row.enrolment_id,
+            "evaluation_date": today
+        })
+
+    if rows:
+        statement = mysql_insert(Evaluation).values(rows)
+        statement = statement.on_duplicate_key_update({
+            column: getattr(statement.inserted, column)
+            for column in ("teacher_id", "grade", "comment", "enrolment_id", "evaluation_date")
+        })
+        # Run outside the ORM, so only the scopes written below are invalidated rather than every evaluation scope
+        db.session.connection().execute(statement)
+        mark_changed(db.session, Evaluation.__tablename__)
+        mark_changed(db.session, scoped_table_name(Evaluation.__tablename__, "course", class_.course_id, class_.course_date))
+        for changed_teacher_id in {teacher_id, *previous_teachers}:
+            mark_changed(db.session, scoped_table_name(Evaluation.__tablename__, "teacher", changed_teacher_id))
+
+    return [{"student_id": student_id, **outcome} for student_id, outcome in outcomes.items()]
+
 @evaluation_bp.post("/create")
 @role_required("Teacher")
 def add_evaluation():
@@ -300,6 +454,66 @@ def add_evaluation():
             "error": str(e)
         }), HTTPStatus.INTERNAL_SERVER_ERROR
     
+@evaluation_bp.post("/class")
+@role_required("Teacher")
+def grade_class_evaluations():
+    """Create or update one assessment's grades for a whole class in one transaction."""
+    try:
+        if not request.is_json:
+            return jsonify({
+                "message": "Request must be JSON"
+            }), HTTPStatus.BAD_REQUEST
+
+        validated = class_grading_schema.load(request.get_json())
+
+        teacher_id = get_jwt().get("employee_id")
+        class_ = db.session.get(Class, (validated["class_id"], validated["course_id"], validated["course_date"], validated["term"]))
+        if not class_:
+            return jsonify({
+                "message": "Class not found"
+            }), HTTPStatus.NOT_FOUND
+        if class_.teacher_id != teacher_id:
+            return jsonify({
+                "message": "Teacher is not assigned to this class"
+            }), HTTPStatus.FORBIDDEN
+
+        results = grade_class(class_, validated["assessment_type"], validated["grades"], teacher_id)
+        db.session.commit()
+
+        counts = {status: sum(result["status"] == status for result in results) for status in ("created", "updated", "unchanged")}
+        return jsonify({
+            "assessment_type": validated["assessment_type"],
+            **counts,
+            "results": results
+        }), HTTPStatus.OK
+
+    except ValidationError as ve:
+        return jsonify({
+            "message": "Validation error",
+            "errors": ve.messages
+        }), HTTPStatus.BAD_REQUEST
+
+    except IntegrityError as ie:
+        db.session.rollback()
+        return jsonify({
+            "message": "Integrity error",
+            "error": str(ie.orig)
+        }), HTTPStatus.BAD_REQUEST
+
+    except OperationalError as oe:
+        db.session.rollback()
+        return jsonify({
+            "message": "Database connection error",
+            "error": str(oe)
+        }), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            "message": "An error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
 @evaluation_bp.put("/update")
 @role_required("Teacher")
 def update_evaluation():
@@ -452,6 +666,7 @@ def export_evaluation():
         engine = (request.args.get("engine") or "weasy").lower()
         if engine == "fpdf":
             # Existing FPDF flow
+            from ...models.pdf import generate_report
             generate_report(pdf_data, str(output_path), str(logo_path))
         else:
             # Default: WeasyPrint HTML → PDF
@@ -464,7 +679,7 @@ def export_evaluation():
             if logo_path is not None:
                 try:
                     # Prioritize data URI for better portability with WeasyPrint
-                    project_logo = "data:image/png;base64," + base64.b64encode(logo_path.read_bytes()).decode("ascii")
+                    project_logo = logo_data_uri(str(logo_path))
                 except Exception:
                     # Fallback to file URI if encoding fails
                     try:
@@ -484,7 +699,7 @@ def export_evaluation():
             }
 
             # Compute filesystem CSS path to avoid HTTP fetch during render
-            css_path = backend_root / "src" / "app" / "static" / "pdf" / "report_card.css"
+            css_path = Path(current_app.static_folder) / "pdf" / "report_card.css"
             render_report_html_to_pdf(
                 data_ctx,
                 output_path=str(output_path),
@@ -518,40 +733,24 @@ def get_evaluation():
         course_date_str = request.args.get("course_date")
         assessment_type = request.args.get("assessment_type")
 
-        query = db.session.query(Evaluation).filter_by(teacher_id=id)
+        query = evaluation_row_serializer.select(Evaluation).where(Evaluation.teacher_id == id)
 
         if student_id:
-            query = query.filter_by(student_id=student_id)
+            query = query.where(Evaluation.student_id == student_id)
         if course_id:
-            query = query.filter_by(course_id=course_id)
+            query = query.where(Evaluation.course_id == course_id)
         if course_date_str:
             try:
                 course_date = datetime.date.fromisoformat(course_date_str)
-                query = query.filter_by(course_date=course_date)
+                query = query.where(Evaluation.course_date == course_date)
             except ValueError:
                 return jsonify({
                     "message": "Invalid course_date format; expected YYYY-MM-DD"
                 }), HTTPStatus.BAD_REQUEST
         if assessment_type:
-            query = query.filter_by(assessment_type=assessment_type)
+            query = query.where(Evaluation.assessment_type == assessment_type)
 
-        evaluations = query.all()
-
-        # Serialize minimally
-        data = [
-            {
-                "student_id": e.student_id,
-                "course_id": e.course_id,
-                "course_date": e.course_date.isoformat() if e.course_date else None,
-                "assessment_type": e.assessment_type,
-                "teacher_id": e.teacher_id,
-                "grade": e.grade,
-                "comment": e.comment,
-                "enrolment_id": e.enrolment_id,
-                "evaluation_date": e.evaluation_date.isoformat() if e.evaluation_date else None,
-            }
-            for e in evaluations
-        ]
+        data = evaluation_row_serializer.dump(db.session.execute(query).all())
 
         return jsonify({
             "message": "Evaluations retrieved successfully",
@@ -561,4 +760,104 @@ def get_evaluation():
         return jsonify({
             "message": "An error occurred",
             "error": str(e)
-        }), HTTPStatus.INTERNAL_SERVER_ERROR
\ No newline at end of file
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+# Grade distributions are cached until an evaluation of the same course (or teacher) is written
+@evaluation_bp.get("/distribution/course")
+@role_required("Teacher", "Learning Advisor", "Manager")
+@cached_response(course_distribution_tables)
+def get_course_grade_distribution():
+    try:
+        assessment_type, response, status = get_distribution_assessment_type()
+        if assessment_type is None:
+            return response, status
+
+        course, response, status = get_distribution_course()
+        if not course:
+            return response, status
+
+        distribution = grade_distribution(
+            *course_filter(course.id, course.created_date), assessment_type=assessment_type
+        )
+
+        return jsonify({
+            "course_id": course.id,
+            "course_date": course.created_date.isoformat(),
+            **distribution
+        }), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": "An error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+@evaluation_bp.get("/distribution/class")
+@role_required("Teacher", "Learning Advisor", "Manager")
+@cached_response(class_distribution_tables)
+def get_class_grade_distribution():
+    try:
+        assessment_type, response, status = get_distribution_assessment_type()
+        if assessment_type is None:
+            return response, status
+
+        course, response, status = get_distribution_course()
+        if not course:
+            return response, status
+
+        class_ = db.session.get(Class, (request.args.get("class_id"), course.id, course.created_date, request.args.get("term")))
+        if not class_:
+            return jsonify({
+                "message": "Class not found"
+            }), HTTPStatus.NOT_FOUND
+
+        distribution = grade_distribution(
+            *class_filter(class_.id, class_.course_id, class_.course_date, class_.term), assessment_type=assessment_type
+        )
+
+        return jsonify({
+            "class_id": class_.id,
+            "course_id": class_.course_id,
+            "course_date": class_.course_date.isoformat(),
+            "term": class_.term,
+            **distribution
+        }), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": "An error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+@evaluation_bp.get("/distribution/teacher")
+@role_required("Teacher", "Learning Advisor", "Manager")
+@cached_response(teacher_distribution_tables)
+def get_teacher_grade_distribution():
+    try:
+        assessment_type, response, status = get_distribution_assessment_type()
+        if assessment_type is None:
+            return response, status
+
+        teacher_id = distribution_teacher_id()
+        if not teacher_id:
+            return jsonify({
+                "message": "Missing teacher ID in query params"
+            }), HTTPStatus.BAD_REQUEST
+
+        teacher, response, status = validate_teacher(teacher_id)
+        if not teacher:
+            return response, status
+
+        distribution = grade_distribution(*teacher_filter(teacher.id), assessment_type=assessment_type)
+
+        return jsonify({
+            "teacher_id": teacher.id,
+            "teacher_name": teacher.full_name,
+            **distribution
+        }), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": "An error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
@@ -6,20 +6,14 @@ from ...http_status import HTTPStatus
 from sqlalchemy.exc import IntegrityError, OperationalError
 from ...schemas.teacher.issue_schema import issue_schema
 from ...models import Issue, Account, Student, Room, Employee
+from ...ids import allocate_ids
 from extensions import db
 import datetime
 
 issue_bp = Blueprint("issue_bp", __name__, url_prefix="/issue")
 def generate_id():
-    last_id = db.session.query(Issue).order_by(Issue.id.desc()).first()
-
-    if not last_id:
-        return "ISS001"
-    else:
-        prefix = last_id.id[:3]
-        last_number = int(last_id.id[3:]) + 1
-        return f"{prefix}{last_number:03}"
-    
+    return allocate_ids(Issue.id, "ISS", 1)[0]
+
 def get_student_issue(student_id):
     student_issue = db.session.query(Issue).filter_by(student_id=student_id).first()
     if not student_issue:
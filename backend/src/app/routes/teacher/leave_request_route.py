@@ -1,26 +1,22 @@
+import datetime
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import get_jwt_identity, get_jwt
 from app.auth import role_required
 from marshmallow import ValidationError
 from ...http_status import HTTPStatus
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError, OperationalError
 from ...schemas.teacher.leave_request_schema import leave_request_schema
-from ...models import LeaveRequest, Account, Employee
+from ...models import LeaveRequest, Account, Employee, Class, MakeupClass
+from ...timetable import session_dict, session_end, timetable_query
+from ...ids import allocate_ids
 from extensions import db
 
 leave_request_bp = Blueprint("leave_request_bp", __name__, url_prefix="/leave_request")
 
 def generate_id():
-    last_request = db.session.query(LeaveRequest).order_by(LeaveRequest.id.desc()).first()
+    return allocate_ids(LeaveRequest.id, "LR", 1)[0]
 
-    if not last_request:
-        return "LR001"
-    else:
-        prefix = last_request.id[:2]
-        next_number = int(last_request.id[2:]) + 1
-
-        return f"{prefix}{next_number:03}"
-    
 def get_employee_id():
     id = request.args.get("employee_id")
 
@@ -49,6 +45,45 @@ def validate_leave_request(id):
     
     return leave_request, None, None
 
+def leave_window(leave_request):
+    # The leave covers its end date, so sessions up to the next midnight move
+    starts_from = datetime.datetime.combine(leave_request.start_date, datetime.time.min)
+    ends_before = datetime.datetime.combine(leave_request.end_date + datetime.timedelta(days=1), datetime.time.min)
+    return starts_from, ends_before
+
+def sessions_overlap(session, other):
+    # A session of unknown length only clashes with sessions running when it starts
+    if session.starts_at == other.starts_at:
+        return True
+    return session.starts_at < (session_end(other) or other.starts_at) and other.starts_at < (session_end(session) or session.starts_at)
+
+def reassign_sessions(leave_request, substitute):
+    """Hand the class and makeup sessions in the leave to ``substitute`` with one UPDATE per table.
+
+    Returns (sessions, conflicts); nothing is changed when the substitute's
+    own sessions clash with any of them.
+    """
+    starts_from, ends_before = leave_window(leave_request)
+    sessions = db.session.execute(timetable_query(starts_from, ends_before, teacher_id=leave_request.employee_id)).all()
+    if not sessions:
+        return [], []
+
+    substitute_sessions = db.session.execute(timetable_query(starts_from, ends_before, teacher_id=substitute.id)).all()
+    conflicts = [(session, other) for session in sessions for other in substitute_sessions if sessions_overlap(session, other)]
+    if conflicts:
+        return sessions, conflicts
+
+    for model in (Class, MakeupClass):
+        db.session.execute(
+            update(model).where(
+                model.teacher_id == leave_request.employee_id,
+                model.class_date >= starts_from,
+                model.class_date < ends_before
+            ).values(teacher_id=substitute.id),
+            execution_options={"synchronize_session": False}
+        )
+    return sessions, []
+
 def validate_employee(employee_id):
     employee = db.session.query(Employee).filter_by(id=employee_id).first()
 
@@ -242,7 +277,8 @@ def get_personal_leave_requests():
 @role_required("Manager")
 def approve_leave_request(leave_request_id):
     try:
-        leave_request = db.session.query(LeaveRequest).filter_by(id=leave_request_id).first()
+        # Locked so two approvals of the same request cannot both reassign its sessions
+        leave_request = db.session.query(LeaveRequest).filter_by(id=leave_request_id).with_for_update().first()
         if not leave_request:
             return jsonify({
                 "message": "Leave request not found"
@@ -261,11 +297,34 @@ def approve_leave_request(leave_request_id):
                 "message": "Invalid status. Must be 'Approved' or 'Not Approved'."
             }), HTTPStatus.BAD_REQUEST
         
+        sessions, substitute = [], None
+        if status == "Approved" and leave_request.substitute_id:
+            substitute = db.session.get(Employee, leave_request.substitute_id)
+            if not substitute or substitute.role != "Teacher":
+                return jsonify({
+                    "message": "Substitute is not a teacher"
+                }), HTTPStatus.CONFLICT
+
+            sessions, conflicts = reassign_sessions(leave_request, substitute)
+            if conflicts:
+                db.session.rollback()
+                return jsonify({
+                    "message": "Substitute has overlapping sessions",
+                    "conflicts": [
+                        {"session": session_dict(session), "substitute_session": session_dict(other)}
+                        for session, other in conflicts
+                    ]
+                }), HTTPStatus.CONFLICT
+
         leave_request.status = status
         db.session.commit()
         
         return jsonify({
-            "message": f"Leave request {status.lower()} successfully"
+            "message": f"Leave request {status.lower()} successfully",
+            "reassigned_sessions": [
+                {**session_dict(session), "teacher_id": substitute.id, "teacher_name": substitute.full_name}
+                for session in sessions
+            ]
         }), HTTPStatus.OK
     
     except IntegrityError as ie:
@@ -0,0 +1,146 @@
+import datetime
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from flask_jwt_extended import get_jwt
+from extensions import db
+from ..auth import role_required
+from ..cache import conditional_get
+from ..models import Employee, Room, Student
+from ..timetable import ics_events, session_dict, timetable_query
+from ..http_status import HTTPStatus
+
+timetable_bp = Blueprint("timetable_bp", __name__, url_prefix="/timetable")
+
+MAX_RANGE_DAYS = 366
+# Rows fetched per round trip while streaming the calendar
+STREAM_BATCH_SIZE = 500
+
+TIMETABLE_TABLES = ("class", "makeup_class", "course", "room", "employee", "student_attendance")
+
+# Helper Functions
+def get_date_range():
+    try:
+        from_date = datetime.date.fromisoformat(request.args.get("from") or datetime.date.today().isoformat())
+        to_date = datetime.date.fromisoformat(request.args.get("to") or (from_date + datetime.timedelta(days=6)).isoformat())
+    except ValueError:
+        return None, None, jsonify({
+            "message": "Invalid date format; expected YYYY-MM-DD"
+        }), HTTPStatus.BAD_REQUEST
+
+    if to_date < from_date:
+        return None, None, jsonify({
+            "message": "'to' must not be before 'from'"
+        }), HTTPStatus.BAD_REQUEST
+
+    if (to_date - from_date).days >= MAX_RANGE_DAYS:
+        return None, None, jsonify({
+            "message": f"Date range is limited to {MAX_RANGE_DAYS} days"
+        }), HTTPStatus.BAD_REQUEST
+
+    return from_date, to_date, None, None
+
+def get_timetable_owner():
+    """Return the filter and display name of the calendar; teachers only get their own."""
+    claims = get_jwt()
+    owners = {
+        key: request.args.get(key)
+        for key in ("teacher_id", "room_id", "student_id")
+        if request.args.get(key)
+    }
+
+    if claims.get("role") == "Teacher":
+        if owners and owners != {"teacher_id": claims.get("employee_id")}:
+            return None, None, jsonify({
+                "message": "Teachers can only view their own timetable"
+            }), HTTPStatus.FORBIDDEN
+        owners = {"teacher_id": claims.get("employee_id")}
+
+    if len(owners) != 1:
+        return None, None, jsonify({
+            "message": "Exactly one of teacher_id, room_id or student_id is required"
+        }), HTTPStatus.BAD_REQUEST
+
+    (key, owner_id), = owners.items()
+    if key == "teacher_id":
+        owner = db.session.query(Employee).filter_by(id=owner_id, role='Teacher').first()
+        name = owner and owner.full_name
+    elif key == "room_id":
+        owner = db.session.get(Room, owner_id)
+        name = owner and owner.name
+    else:
+        owner = db.session.get(Student, owner_id)
+        name = owner and owner.fullname
+
+    if not owner:
+        return None, None, jsonify({
+            "message": f"{key.split('_')[0].capitalize()} not found"
+        }), HTTPStatus.NOT_FOUND
+
+    return owners, name, None, None
+
+def get_timetable_request():
+    from_date, to_date, error_response, status_code = get_date_range()
+    if not from_date:
+        return None, error_response, status_code
+
+    owners, name, error_response, status_code = get_timetable_owner()
+    if not owners:
+        return None, error_response, status_code
+
+    starts_from = datetime.datetime.combine(from_date, datetime.time.min)
+    ends_before = datetime.datetime.combine(to_date + datetime.timedelta(days=1), datetime.time.min)
+
+    return {
+        "from": from_date,
+        "to": to_date,
+        "name": name,
+        "query": timetable_query(starts_from, ends_before, **owners)
+    }, None, None
+
+@timetable_bp.get("/")
+@role_required("Teacher", "Learning Advisor", "Manager")
+@conditional_get(*TIMETABLE_TABLES)
+def get_timetable():
+    try:
+        timetable, error_response, status_code = get_timetable_request()
+        if not timetable:
+            return error_response, status_code
+
+        sessions = [session_dict(row) for row in db.session.execute(timetable["query"])]
+
+        return jsonify({
+            "name": timetable["name"],
+            "from": timetable["from"].isoformat(),
+            "to": timetable["to"].isoformat(),
+            "sessions": sessions
+        }), HTTPStatus.OK
+
+    except Exception as e:
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+@timetable_bp.get("/ics")
+@role_required("Teacher", "Learning Advisor", "Manager")
+@conditional_get(*TIMETABLE_TABLES)
+def export_timetable_ics():
+    try:
+        timetable, error_response, status_code = get_timetable_request()
+        if not timetable:
+            return error_response, status_code
+
+        # yield_per streams rows from the server cursor, so events are written as they are read
+        rows = db.session.execute(timetable["query"].execution_options(yield_per=STREAM_BATCH_SIZE))
+        filename = f"timetable_{timetable['from']:%Y%m%d}_{timetable['to']:%Y%m%d}.ics"
+
+        return Response(
+            stream_with_context(ics_events(rows, timetable["name"])),
+            mimetype="text/calendar",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+
+    except Exception as e:
+        return jsonify({
+            "message": "Unexpected error occurred",
+            "error": str(e)
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
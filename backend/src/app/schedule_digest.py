@@ -0,0 +1,117 @@
+import datetime
+import time
+from flask import render_template
+from flask_mail import Message
+from sqlalchemy import and_, literal, null, or_, select, union_all
+from extensions import db
+from .mail_outbox import mail_outbox
+from .models import Class, Course, Employee, MailOutbox, MakeupClass, Room, Student
+
+def schedule_query(day):
+    """Every teacher's sessions for ``day`` in one statement, ordered by teacher.
+
+    Makeup classes are listed on the day of their session; those created
+    without a session time are listed once, in the digest after they were
+    assigned.
+    """
+    starts_at = datetime.datetime.combine(day, datetime.time.min)
+    classes = select(
+        Class.teacher_id,
+        literal("class").label("kind"),
+        Class.class_date.label("starts_at"),
+        Class.id.label("class_id"),
+        Class.term,
+        Course.name.label("course_name"),
+        Room.name.label("room_name"),
+        null().label("student_name")
+    ).join(
+        Course, (Course.id == Class.course_id) & (Course.created_date == Class.course_date)
+    ).join(Room, Room.id == Class.room_id).where(
+        Class.class_date >= starts_at,
+        Class.class_date < starts_at + datetime.timedelta(days=1)
+    )
+    makeup_classes = select(
+        MakeupClass.teacher_id,
+        literal("makeup"),
+        MakeupClass.class_date,
+        MakeupClass.class_id,
+        MakeupClass.term,
+        Course.name,
+        Room.name,
+        Student.fullname
+    ).join(
+        Course, (Course.id == MakeupClass.course_id) & (Course.created_date == MakeupClass.course_date)
+    ).join(Room, Room.id == MakeupClass.room_id).join(Student, Student.id == MakeupClass.student_id).where(or_(
+        and_(MakeupClass.class_date >= starts_at, MakeupClass.class_date < starts_at + datetime.timedelta(days=1)),
+        and_(MakeupClass.class_date.is_(None), MakeupClass.created_date == day - datetime.timedelta(days=1))
+    ))
+
+    sessions = union_all(classes, makeup_classes).subquery()
+    return select(sessions, Employee.full_name, Employee.email).join(
+        Employee, Employee.id == sessions.c.teacher_id
+    ).order_by(sessions.c.teacher_id, sessions.c.kind, sessions.c.starts_at, sessions.c.class_id)
+
+def group_by_teacher(rows):
+    digests = {}
+    for row in rows:
+        digest = digests.get(row.teacher_id)
+        if digest is None:
+            digest = digests[row.teacher_id] = {
+                "teacher_name": row.full_name,
+                "email": row.email,
+                "classes": [],
+                "makeup_classes": []
+            }
+        digest["classes" if row.kind == "class" else "makeup_classes"].append(row)
+
+    return digests
+
+def send_schedule_digests(day=None, deliver=True, logger=None):
+    """Queue tomorrow's schedule for every teacher and, with ``deliver``, send it.
+
+    Teachers who already have a digest for ``day`` in the outbox are skipped,
+    so the job can be re-run after a partial failure. Returns the run statistics.
+    """
+    day = day or datetime.date.today() + datetime.timedelta(days=1)
+    subject = f"Your schedule for {day:%d/%m/%Y}"
+    stats = {"day": day.isoformat(), "teachers": 0, "sessions": 0, "queued": 0, "skipped": 0, "render_failed": 0}
+
+    started_at = time.perf_counter()
+    rows = db.session.execute(schedule_query(day)).all()
+    digests = group_by_teacher(rows)
+    stats["sessions"] = len(rows)
+    stats["teachers"] = len(digests)
+    stats["query_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+
+    started_at = time.perf_counter()
+    already_queued = set(db.session.scalars(
+        select(MailOutbox.recipients).where(MailOutbox.subject == subject)
+    ))
+    for teacher_id, digest in digests.items():
+        if digest["email"] in already_queued:
+            stats["skipped"] += 1
+            continue
+
+        try:
+            message = Message(subject, recipients=[digest["email"]])
+            message.html = render_template("email/schedule_digest.html", day=day, **digest)
+            message.body = render_template("email/schedule_digest.txt", day=day, **digest)
+        except Exception as e:
+            stats["render_failed"] += 1
+            if logger:
+                logger.error("Schedule digest for %s not rendered: %s", teacher_id, e)
+            continue
+
+        mail_outbox.enqueue(message)
+        stats["queued"] += 1
+
+    db.session.commit()
+    stats["render_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+
+    if deliver:
+        started_at = time.perf_counter()
+        delivery = mail_outbox.drain()
+        stats.update({key: delivery[key] for key in ("sent", "retried", "failed")})
+        stats["send_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+
+    return stats
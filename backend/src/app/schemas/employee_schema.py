@@ -1,5 +1,6 @@
 from extensions import ma
 from marshmallow import fields
+from .row_serializer import RowSerializer
 
 class EmployeeSchema(ma.Schema):
     id = fields.String(dump_only=True)  # Include in responses, not required for input
@@ -12,4 +13,5 @@ class EmployeeSchema(ma.Schema):
     phone_number = fields.String(allow_none=True)
     teacher_status = fields.String(allow_none=True)
 
-employee_schema = EmployeeSchema()
\ No newline at end of file
+employee_schema = EmployeeSchema()
+employee_row_serializer = RowSerializer(employee_schema)
\ No newline at end of file
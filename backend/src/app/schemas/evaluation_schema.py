@@ -1,5 +1,7 @@
 from extensions import ma
-from marshmallow import fields
+from marshmallow import fields, validate
+from ..grade_distribution import ASSESSMENT_TYPES
+from .row_serializer import RowSerializer
 
 class EvaluationSchema(ma.Schema):
     student_id = fields.String(required=True)
@@ -12,4 +14,19 @@ class EvaluationSchema(ma.Schema):
     enrolment_id = fields.String(required=False)
     evaluation_date = fields.Date(required=False)
 
+class ClassGradeSchema(ma.Schema):
+    student_id = fields.String(required=True)
+    grade = fields.String(required=True)
+    comment = fields.String(required=True)
+
+class ClassGradingSchema(ma.Schema):
+    class_id = fields.String(required=True)
+    course_id = fields.String(required=True)
+    course_date = fields.Date(required=True)
+    term = fields.Integer(required=True)
+    assessment_type = fields.String(required=True, validate=validate.OneOf(ASSESSMENT_TYPES))
+    grades = fields.List(fields.Nested(ClassGradeSchema), required=True, validate=validate.Length(min=1))
+
 evaluation_schema = EvaluationSchema()
+class_grading_schema = ClassGradingSchema()
+evaluation_row_serializer = RowSerializer(evaluation_schema)
@@ -14,9 +14,6 @@ class ClassSchema(ma.Schema):
     class_date = fields.DateTime(required=True)
     course = Nested(CourseSchema, only=("name",))
     teacher = Nested(EmployeeSchema, only=("full_name",))
-    student_count = fields.Method("get_student_count")
-    
-    def get_student_count(self, obj):
-        return len(obj.student_attendance) if obj.student_attendance else 0
+    student_count = fields.Integer(dump_only=True)
 
 class_schema = ClassSchema()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from extensions import ma
-from marshmallow import fields
+from marshmallow import fields, validate
 from marshmallow_sqlalchemy.fields import Nested
 from .student_schema import StudentSchema
 
@@ -12,4 +12,13 @@ class ContractSchema(ma.Schema):
     payment_status = fields.String(dump_only=True)
     student = Nested(StudentSchema, only=("fullname",))
 
-contract_schema = ContractSchema()
\ No newline at end of file
+# Students enrolled per bulk request
+BULK_ENROLMENT_LIMIT = 1000
+
+class BulkEnrolmentSchema(ma.Schema):
+    course_id = fields.String(required=True)
+    course_date = fields.Date(required=True)
+    student_ids = fields.List(fields.String(), required=True, validate=validate.Length(min=1, max=BULK_ENROLMENT_LIMIT))
+
+contract_schema = ContractSchema()
+bulk_enrolment_schema = BulkEnrolmentSchema()
\ No newline at end of file
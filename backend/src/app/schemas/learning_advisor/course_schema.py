@@ -1,5 +1,6 @@
 from extensions import ma
 from marshmallow import fields
+from ..row_serializer import RowSerializer
 
 class CourseSchema(ma.Schema):
     id = fields.String(dump_only=True)
@@ -12,4 +13,5 @@ class CourseSchema(ma.Schema):
     created_date = fields.Date(required=True)
     description = fields.String(allow_none=True)
 
-course_schema = CourseSchema()
\ No newline at end of file
+course_schema = CourseSchema()
+course_row_serializer = RowSerializer(course_schema)
\ No newline at end of file
@@ -13,6 +13,7 @@ class MakeupClassSchema(ma.Schema):
     term = fields.Integer(required=True)
     teacher_id = fields.String(required=True)
     room_id = fields.String(required=True)
+    class_date = fields.DateTime(load_default=None, allow_none=True)
     teacher = Nested(EmployeeSchema, only=("full_name",))
 
 makeup_class_schema = MakeupClassSchema()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from extensions import ma
 from marshmallow import fields
+from ..row_serializer import RowSerializer
 
 class StudentSchema(ma.Schema):
     id = fields.String(dump_only=True)  # Optional for input, always included in output
@@ -7,4 +8,5 @@ class StudentSchema(ma.Schema):
     contact_info = fields.String(required=True)
     date_of_birth = fields.Date(required=True)
     
-student_schema = StudentSchema()
\ No newline at end of file
+student_schema = StudentSchema()
+student_row_serializer = RowSerializer(student_schema)
\ No newline at end of file
@@ -1,9 +1,11 @@
 from marshmallow import fields
 from extensions import ma
+from .row_serializer import RowSerializer
 
 class RoomSchema(ma.Schema):
     id = fields.String(dump_only=True)
     name = fields.String(required=True)
     status = fields.String(load_default="Free", validate=lambda x: x in ["Free", "Occupied", "Maintenance"])
 
-room_schema = RoomSchema()
\ No newline at end of file
+room_schema = RoomSchema()
+room_row_serializer = RowSerializer(room_schema)
\ No newline at end of file
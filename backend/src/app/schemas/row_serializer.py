@@ -0,0 +1,63 @@
+from marshmallow import fields
+from sqlalchemy import select
+
+class RowSerializer:
+    """Dump SQLAlchemy Core rows with the output format of a marshmallow schema.
+
+    The dumpable fields of the schema are resolved once into a list of
+    (key, converter) pairs, so serializing a row is a single pass over a tuple
+    instead of marshmallow's per-field attribute lookups. Nested and method
+    fields cannot be read from a flat row and must be left out with ``only``.
+    """
+
+    def __init__(self, schema, only=None):
+        self.keys = []
+        self.converters = []
+
+        for name, field in schema.dump_fields.items():
+            if only is not None and name not in only:
+                continue
+            if isinstance(field, (fields.Nested, fields.Method, fields.Function)):
+                raise ValueError(f"Field '{name}' cannot be serialized from a flat row")
+
+            self.keys.append(field.data_key or name)
+            self.converters.append(self._compile_converter(field))
+
+        self.attributes = [
+            field.attribute or name
+            for name, field in schema.dump_fields.items()
+            if only is None or name in only
+        ]
+
+    @staticmethod
+    def _compile_converter(field):
+        if isinstance(field, fields.String):
+            return None
+        if isinstance(field, (fields.Date, fields.DateTime)):
+            format_func = field.SERIALIZATION_FUNCS.get(field.format or field.DEFAULT_FORMAT)
+            if format_func:
+                return format_func
+            return lambda value: value.strftime(field.format)
+        if isinstance(field, fields.Number) and not field.as_string:
+            return field.num_type
+
+        return lambda value: field._serialize(value, None, None)
+
+    def select(self, model):
+        """Build a Core SELECT of the model columns in serializer order."""
+        return select(*[getattr(model, attribute) for attribute in self.attributes])
+
+    def dump(self, rows):
+        keys = self.keys
+        converters = self.converters
+
+        if not any(converters):
+            return [dict(zip(keys, row)) for row in rows]
+
+        return [
+            {
+                key: value if value is None or converter is None else converter(value)
+                for key, converter, value in zip(keys, converters, row)
+            }
+            for row in rows
+        ]
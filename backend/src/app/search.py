@@ -0,0 +1,192 @@
+import datetime
+import re
+import unicodedata
+from collections import defaultdict
+from types import SimpleNamespace
+from sqlalchemy import case, delete, event, func, insert, inspect, literal, select, tuple_, union_all
+from sqlalchemy.orm import Session
+from extensions import db
+from .models import Course, Employee, Room, SearchToken, Student
+
+TOKEN_LENGTH = 64
+MIN_TERM_LENGTH = 2
+MIN_PHONE_DIGITS = 6
+MIN_SUFFIX_LENGTH = 3
+
+# Indexed fields of each model with their weight in the ranking
+INDEXED_FIELDS = {
+    Student: ("student", {"fullname": 3, "contact_info": 1}),
+    Employee: ("employee", {"full_name": 3, "email": 2, "phone_number": 1}),
+    Course: ("course", {"name": 3}),
+    Room: ("room", {"name": 3})
+}
+
+RESULT_COLUMNS = {
+    "student": (Student.id, Student.fullname, Student.contact_info),
+    "employee": (Employee.id, Employee.full_name, Employee.email, Employee.phone_number, Employee.role),
+    "course": (Course.id, Course.created_date, Course.name, Course.start_date),
+    "room": (Room.id, Room.name, Room.status)
+}
+
+ENTITY_TYPES = tuple(RESULT_COLUMNS)
+
+def normalize(text):
+    """Lower-case ``text`` and strip accents, so "Nguyễn" is found by "nguyen"."""
+    text = unicodedata.normalize("NFKD", text.replace("đ", "d").replace("Đ", "D"))
+    return "".join(char for char in text if not unicodedata.combining(char)).casefold()
+
+def terms(text):
+    return [word[:TOKEN_LENGTH] for word in re.findall(r"\w+", normalize(text))]
+
+def tokens(text):
+    """Return the index tokens of ``text``: its words and, for phone numbers, the digit suffixes."""
+    if not text:
+        return set()
+
+    words = set(terms(text))
+    digits = "".join(re.findall(r"\d", text))[-TOKEN_LENGTH:]
+    if len(digits) >= MIN_PHONE_DIGITS:
+        # With every suffix indexed, a prefix lookup finds digits anywhere in the number
+        words.update(digits[start:] for start in range(len(digits) - MIN_SUFFIX_LENGTH + 1))
+
+    return words
+
+def entity_key(entity_type, obj):
+    if entity_type == "course":
+        return f"{obj.id}:{obj.created_date.isoformat()}"
+    return obj.id
+
+def index_rows(model, obj):
+    entity_type, fields = INDEXED_FIELDS[model]
+    key = entity_key(entity_type, obj)
+    return [
+        {"token": token, "entity_type": entity_type, "entity_key": key, "field": field, "weight": weight}
+        for field, weight in fields.items()
+        for token in tokens(getattr(obj, field))
+    ]
+
+def index_new_rows(model, rows):
+    """Index ``rows``, dicts of column values inserted without the ORM, in the current transaction."""
+    tokens = [token for row in rows for token in index_rows(model, SimpleNamespace(**row))]
+    if tokens:
+        db.session.connection().execute(insert(SearchToken), tokens)
+
+def _indexed_fields_changed(obj):
+    _, fields = INDEXED_FIELDS[type(obj)]
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+def _reindex_flushed(session, flush_context):
+    # new, dirty and deleted still hold the pre-flush state here, and keys are assigned
+    stale = [obj for obj in session.deleted if type(obj) in INDEXED_FIELDS]
+    fresh = [obj for obj in session.new if type(obj) in INDEXED_FIELDS]
+    changed = [obj for obj in session.dirty if type(obj) in INDEXED_FIELDS and _indexed_fields_changed(obj)]
+    stale.extend(changed)
+    fresh.extend(changed)
+    if not stale and not fresh:
+        return
+
+    connection = session.connection()
+    stale_keys = defaultdict(list)
+    for obj in stale:
+        entity_type, _ = INDEXED_FIELDS[type(obj)]
+        stale_keys[entity_type].append(entity_key(entity_type, obj))
+    for entity_type, keys in stale_keys.items():
+        connection.execute(delete(SearchToken).where(
+            SearchToken.entity_type == entity_type,
+            SearchToken.entity_key.in_(keys)
+        ))
+
+    rows = [row for obj in fresh for row in index_rows(type(obj), obj)]
+    if rows:
+        connection.execute(insert(SearchToken), rows)
+
+def register_search_index_listeners():
+    if event.contains(Session, "after_flush", _reindex_flushed):
+        return
+
+    event.listen(Session, "after_flush", _reindex_flushed)
+
+def rebuild_search_index(chunk_size=5000, log=None):
+    """Re-index every row, e.g. after bulk loads that bypass the ORM; return the token count per type."""
+    with db.engine.begin() as connection:
+        connection.execute(delete(SearchToken))
+
+    counts = {}
+    for model, (entity_type, fields) in INDEXED_FIELDS.items():
+        columns = [*inspect(model).primary_key, *(getattr(model, field) for field in fields)]
+        counts[entity_type] = 0
+
+        with db.engine.connect() as reader:
+            result = reader.execution_options(stream_results=True, yield_per=chunk_size).execute(select(*columns))
+            for partition in result.partitions():
+                rows = [row for obj in partition for row in index_rows(model, obj)]
+                if rows:
+                    with db.engine.begin() as writer:
+                        writer.execute(insert(SearchToken), rows)
+                counts[entity_type] += len(rows)
+
+        if log:
+            log(f"{entity_type:<10} {counts[entity_type]:>10} tokens")
+
+    return counts
+
+def search(query, entity_types=ENTITY_TYPES, limit=20):
+    """Return (entity_type, entity_key, score) of the best matches; every query term has to match.
+
+    Each term is looked up as a token prefix. A term scores the weight of the
+    field it matched, doubled when it matched a whole token.
+    """
+    query_terms = list(dict.fromkeys(term for term in terms(query) if len(term) >= MIN_TERM_LENGTH))
+    if not query_terms:
+        return []
+
+    matches = [
+        select(
+            SearchToken.entity_type,
+            SearchToken.entity_key,
+            literal(number).label("term"),
+            func.max(case((SearchToken.token == term, SearchToken.weight * 2), else_=SearchToken.weight)).label("score")
+        ).where(
+            SearchToken.token.startswith(term, autoescape=True),
+            SearchToken.entity_type.in_(entity_types)
+        ).group_by(SearchToken.entity_type, SearchToken.entity_key)
+        for number, term in enumerate(query_terms)
+    ]
+    hits = (union_all(*matches) if len(matches) > 1 else matches[0]).subquery()
+    score = func.sum(hits.c.score).label("score")
+
+    return db.session.execute(
+        select(hits.c.entity_type, hits.c.entity_key, score)
+        .group_by(hits.c.entity_type, hits.c.entity_key)
+        .having(func.count() == len(matches))
+        .order_by(score.desc(), hits.c.entity_type, hits.c.entity_key)
+        .limit(limit)
+    ).all()
+
+def load_results(hits):
+    """Fetch the display columns of ranked hits with one query per entity type, keeping the rank order."""
+    keys = defaultdict(list)
+    for entity_type, key, _ in hits:
+        keys[entity_type].append(key)
+
+    found = {}
+    for entity_type, entity_keys in keys.items():
+        columns = RESULT_COLUMNS[entity_type]
+        if entity_type == "course":
+            course_keys = [key.split(":", 1) for key in entity_keys]
+            condition = tuple_(Course.id, Course.created_date).in_(
+                [(course_id, datetime.date.fromisoformat(created_date)) for course_id, created_date in course_keys]
+            )
+        else:
+            condition = columns[0].in_(entity_keys)
+
+        for row in db.session.execute(select(*columns).where(condition)):
+            found[(entity_type, entity_key(entity_type, row))] = dict(row._mapping)
+
+    # Hits whose row was deleted outside the ORM are left out
+    return [
+        {"type": entity_type, "score": int(score), **found[(entity_type, key)]}
+        for entity_type, key, score in hits
+        if (entity_type, key) in found
+    ]
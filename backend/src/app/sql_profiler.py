@@ -0,0 +1,168 @@
+import re
+import threading
+import time
+from collections import Counter, deque
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_IN_LIST = re.compile(r"\(\s*(?:%s|\?|:\w+)(?:\s*,\s*(?:%s|\?|:\w+))*\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+def fingerprint(statement):
+    """Reduce a statement to its shape so repeated lookups with different values compare equal."""
+    statement = _LITERAL.sub("?", statement)
+    statement = _IN_LIST.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+class SQLProfiler:
+    """Count statements and database time per request and flag likely N+1 loops.
+
+    A statement shape that runs ``SQL_PROFILER_N_PLUS_ONE_THRESHOLD`` times or
+    more in one request is reported as an N+1 candidate. Summaries of the last
+    ``SQL_PROFILER_HISTORY`` requests are kept for ``report``; in debug mode
+    each response also carries ``X-SQL-*`` headers.
+
+    ``SQL_PROFILER_ENABLED`` and ``SQL_PROFILER_HEADERS`` default to None,
+    which follows ``current_app.debug`` request by request: debug mode can be
+    switched on after ``init_app``, by ``app.run(debug=True)``.
+    """
+
+    def __init__(self):
+        self.threshold = 5
+        self.history = deque(maxlen=500)
+        self.enabled = None
+        self.headers = None
+        self.logger = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get("SQL_PROFILER_ENABLED")
+        if self.enabled is False:
+            return
+
+        self.threshold = app.config.get("SQL_PROFILER_N_PLUS_ONE_THRESHOLD", self.threshold)
+        self.history = deque(maxlen=app.config.get("SQL_PROFILER_HISTORY", self.history.maxlen))
+        self.headers = app.config.get("SQL_PROFILER_HEADERS")
+        self.logger = app.logger
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    def _listen(self):
+        # Engine hooks go in with the first profiled request, so statements are not timed while profiling is off
+        with self._lock:
+            if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+                event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+                event.listen(Engine, "handle_error", _handle_error)
+
+    def _start_request(self):
+        if not (current_app.debug if self.enabled is None else self.enabled):
+            return
+
+        self._listen()
+        g.sql_profile = {
+            "started_at": time.perf_counter(),
+            "statements": 0,
+            "db_time": 0.0,
+            "fingerprints": Counter()
+        }
+
+    def _finish_request(self, response):
+        profile = g.pop("sql_profile", None)
+        if profile is None:
+            return response
+
+        n_plus_one = [
+            {"fingerprint": statement, "count": count}
+            for statement, count in profile["fingerprints"].most_common()
+            if count >= self.threshold
+        ]
+        summary = {
+            "method": request.method,
+            "endpoint": request.endpoint,
+            "path": request.path,
+            "status": response.status_code,
+            "statements": profile["statements"],
+            "db_time_ms": round(profile["db_time"] * 1000, 3),
+            "duration_ms": round((time.perf_counter() - profile["started_at"]) * 1000, 3),
+            "n_plus_one": n_plus_one
+        }
+
+        with self._lock:
+            self.history.append(summary)
+
+        if n_plus_one:
+            self.logger.warning(
+                "Possible N+1 in %s: %s",
+                request.endpoint,
+                ", ".join(f"{item['count']}x {item['fingerprint'][:120]}" for item in n_plus_one)
+            )
+
+        if current_app.debug if self.headers is None else self.headers:
+            response.headers["X-SQL-Count"] = str(summary["statements"])
+            response.headers["X-SQL-Time-ms"] = str(summary["db_time_ms"])
+            if n_plus_one:
+                response.headers["X-SQL-N-Plus-One"] = str(len(n_plus_one))
+
+        return response
+
+    def report(self):
+        with self._lock:
+            history = list(self.history)
+
+        endpoints = {}
+        for summary in history:
+            stats = endpoints.setdefault(summary["endpoint"], {
+                "endpoint": summary["endpoint"],
+                "requests": 0,
+                "total_statements": 0,
+                "max_statements": 0,
+                "total_db_time_ms": 0.0,
+                "n_plus_one_requests": 0
+            })
+            stats["requests"] += 1
+            stats["total_statements"] += summary["statements"]
+            stats["max_statements"] = max(stats["max_statements"], summary["statements"])
+            stats["total_db_time_ms"] += summary["db_time_ms"]
+            stats["n_plus_one_requests"] += 1 if summary["n_plus_one"] else 0
+
+        for stats in endpoints.values():
+            stats["avg_statements"] = round(stats.pop("total_statements") / stats["requests"], 2)
+            stats["avg_db_time_ms"] = round(stats.pop("total_db_time_ms") / stats["requests"], 3)
+
+        return {
+            "requests": len(history),
+            "n_plus_one_threshold": self.threshold,
+            "endpoints": sorted(endpoints.values(), key=lambda stats: stats["avg_statements"], reverse=True),
+            "recent_n_plus_one": [summary for summary in history if summary["n_plus_one"]][-20:]
+        }
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_start_time")
+    if not started:
+        # The hooks were installed while this statement was running
+        return
+    started_at = started.pop()
+    if not has_request_context():
+        return
+
+    profile = g.get("sql_profile")
+    if profile is None:
+        return
+
+    profile["statements"] += 1
+    profile["db_time"] += time.perf_counter() - started_at
+    profile["fingerprints"][fingerprint(statement)] += 1
+
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+sql_profiler = SQLProfiler()
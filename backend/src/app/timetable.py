@@ -0,0 +1,147 @@
+import datetime
+from sqlalchemy import and_, literal, select, union_all
+from .models import Class, Course, Employee, MakeupClass, Room, StudentAttendance
+
+ICS_PRODUCT = "-//Hammer & Grammar//Timetable//EN"
+ICS_DOMAIN = "timetable.hammer-grammar"
+
+def timetable_query(starts_from, ends_before, teacher_id=None, room_id=None, student_id=None):
+    """Class and makeup sessions starting in [starts_from, ends_before) for one teacher, room or student.
+
+    Each branch of the UNION ALL is an index range scan: (teacher_id,
+    class_date) or (room_id, class_date) on class, and the student prefix of
+    the attendance key. Makeup classes without a session time are left out.
+    """
+    class_sessions = select(
+        literal("class").label("kind"),
+        Class.id.label("class_id"),
+        Class.course_id,
+        Class.course_date,
+        Class.term,
+        Class.class_date.label("starts_at"),
+        Course.name.label("course_name"),
+        Course.session_minutes,
+        Class.room_id,
+        Room.name.label("room_name"),
+        Class.teacher_id,
+        Employee.full_name.label("teacher_name")
+    ).join(
+        Course, and_(Course.id == Class.course_id, Course.created_date == Class.course_date)
+    ).join(Room, Room.id == Class.room_id).join(Employee, Employee.id == Class.teacher_id).where(
+        Class.class_date >= starts_from,
+        Class.class_date < ends_before
+    )
+
+    # One makeup row is stored per absent student, so teacher and room calendars collapse them
+    makeup_sessions = select(
+        literal("makeup"),
+        MakeupClass.class_id,
+        MakeupClass.course_id,
+        MakeupClass.course_date,
+        MakeupClass.term,
+        MakeupClass.class_date,
+        Course.name,
+        Course.session_minutes,
+        MakeupClass.room_id,
+        Room.name,
+        MakeupClass.teacher_id,
+        Employee.full_name
+    ).join(
+        Course, and_(Course.id == MakeupClass.course_id, Course.created_date == MakeupClass.course_date)
+    ).join(Room, Room.id == MakeupClass.room_id).join(Employee, Employee.id == MakeupClass.teacher_id).where(
+        MakeupClass.class_date >= starts_from,
+        MakeupClass.class_date < ends_before
+    ).distinct()
+
+    if teacher_id:
+        class_sessions = class_sessions.where(Class.teacher_id == teacher_id)
+        makeup_sessions = makeup_sessions.where(MakeupClass.teacher_id == teacher_id)
+    if room_id:
+        class_sessions = class_sessions.where(Class.room_id == room_id)
+        makeup_sessions = makeup_sessions.where(MakeupClass.room_id == room_id)
+    if student_id:
+        class_sessions = class_sessions.join(StudentAttendance, and_(
+            StudentAttendance.class_id == Class.id,
+            StudentAttendance.course_id == Class.course_id,
+            StudentAttendance.course_date == Class.course_date,
+            StudentAttendance.term == Class.term
+        )).where(StudentAttendance.student_id == student_id)
+        makeup_sessions = makeup_sessions.where(MakeupClass.student_id == student_id)
+
+    sessions = union_all(class_sessions, makeup_sessions).subquery()
+    return select(sessions).order_by(sessions.c.starts_at, sessions.c.kind, sessions.c.class_id)
+
+def session_end(row):
+    if row.session_minutes is None:
+        return None
+    return row.starts_at + datetime.timedelta(minutes=row.session_minutes)
+
+def session_dict(row):
+    # ISO strings, as the schemas dump dates; jsonify would label the naive local times as GMT
+    ends_at = session_end(row)
+    return {
+        "kind": row.kind,
+        "class_id": row.class_id,
+        "course_id": row.course_id,
+        "course_date": row.course_date.isoformat(),
+        "term": row.term,
+        "course_name": row.course_name,
+        "starts_at": row.starts_at.isoformat(),
+        "ends_at": ends_at.isoformat() if ends_at else None,
+        "room_id": row.room_id,
+        "room_name": row.room_name,
+        "teacher_id": row.teacher_id,
+        "teacher_name": row.teacher_name
+    }
+
+def _ics_text(value):
+    return str(value).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def _ics_line(line):
+    """Fold a content line into chunks of at most 75 octets, as RFC 5545 requires."""
+    folded = []
+    chunk = ""
+    for char in line:
+        if len((chunk + char).encode()) > (75 if not folded else 74):
+            folded.append(chunk)
+            chunk = ""
+        chunk += char
+    folded.append(chunk)
+    return "\r\n ".join(folded) + "\r\n"
+
+def ics_events(rows, calendar_name):
+    """Yield an iCalendar document one event at a time; start and end times are floating local times."""
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    yield "".join(_ics_line(line) for line in (
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{ICS_PRODUCT}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_ics_text(calendar_name)}"
+    ))
+
+    for row in rows:
+        uid = f"{row.kind}-{row.class_id}-{row.course_id}-{row.course_date:%Y%m%d}-{row.term}-{row.starts_at:%Y%m%dT%H%M}@{ICS_DOMAIN}"
+        summary = f"{row.course_name} ({row.class_id}, term {row.term})"
+        if row.kind == "makeup":
+            summary = f"Makeup: {summary}"
+
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{uid}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{row.starts_at:%Y%m%dT%H%M%S}"
+        ]
+        ends_at = session_end(row)
+        if ends_at:
+            lines.append(f"DTEND:{ends_at:%Y%m%dT%H%M%S}")
+        lines.extend([
+            f"SUMMARY:{_ics_text(summary)}",
+            f"LOCATION:{_ics_text(row.room_name)}",
+            f"DESCRIPTION:{_ics_text(f'Teacher: {row.teacher_name}')}",
+            "END:VEVENT"
+        ])
+        yield "".join(_ics_line(line) for line in lines)
+
+    yield _ics_line("END:VCALENDAR")
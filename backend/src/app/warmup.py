@@ -0,0 +1,62 @@
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+from extensions import db
+
+def report_assets(app):
+    """Return the (stylesheet, logo) paths the evaluation export renders with."""
+    root = Path(app.root_path)
+    css_path = Path(app.static_folder) / "pdf" / "report_card.css"
+    logo_path = next((path for path in (root / "test.png", root.parent / "test.png") if path.is_file()), None)
+    return css_path, logo_path
+
+def preload(app):
+    """Do the one-off work in the pre-fork master so every worker inherits it.
+
+    Mapper configuration and template compilation otherwise happen on the first
+    request each worker serves. The PDF engine is imported here too, so its
+    native libraries are loaded once and shared copy-on-write by the workers.
+    """
+    configure_mappers()
+
+    for name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(name)
+
+    if app.config["PRELOAD_PDF_ENGINE"]:
+        from .models.pdf_weasy import load_stylesheet, logo_data_uri
+
+        css_path, logo_path = report_assets(app)
+        try:
+            load_stylesheet(str(css_path) if css_path.is_file() else None)
+        except (ImportError, OSError) as error:
+            # The fpdf export still works without WeasyPrint's system libraries
+            app.logger.warning("PDF engine not preloaded: %s", error)
+        if logo_path is not None:
+            logo_data_uri(str(logo_path))
+
+def warm_up_worker(app, connections):
+    """Fill the connection pool of a freshly forked worker.
+
+    Connections inherited from the master are dropped without closing them,
+    since the master still owns the sockets. ``connections`` is capped at the
+    pool size so the warmed connections are kept rather than discarded.
+    """
+    with app.app_context():
+        engine = db.engine
+        engine.dispose(close=False)
+
+        size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+        opened = []
+        try:
+            for _ in range(min(connections, size)):
+                connection = engine.connect()
+                opened.append(connection)
+                connection.execute(text("SELECT 1"))
+        except Exception as error:
+            # A worker that cannot reach the database yet still serves requests once it can
+            app.logger.warning("Connection pool not warmed: %s", error)
+        finally:
+            for connection in opened:
+                connection.close()
+
+        return len(opened)
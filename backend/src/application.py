@@ -1,17 +1,30 @@
 from flask import Flask
 from extensions import db, jwt, ma, migrate, cors, mail
 from app.routes import register_blueprints
+from app.commands import register_commands
+from app.json_provider import ORJSONProvider
+from app.cache import register_table_version_listeners, response_cache
+from app.sql_profiler import sql_profiler
+from app.mail_outbox import mail_outbox
+from app.search import register_search_index_listeners
+from app.attendance_counts import register_attendance_count_listeners
 from config import Config
 
 def create_app():
     app = Flask(__name__, template_folder="app/templates", static_folder="app/static")
     app.config.from_object(Config)
+    
+    if app.config["JSON_PROVIDER"] == "orjson":
+        app.json = ORJSONProvider(app)
 
     db.init_app(app)
     jwt.init_app(app)
     ma.init_app(app)
     migrate.init_app(app, db)
     mail.init_app(app)
+    mail_outbox.init_app(app)
+    response_cache.init_app(app)
+    sql_profiler.init_app(app)
     cors.init_app(
         app,
         resources={r"/*": {"origin": "http://localhost:5000"}},
@@ -19,6 +32,10 @@ def create_app():
     )
 
     register_blueprints(app)
+    register_commands(app)
+    register_table_version_listeners()
+    register_search_index_listeners()
+    register_attendance_count_listeners()
     
     return app
 
@@ -8,15 +8,33 @@ class Config:
     SECRET_KEY = os.getenv("SECRET_KEY")
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URI")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Warmed connections can sit idle past MySQL's wait_timeout before a worker uses them
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 3600))
+    }
+    PRELOAD_PDF_ENGINE = os.getenv("PRELOAD_PDF_ENGINE", "true").lower() == "true"
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "orjson")
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 512))
+    RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 300))
+    # Left unset, the profiler follows debug mode, which app.run(debug=True) turns on after create_app
+    SQL_PROFILER_ENABLED = {"true": True, "false": False}.get(os.getenv("SQL_PROFILER_ENABLED", "").lower())
+    SQL_PROFILER_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_PROFILER_N_PLUS_ONE_THRESHOLD", 5))
+    SQL_PROFILER_HISTORY = int(os.getenv("SQL_PROFILER_HISTORY", 500))
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     JWT_REFRESH_TOKEN_EXPIRES = False
     JWT_BLACKLIST_ENABLED = True
     JWT_BLACKLIST_TOKEN_CHECKS = ["access"]
     MAIL_SERVER = os.getenv("MAIL_SERVER")
-    MAIL_PORT = 587
+    MAIL_PORT = int(os.getenv("MAIL_PORT", 587))
     MAIL_USERNAME = os.getenv("MAIL_USERNAME")
     MAIL_PASSWORD = os.getenv("MAIL_PASSWORD")
-    MAIL_DEFAULT_SENDER = os.getenv("MAIL_USERNAME")
-    MAIL_USE_TLS = True
-    MAIL_USE_SSL = False
\ No newline at end of file
+    MAIL_DEFAULT_SENDER = os.getenv("MAIL_DEFAULT_SENDER", os.getenv("MAIL_USERNAME"))
+    MAIL_USE_TLS = os.getenv("MAIL_USE_TLS", "true").lower() == "true"
+    MAIL_USE_SSL = False
+    MAIL_OUTBOX_BATCH_SIZE = int(os.getenv("MAIL_OUTBOX_BATCH_SIZE", 50))
+    MAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("MAIL_OUTBOX_MAX_ATTEMPTS", 6))
+    MAIL_OUTBOX_BACKOFF_BASE = int(os.getenv("MAIL_OUTBOX_BACKOFF_BASE", 30))
+    MAIL_OUTBOX_BACKOFF_MAX = int(os.getenv("MAIL_OUTBOX_BACKOFF_MAX", 3600))
+    MAIL_OUTBOX_POLL_INTERVAL = float(os.getenv("MAIL_OUTBOX_POLL_INTERVAL", 5))
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""Gunicorn settings for ``wsgi:app``; every value can be overridden from the environment.
+
+On SIGTERM the master stops accepting connections and gives workers up to
+``GUNICORN_GRACEFUL_TIMEOUT`` seconds to finish the requests they are serving.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+worker_class = "gthread" if threads > 1 else "sync"
+
+# Import and warm the app in the master so workers start from a forked copy
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# Recycle workers now and then to bound memory growth; jitter avoids restarting them all at once
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 50))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+def post_fork(server, worker):
+    from wsgi import app
+    from app.warmup import warm_up_worker
+
+    # One connection per thread, so the first concurrent requests do not wait on connects
+    opened = warm_up_worker(app, connections=threads)
+    server.log.info("Worker %s warmed %s database connections", worker.pid, opened)
+
+def worker_exit(server, worker):
+    from wsgi import app
+    from extensions import db
+
+    with app.app_context():
+        db.engine.dispose()
@@ -0,0 +1,49 @@
+"""Add composite indexes for the dashboard, check-in and timetable filters
+
+Databases created from db/schema.sql have no revision recorded yet, so this
+is the first revision: run ``flask db upgrade`` once against them.
+
+Revision ID: 3f2a9c1d7b84
+Revises:
+Create Date: 2026-10-19 12:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b84'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('contract', schema=None) as batch_op:
+        batch_op.create_index('IX_contract_payment_status_start_date', ['payment_status', 'start_date'], unique=False)
+
+    with op.batch_alter_table('staff_checkin', schema=None) as batch_op:
+        batch_op.create_index('IX_staff_checkin_employee_status', ['employee_id', 'status'], unique=False)
+        batch_op.create_index('IX_staff_checkin_checkin_time', ['checkin_time'], unique=False)
+
+    with op.batch_alter_table('class', schema=None) as batch_op:
+        batch_op.create_index('IX_class_teacher_class_date', ['teacher_id', 'class_date'], unique=False)
+
+    with op.batch_alter_table('employee', schema=None) as batch_op:
+        batch_op.create_index('IX_employee_role', ['role'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('employee', schema=None) as batch_op:
+        batch_op.drop_index('IX_employee_role')
+
+    with op.batch_alter_table('class', schema=None) as batch_op:
+        batch_op.drop_index('IX_class_teacher_class_date')
+
+    with op.batch_alter_table('staff_checkin', schema=None) as batch_op:
+        batch_op.drop_index('IX_staff_checkin_checkin_time')
+        batch_op.drop_index('IX_staff_checkin_employee_status')
+
+    with op.batch_alter_table('contract', schema=None) as batch_op:
+        batch_op.drop_index('IX_contract_payment_status_start_date')
@@ -0,0 +1,86 @@
+"""Store course schedules as weekday mask, start and end time
+
+Existing rows are parsed from the free-text ``schedule`` column. Rows that
+do not match "Ddd - Ddd, HH:MM - HH:MM" keep NULL structured columns and
+are reported; class creation refuses their schedule until it is corrected.
+
+Revision ID: 5b8e2d7c4a16
+Revises: c7e19a4f5d20
+Create Date: 2026-10-19 16:20:00.000000
+
+"""
+import datetime
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b8e2d7c4a16'
+down_revision = 'c7e19a4f5d20'
+branch_labels = None
+depends_on = None
+
+# Mirrors CourseSchedule.parse as of this revision, so later model changes do not alter the migration
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+SCHEDULE_PATTERN = re.compile(r"(\w{3}) - (\w{3}), (\d{2}):(\d{2}) - (\d{2}):(\d{2})")
+
+
+def parse_schedule(schedule):
+    matched = SCHEDULE_PATTERN.search(schedule or "")
+    if not matched or matched.group(1) not in WEEKDAYS or matched.group(2) not in WEEKDAYS:
+        return None
+
+    try:
+        start = datetime.time(int(matched.group(3)), int(matched.group(4)))
+        end = datetime.time(int(matched.group(5)), int(matched.group(6)))
+    except ValueError:
+        return None
+    if end <= start:
+        return None
+
+    weekday_mask = (1 << WEEKDAYS.index(matched.group(1))) | (1 << WEEKDAYS.index(matched.group(2)))
+    return weekday_mask, start, end
+
+
+def upgrade():
+    with op.batch_alter_table('course', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('schedule_weekdays', sa.SmallInteger(), nullable=True))
+        batch_op.add_column(sa.Column('schedule_start', sa.Time(), nullable=True))
+        batch_op.add_column(sa.Column('schedule_end', sa.Time(), nullable=True))
+        batch_op.add_column(sa.Column(
+            'session_minutes', sa.Integer(),
+            sa.Computed('(TIME_TO_SEC(schedule_end) - TIME_TO_SEC(schedule_start)) DIV 60', persisted=True),
+            nullable=True
+        ))
+
+    connection = op.get_bind()
+    course = sa.table(
+        'course',
+        sa.column('id', sa.String), sa.column('created_date', sa.Date), sa.column('schedule', sa.String),
+        sa.column('schedule_weekdays', sa.SmallInteger), sa.column('schedule_start', sa.Time), sa.column('schedule_end', sa.Time)
+    )
+    unparsed = []
+    for course_id, created_date, schedule in connection.execute(sa.select(course.c.id, course.c.created_date, course.c.schedule)).all():
+        parsed = parse_schedule(schedule)
+        if parsed is None:
+            unparsed.append(f"{course_id} ({created_date}): {schedule!r}")
+            continue
+
+        weekday_mask, start, end = parsed
+        connection.execute(course.update().where(
+            course.c.id == course_id,
+            course.c.created_date == created_date
+        ).values(schedule_weekdays=weekday_mask, schedule_start=start, schedule_end=end))
+
+    if unparsed:
+        print("Course schedules left unparsed:\n  " + "\n  ".join(unparsed))
+
+
+def downgrade():
+    with op.batch_alter_table('course', schema=None) as batch_op:
+        batch_op.drop_column('session_minutes')
+        batch_op.drop_column('schedule_end')
+        batch_op.drop_column('schedule_start')
+        batch_op.drop_column('schedule_weekdays')
@@ -0,0 +1,51 @@
+"""Add id_sequence, the per-prefix counters behind allocate_ids
+
+Each counter starts from the highest number already used by its table.
+
+Revision ID: 6e1f4b8a2d57
+Revises: d2c8a5f1e736
+Create Date: 2026-10-20 14:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e1f4b8a2d57'
+down_revision = 'd2c8a5f1e736'
+branch_labels = None
+depends_on = None
+
+# Prefix of the IDs handed out for each table
+ID_PREFIXES = {
+    'account': 'ACC',
+    'contract': 'CON',
+    'employee': 'EM',
+    'enrolment': 'ENR',
+    'issue': 'ISS',
+    'leave_request': 'LR',
+    'room': 'ROOM',
+    'staff_checkin': 'CK',
+    'student': 'STU'
+}
+
+
+def upgrade():
+    id_sequence = op.create_table('id_sequence',
+    sa.Column('prefix', sa.String(length=10), nullable=False),
+    sa.Column('last_number', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('prefix')
+    )
+
+    for table_name, prefix in ID_PREFIXES.items():
+        id_column = sa.table(table_name, sa.column('id')).c.id
+        highest = sa.func.coalesce(sa.func.max(sa.cast(sa.func.substr(id_column, len(prefix) + 1), sa.Integer)), 0)
+        op.execute(id_sequence.insert().from_select(
+            ['prefix', 'last_number'],
+            sa.select(sa.literal(prefix), highest).where(id_column.like(f'{prefix}%'))
+        ))
+
+
+def downgrade():
+    op.drop_table('id_sequence')
@@ -0,0 +1,44 @@
+"""Add the mail outbox delivered by flask send-mail
+
+Revision ID: 8d41e6b2a9c3
+Revises: 3f2a9c1d7b84
+Create Date: 2026-10-19 14:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41e6b2a9c3'
+down_revision = '3f2a9c1d7b84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('mail_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('subject', sa.String(length=255), nullable=False),
+    sa.Column('sender', sa.String(length=320), nullable=True),
+    sa.Column('recipients', sa.Text(), nullable=False),
+    sa.Column('body', sa.Text(), nullable=True),
+    sa.Column('html', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=10), server_default=sa.text("'Pending'"), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('last_error', sa.String(length=500), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.CheckConstraint("status IN ('Pending', 'Sent', 'Failed')", name='CHK_mail_outbox_status'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.create_index('IX_mail_outbox_status_next_attempt', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.drop_index('IX_mail_outbox_status_next_attempt')
+
+    op.drop_table('mail_outbox')
@@ -0,0 +1,58 @@
+"""Add per-enrolment and per-class attendance counters
+
+The counters are filled from student_attendance here; attendance writes keep
+them current from then on.
+
+Revision ID: a4d8f2c61e95
+Revises: e3a7c95b1d62
+Create Date: 2026-10-19 18:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d8f2c61e95'
+down_revision = 'e3a7c95b1d62'
+branch_labels = None
+depends_on = None
+
+COUNTS = """
+    SUM(status = 'Present'), SUM(status = 'Absent'), SUM(status = 'Unknown')
+"""
+
+
+def upgrade():
+    op.create_table('enrolment_attendance_count',
+    sa.Column('enrolment_id', sa.String(length=10), nullable=False),
+    sa.Column('present', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('absent', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('unknown', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('enrolment_id')
+    )
+    op.create_table('class_attendance_count',
+    sa.Column('class_id', sa.String(length=10), nullable=False),
+    sa.Column('course_id', sa.String(length=10), nullable=False),
+    sa.Column('course_date', sa.Date(), nullable=False),
+    sa.Column('term', sa.Integer(), nullable=False),
+    sa.Column('present', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('absent', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('unknown', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('class_id', 'course_id', 'course_date', 'term')
+    )
+
+    op.execute(f"""
+        INSERT INTO enrolment_attendance_count (enrolment_id, present, absent, unknown)
+        SELECT enrolment_id, {COUNTS} FROM student_attendance GROUP BY enrolment_id
+    """)
+    op.execute(f"""
+        INSERT INTO class_attendance_count (class_id, course_id, course_date, term, present, absent, unknown)
+        SELECT class_id, course_id, course_date, term, {COUNTS} FROM student_attendance
+        GROUP BY class_id, course_id, course_date, term
+    """)
+
+
+def downgrade():
+    op.drop_table('class_attendance_count')
+    op.drop_table('enrolment_attendance_count')
@@ -0,0 +1,32 @@
+"""Add the table_version counters behind ETags and the response cache
+
+Revision ID: b9e4c27d1f38
+Revises: f1b6d03a9c47
+Create Date: 2026-10-20 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9e4c27d1f38'
+down_revision = 'f1b6d03a9c47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created from an older db/schema.sql already have the table
+    if sa.inspect(op.get_bind()).has_table('table_version'):
+        return
+
+    op.create_table('table_version',
+    sa.Column('table_name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade():
+    op.drop_table('table_version')
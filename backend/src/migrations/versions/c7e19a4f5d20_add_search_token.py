@@ -0,0 +1,39 @@
+"""Add the token index behind /search
+
+Fill it once after upgrading with ``flask rebuild-search-index``; writes
+through the ORM keep it current from then on.
+
+Revision ID: c7e19a4f5d20
+Revises: 8d41e6b2a9c3
+Create Date: 2026-10-19 15:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e19a4f5d20'
+down_revision = '8d41e6b2a9c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('search_token',
+    sa.Column('token', sa.String(length=64), nullable=False),
+    sa.Column('entity_type', sa.String(length=10), nullable=False),
+    sa.Column('entity_key', sa.String(length=30), nullable=False),
+    sa.Column('field', sa.String(length=20), nullable=False),
+    sa.Column('weight', sa.SmallInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('token', 'entity_type', 'entity_key', 'field')
+    )
+    with op.batch_alter_table('search_token', schema=None) as batch_op:
+        batch_op.create_index('IX_search_token_entity', ['entity_type', 'entity_key'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('search_token', schema=None) as batch_op:
+        batch_op.drop_index('IX_search_token_entity')
+
+    op.drop_table('search_token')
@@ -0,0 +1,26 @@
+"""Add an expiry to outbox mail so reset links are not retried past their token
+
+Revision ID: d2c8a5f1e736
+Revises: b9e4c27d1f38
+Create Date: 2026-10-20 11:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2c8a5f1e736'
+down_revision = 'b9e4c27d1f38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('mail_outbox', schema=None) as batch_op:
+        batch_op.drop_column('expires_at')
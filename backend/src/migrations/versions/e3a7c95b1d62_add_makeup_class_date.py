@@ -0,0 +1,35 @@
+"""Add makeup class session times and the room index behind /timetable
+
+Existing makeup classes keep a NULL class_date: they were booked without a
+session time and stay out of the timetable.
+
+Revision ID: e3a7c95b1d62
+Revises: 5b8e2d7c4a16
+Create Date: 2026-10-19 17:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a7c95b1d62'
+down_revision = '5b8e2d7c4a16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('makeup_class', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('class_date', sa.DateTime(), nullable=True))
+
+    with op.batch_alter_table('class', schema=None) as batch_op:
+        batch_op.create_index('IX_class_room_class_date', ['room_id', 'class_date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('class', schema=None) as batch_op:
+        batch_op.drop_index('IX_class_room_class_date')
+
+    with op.batch_alter_table('makeup_class', schema=None) as batch_op:
+        batch_op.drop_column('class_date')
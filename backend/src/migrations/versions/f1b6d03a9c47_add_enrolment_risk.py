@@ -0,0 +1,48 @@
+"""Add the enrolment_risk table written by flask score-at-risk
+
+Revision ID: f1b6d03a9c47
+Revises: a4d8f2c61e95
+Create Date: 2026-10-19 19:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b6d03a9c47'
+down_revision = 'a4d8f2c61e95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('enrolment_risk',
+    sa.Column('enrolment_id', sa.String(length=10), nullable=False),
+    sa.Column('student_id', sa.String(length=10), nullable=False),
+    sa.Column('course_id', sa.String(length=10), nullable=False),
+    sa.Column('course_date', sa.Date(), nullable=False),
+    sa.Column('learning_advisor_id', sa.String(length=10), nullable=False),
+    sa.Column('present', sa.Integer(), nullable=False),
+    sa.Column('absent', sa.Integer(), nullable=False),
+    sa.Column('absence_rate', sa.Double(), nullable=True),
+    sa.Column('graded', sa.Integer(), nullable=False),
+    sa.Column('failing_grades', sa.Integer(), nullable=False),
+    sa.Column('grade_average', sa.Double(), nullable=True),
+    sa.Column('risk_score', sa.SmallInteger(), nullable=False),
+    sa.Column('risk_level', sa.String(length=10), nullable=False),
+    sa.Column('scored_at', sa.DateTime(), nullable=False),
+    sa.CheckConstraint("risk_level IN ('Low', 'Medium', 'High')", name='CHK_enrolment_risk_level'),
+    sa.PrimaryKeyConstraint('enrolment_id')
+    )
+    with op.batch_alter_table('enrolment_risk', schema=None) as batch_op:
+        batch_op.create_index('IX_enrolment_risk_advisor_score', ['learning_advisor_id', 'risk_score'], unique=False)
+        batch_op.create_index('IX_enrolment_risk_score', ['risk_score'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('enrolment_risk', schema=None) as batch_op:
+        batch_op.drop_index('IX_enrolment_risk_score')
+        batch_op.drop_index('IX_enrolment_risk_advisor_score')
+
+    op.drop_table('enrolment_risk')
@@ -0,0 +1,20 @@
+"""Production entrypoint for a pre-fork server.
+
+Run from ``backend/src``:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+``gunicorn.conf.py`` loads this module in the master (``preload_app``), so the
+warm-up in ``preload`` runs once before the workers are forked; each worker
+then opens its own database connections in the ``post_fork`` hook.
+
+Queued mail is not sent by the web workers; run the outbox sender as a
+separate long-lived process from the same directory:
+
+    flask --app application send-mail
+"""
+from application import create_app
+from app.warmup import preload
+
+app = create_app()
+preload(app)